@@ -0,0 +1,199 @@
+"""
+BOT BATCH MODULE
+Vectorized GO-BOT decisions for many independent games at once.
+
+Simulation farms keep thousands of games in flight. Instead of walking each
+GameStateManager object graph through BotAI.make_decision, they encode every
+game's turn state as one integer row and ask for all decisions in a single
+call. The expected-points policy and the ruleset tables are turned once per
+ruleset into dense arrays: stash options per roll key, roll values per dice
+count and carry, and the best stash option per (roll key, carry). A batch is
+then decided with a few gathers; only states off the precomputed grid (a
+risk bonus, carries past the solved cap) evaluate the options on the fly.
+
+Encoded turn state, one int row per game (see encode_turn_state):
+
+    columns 0-5  dice on the table, 0 for an empty slot
+    column 6     dice already in the stash
+    column 7     carried points (stash + stash stash)
+    column 8     1 if the player already stashed from this roll
+
+Decisions follow the HARD bot's expected-points play: stash the option with
+the best value, then roll on while the policy's roll value (plus an optional
+risk bonus) beats banking.
+
+NumPy is only required when this module is used; the game itself does not
+depend on it.
+"""
+
+from typing import Dict, List, Tuple
+
+import numpy as np
+
+from core.game_engine.bot_policy import get_policy, stash_options
+from games.livedice_f.livedice_f_dice_hand import FACE_WEIGHTS, MAX_DICE
+from games.livedice_f.livedice_f_rulesets import get_ruleset
+
+STATE_COLUMNS = 9
+STASHED_COLUMN = 6
+CARRY_COLUMN = 7
+HAS_STASHED_COLUMN = 8
+
+ACTION_END_TURN = 0
+ACTION_STASH = 1
+ACTION_ROLL = 2
+ACTION_BANK = 3
+ACTION_NAMES = ("END_TURN", "STASH", "ROLL", "BANK")
+
+_KEY_SPACE = 1 << 18
+# Weight per die value, index 0 (empty slot) adds nothing
+_WEIGHTS = np.array([0] + [FACE_WEIGHTS[face] for face in range(1, 7)], dtype=np.int64)
+
+
+class _BatchTables:
+    """Dense per-ruleset arrays: table scores, padded stash options and policy roll values"""
+
+    def __init__(self, ruleset: str):
+        compiled = get_ruleset(ruleset)
+        policy = get_policy(compiled.name)
+        self.unit = policy.unit
+        self.max_units = policy.max_units
+        self.roll_values = np.array([np.asarray(values, dtype=np.float64) for values in policy.roll_values])
+
+        self.scores = np.zeros(_KEY_SPACE, dtype=np.int32)
+        options_by_key: Dict[int, list] = {}
+        for key, entry in compiled.table.items():
+            self.scores[key] = entry.score
+            options = stash_options(compiled, entry.counts)
+            if options:
+                options_by_key[key] = options
+
+        width = max(len(options) for options in options_by_key.values())
+        # Row 0 is "no options" (a bust); every other roll key points at its own row
+        self.option_row = np.zeros(_KEY_SPACE, dtype=np.int32)
+        rows = len(options_by_key) + 1
+        self.gain = np.zeros((rows, width), dtype=np.int64)
+        self.size = np.zeros((rows, width), dtype=np.int64)
+        self.rest = np.zeros((rows, width), dtype=np.int64)
+        self.stash_key = np.zeros((rows, width), dtype=np.int64)
+        self.valid = np.zeros((rows, width), dtype=bool)
+        self.dice_count = np.zeros(rows, dtype=np.int64)
+        for row, (key, options) in enumerate(options_by_key.items(), start=1):
+            self.option_row[key] = row
+            self.dice_count[row] = sum(compiled.table[key].counts)
+            for column, (gain, size, rest, stash_key) in enumerate(options):
+                self.gain[row, column] = gain
+                self.size[row, column] = size
+                self.rest[row, column] = rest
+                self.stash_key[row, column] = stash_key
+                self.valid[row, column] = True
+
+        # Best option for every roll at every carry on the grid (the roll key
+        # fixes how many dice are stashed: 6 minus the dice rolled)
+        grid_rows = np.repeat(np.arange(rows), self.max_units + 1)
+        grid_carry = np.tile(np.arange(self.max_units + 1) * self.unit, rows)
+        best = self.best_options(grid_rows, MAX_DICE - self.dice_count[grid_rows], grid_carry, np.zeros(len(grid_rows)))
+        self.best_option = best.reshape(rows, self.max_units + 1).astype(np.int8)
+
+    def best_options(self, rows: np.ndarray, stashed: np.ndarray, carry: np.ndarray, bonus: np.ndarray) -> np.ndarray:
+        """Index of the best stash option per state, evaluating every option"""
+        dice_left = MAX_DICE - stashed[:, None] - self.size[rows]
+        new_carry = carry[:, None] + self.gain[rows]
+        roll_on = self.roll_value(dice_left, new_carry) + bonus[:, None]
+        bank = new_carry + self.rest[rows]
+        values = np.where(dice_left > 0, np.maximum(roll_on, bank), roll_on)
+        values = np.where(self.valid[rows], values, -np.inf)
+        return values.argmax(axis=1)
+
+    def roll_value(self, dice_count: np.ndarray, carry: np.ndarray) -> np.ndarray:
+        """Vectorized PolicyTable.roll_value"""
+        dice_count = np.where(dice_count <= 0, MAX_DICE, dice_count)
+        units = carry / self.unit
+        low = np.minimum(units.astype(np.int64), self.max_units)
+        high = np.minimum(low + 1, self.max_units)
+        values = self.roll_values[dice_count, low]
+        values = values + (self.roll_values[dice_count, high] - values) * (units - low)
+        beyond = units > self.max_units
+        return np.where(beyond, self.roll_values[dice_count, self.max_units] * units / self.max_units, values)
+
+
+_tables: Dict[str, _BatchTables] = {}
+
+
+def _get_tables(ruleset: str) -> _BatchTables:
+    name = get_ruleset(ruleset).name
+    if name not in _tables:
+        _tables[name] = _BatchTables(name)
+    return _tables[name]
+
+
+def encode_turn_state(game_state) -> List[int]:
+    """Encoded row for the current player's turn in a GameStateManager"""
+    player = game_state.current_player
+    dice = list(game_state.dice_values)[:MAX_DICE]
+    return dice + [0] * (MAX_DICE - len(dice)) + [
+        len(player.stashed_dice),
+        player.get_stash_score() + player.stash_stash,
+        1 if player.stashed_dice_this_roll else 0,
+    ]
+
+
+def decide_batch(states, ruleset: str = "STANDARD", risk_bonus=0.0) -> Tuple[np.ndarray, np.ndarray]:
+    """
+    Decide many turns at once.
+
+    Args:
+        states: Integer array-like of shape (N, 9), see the module docstring
+        ruleset: Game ruleset - "SIMPLE", "STANDARD", or "ADVANCED"
+        risk_bonus: Points added to roll-on values, scalar or one per state
+
+    Returns:
+        Tuple (actions, stash_masks): actions is an (N,) int8 array of
+        ACTION_* codes and stash_masks an (N, 6) bool array marking the dice
+        to stash for ACTION_STASH rows (all False otherwise)
+    """
+    states = np.asarray(states, dtype=np.int64)
+    if states.ndim != 2 or states.shape[1] != STATE_COLUMNS:
+        raise ValueError(f"Expected an (N, {STATE_COLUMNS}) array of encoded turn states, got shape {states.shape}")
+    dice = states[:, :MAX_DICE]
+    if dice.size and (dice.min() < 0 or dice.max() > 6):
+        raise ValueError("Dice values must be between 1 and 6 (0 for an empty slot)")
+    tables = _get_tables(ruleset)
+    count = len(states)
+    stashed = states[:, STASHED_COLUMN]
+    carry = states[:, CARRY_COLUMN]
+    has_stashed = states[:, HAS_STASHED_COLUMN] != 0
+    bonus = np.broadcast_to(np.asarray(risk_bonus, dtype=np.float64), (count,))
+
+    keys = _WEIGHTS[dice].sum(axis=1)
+    rows = tables.option_row[keys]
+    units, off_grid = np.divmod(carry, tables.unit)
+
+    # Stash decision: one gather for states on the grid, option scan for the rest
+    must_stash = ~has_stashed & (rows > 0)
+    best = np.zeros(count, dtype=np.int64)
+    on_grid = (must_stash & (off_grid == 0) & (units <= tables.max_units) & (bonus == 0)
+               & (stashed + tables.dice_count[rows] == MAX_DICE))
+    best[on_grid] = tables.best_option[rows[on_grid], units[on_grid]]
+    scan = must_stash & ~on_grid
+    if scan.any():
+        best[scan] = tables.best_options(rows[scan], stashed[scan], carry[scan], bonus[scan])
+    best_key = tables.stash_key[rows, best]
+
+    # Dice to stash: per face, the first dice showing it (the way the bot picks indices)
+    take = (best_key[:, None] >> (3 * np.clip(dice - 1, 0, 5))) & 0b111
+    rank = np.zeros(dice.shape, dtype=np.int64)
+    for column in range(1, MAX_DICE):
+        rank[:, column] = (dice[:, :column] == dice[:, column:column + 1]).sum(axis=1)
+    stash_masks = must_stash[:, None] & (dice > 0) & (rank < take)
+
+    # Roll/bank decision after stashing from this roll
+    roll_value = tables.roll_value(MAX_DICE - stashed, carry) + bonus
+    banked = carry + tables.scores[keys]
+    roll = (roll_value > banked) | (stashed >= MAX_DICE)
+
+    actions = np.full(count, ACTION_END_TURN, dtype=np.int8)
+    actions[must_stash] = ACTION_STASH
+    actions[has_stashed & roll] = ACTION_ROLL
+    actions[has_stashed & ~roll] = ACTION_BANK
+    return actions, stash_masks
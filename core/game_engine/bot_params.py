@@ -0,0 +1,104 @@
+"""
+BOT PARAMS MODULE
+Tunable roll/bank thresholds of the heuristic GO-BOTs.
+
+EASY and NORMAL bots decide between rolling on and banking with the
+conservative / balanced / aggressive heuristics in go_bot_ai. Their bank
+thresholds and roll chances are parameters: PARAMETER_SPACE lists every one
+with its original hand-picked default and the range the tuner searches.
+
+Tuned values live in policies/bot_params.json, one entry per difficulty,
+written by bot_tuner and read once per process when the first bot needs
+them. A difficulty missing from the file (or a missing file) plays the
+defaults. Regenerate with:
+
+    python -m core.game_engine.bot_tuner [--difficulty EASY --target 0.25]
+"""
+
+import json
+import os
+from typing import Dict, Optional
+
+PARAMS_VERSION = 1
+PARAMS_PATH = os.path.join(os.path.dirname(os.path.abspath(__file__)), "policies", "bot_params.json")
+
+# Difficulties that play the heuristics (HARD plays the solved tables)
+TUNED_DIFFICULTIES = ("EASY", "NORMAL")
+
+# name: (default, low, high); integer defaults are point thresholds, floats are chances
+PARAMETER_SPACE = {
+    "close_race_margin": (500, 0, 1500),
+    "conservative_bank_points": (600, 150, 1500),
+    "conservative_low_points": (400, 0, 1000),
+    "conservative_max_bust_risk": (0.5, 0.0, 1.0),
+    "conservative_roll_chance": (0.4, 0.0, 1.0),
+    "balanced_push_points": (500, 150, 1500),
+    "balanced_max_bust_risk": (0.6, 0.0, 1.0),
+    "balanced_push_chance": (0.5, 0.0, 1.0),
+    "balanced_low_points": (350, 0, 1000),
+    "balanced_low_roll_chance": (0.7, 0.0, 1.0),
+    "balanced_high_roll_chance": (0.4, 0.0, 1.0),
+    "aggressive_bank_points": (700, 150, 2000),
+    "aggressive_two_dice_points": (400, 0, 1500),
+    "aggressive_two_dice_chance": (0.6, 0.0, 1.0),
+    "aggressive_desperate_points": (300, 0, 1000),
+    "aggressive_desperate_deficit": (1000, 0, 4000),
+    "aggressive_desperate_chance": (0.3, 0.0, 1.0),
+}
+
+DEFAULT_PARAMS = {name: default for name, (default, _, _) in PARAMETER_SPACE.items()}
+
+
+def clip_params(params: dict) -> dict:
+    """Complete params with defaults, clamp every value to its range and round point thresholds"""
+    clipped = {}
+    for name, (default, low, high) in PARAMETER_SPACE.items():
+        value = min(max(params.get(name, default), low), high)
+        clipped[name] = int(round(value)) if isinstance(default, int) else round(float(value), 4)
+    return clipped
+
+
+def load_bot_params(path: str = PARAMS_PATH) -> Dict[str, dict]:
+    """
+    Tuned entries of a parameter file.
+
+    Returns:
+        {difficulty: entry} where entry holds "params" (complete and clamped)
+        plus the tuning metadata; empty if the file is missing, unreadable
+        or of another version
+    """
+    try:
+        with open(path, "r", encoding="utf-8") as handle:
+            data = json.load(handle)
+    except (OSError, ValueError):
+        return {}
+    if data.get("version") != PARAMS_VERSION:
+        return {}
+    entries = {}
+    for difficulty, entry in data.get("difficulties", {}).items():
+        entries[difficulty] = dict(entry, params=clip_params(entry.get("params", {})))
+    return entries
+
+
+def save_bot_params(entries: Dict[str, dict], path: str = PARAMS_PATH) -> str:
+    """Write {difficulty: entry} to a parameter file, replacing it atomically"""
+    data = {"version": PARAMS_VERSION, "difficulties": entries}
+    os.makedirs(os.path.dirname(os.path.abspath(path)), exist_ok=True)
+    temporary = f"{path}.tmp{os.getpid()}"
+    with open(temporary, "w", encoding="utf-8") as handle:
+        json.dump(data, handle, indent=2, sort_keys=True)
+        handle.write("\n")
+    os.replace(temporary, path)
+    return path
+
+
+_entries: Optional[Dict[str, dict]] = None
+
+
+def get_bot_params(difficulty: str) -> dict:
+    """Parameters a difficulty plays with: tuned values if present, defaults otherwise"""
+    global _entries
+    if _entries is None:
+        _entries = load_bot_params()
+    entry = _entries.get(difficulty.upper())
+    return dict(entry["params"]) if entry else dict(DEFAULT_PARAMS)
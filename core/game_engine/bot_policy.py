@@ -0,0 +1,340 @@
+"""
+BOT POLICY MODULE
+Expected-points-maximizing turn policy for the HARD GO-BOT.
+
+A turn is a Markov decision process over (dice in the cup, carried points):
+roll the cup, stash any fully-scoring subset of the roll, then bank (stash +
+stash stash + whatever still scores on the table) or roll the dice left.
+Filling the stash forces the STASHSTASH move and a reroll of all six dice.
+Every stash adds points, so the value of rolling at a given carry only
+depends on larger carries, and one backward sweep over the carry (in units
+of the ruleset's point granularity) solves the whole turn exactly up to a
+cap, beyond which values are extrapolated.
+
+The result is a PolicyTable of roll values, one array per dice count. The bot
+compares the roll value against the bank total in one lookup. Tables are
+cached per ruleset, stored as memory-mapped binary files (policy_store)
+under core/game_engine/policies and regenerated with:
+
+    python -m core.game_engine.bot_policy [--ruleset NAME] [--max-points N]
+"""
+
+import argparse
+import hashlib
+import json
+import os
+import time
+from array import array
+from functools import reduce
+from itertools import product
+from math import gcd
+from typing import Dict, List, Optional, Tuple
+
+from core.game_engine.policy_store import StoreError, open_store, write_store
+from games.livedice_f.livedice_f_dice_hand import MAX_DICE, DiceHand, pack_counts
+from games.livedice_f.livedice_f_odds import multiset_outcomes
+from games.livedice_f.livedice_f_rulesets import RULESETS, CompiledRuleset, get_ruleset
+
+POLICY_VERSION = 1
+POLICY_DIR = os.path.join(os.path.dirname(os.path.abspath(__file__)), "policies")
+DEFAULT_MAX_POINTS = 20000
+
+# One way to stash from a roll: (points gained, dice used, table points left
+# after the stash, packed key of the stashed dice)
+StashOption = Tuple[int, int, int, int]
+
+
+def point_unit(ruleset: CompiledRuleset) -> int:
+    """Largest point step every combination is a multiple of (50 for the built-in rulesets)"""
+    points = [value for combination in ruleset.definition["combinations"] for value in combination["points"].values()]
+    return reduce(gcd, points) or 1
+
+
+def ruleset_fingerprint(ruleset: CompiledRuleset) -> str:
+    """Hash of the ruleset definition, used to detect stale policy files"""
+    encoded = json.dumps(ruleset.definition, sort_keys=True).encode("utf-8")
+    return hashlib.sha1(encoded).hexdigest()
+
+
+def stash_options(ruleset: CompiledRuleset, counts: Tuple[int, ...], prune: bool = True) -> List[StashOption]:
+    """
+    Every legal stash from a roll, with dominated choices removed.
+
+    A stash is legal when the stash solver uses all of its dice (anything else
+    would stay on the table anyway). Among stashes of the same size, one is
+    dropped when another gains at least as much both when rolling on and when
+    banking; prune=False keeps every legal stash.
+    """
+    roll_key = pack_counts(counts)
+    best_by_size: Dict[int, List[StashOption]] = {}
+    for stash_counts in product(*(range(count + 1) for count in counts)):
+        size = sum(stash_counts)
+        if size == 0:
+            continue
+        stash_key = pack_counts(stash_counts)
+        partition = ruleset.partitions[stash_key]
+        if partition.dice_used != size or partition.score <= 0:
+            continue
+        rest = ruleset.table[roll_key - stash_key].score
+        option = (partition.score, size, rest, stash_key)
+        if not prune:
+            best_by_size.setdefault(size, []).append(option)
+            continue
+        kept = []
+        dominated = False
+        for other in best_by_size.get(size, []):
+            if other[0] >= option[0] and other[0] + other[2] >= option[0] + option[2]:
+                dominated = True
+                break
+            if not (option[0] >= other[0] and option[0] + option[2] >= other[0] + other[2]):
+                kept.append(other)
+        if not dominated:
+            kept.append(option)
+            best_by_size[size] = kept
+    return [option for size in sorted(best_by_size) for option in best_by_size[size]]
+
+
+def roll_outcome_groups(ruleset: CompiledRuleset, unit: int) -> List[List[Tuple[float, Tuple[Tuple[int, int, int], ...]]]]:
+    """
+    Non-bust roll outcomes per dice count, grouped by their stash options.
+
+    Outcomes with identical options contribute identically to any turn
+    evaluation, so solvers only visit each group once.
+
+    Returns:
+        List indexed by dice count of (probability, options) pairs, each option
+        being (points gained, dice left in the cup, table points left) in units
+    """
+    outcome_groups: List[List[Tuple[float, Tuple[Tuple[int, int, int], ...]]]] = [[]]
+    for dice_count in range(1, MAX_DICE + 1):
+        groups: Dict[Tuple[Tuple[int, int, int], ...], float] = {}
+        total = 6 ** dice_count
+        for counts, ways in multiset_outcomes(dice_count):
+            options = tuple(sorted(
+                (gain // unit, dice_count - size, rest // unit)
+                for gain, size, rest, _ in stash_options(ruleset, counts)
+            ))
+            if options:
+                groups[options] = groups.get(options, 0.0) + ways / total
+        outcome_groups.append([(probability, options) for options, probability in groups.items()])
+    return outcome_groups
+
+
+class PolicyTable:
+    """Roll values per (dice in cup, carried points) for one ruleset"""
+
+    __slots__ = ("ruleset", "fingerprint", "unit", "max_units", "roll_values", "_options")
+
+    def __init__(self, ruleset: str, fingerprint: str, unit: int, max_units: int, roll_values: List[array]):
+        self.ruleset = ruleset
+        self.fingerprint = fingerprint
+        self.unit = unit
+        self.max_units = max_units
+        # roll_values[n][u]: expected turn points when rolling n dice carrying u * unit points
+        # (index 0 is unused: an empty cup means a full stash, which rerolls all six)
+        self.roll_values = roll_values
+        self._options: Dict[int, List[StashOption]] = {}
+
+    def roll_value(self, dice_count: int, carry_points: int) -> float:
+        """Expected points banked this turn when rolling dice_count dice while carrying carry_points"""
+        if dice_count <= 0:
+            dice_count = MAX_DICE
+        values = self.roll_values[dice_count]
+        units = carry_points / self.unit
+        if units <= self.max_units:
+            low = int(units)
+            if low == units:
+                return values[low]
+            # Carries between grid points only happen with house rules; interpolate
+            return values[low] + (values[low + 1] - values[low]) * (units - low)
+        # Past the cap the value grows like the carry times the survival ratio at the cap
+        return values[self.max_units] * units / self.max_units
+
+    def should_roll(self, dice_count: int, carry_points: int, bank_points: int, risk_bonus: float = 0.0) -> bool:
+        """True when rolling on (plus risk_bonus points of appetite) beats banking bank_points now"""
+        return self.roll_value(dice_count, carry_points) + risk_bonus > bank_points
+
+    def choose_stash(self, dice_values, stashed_count: int, carry_points: int,
+                     risk_bonus: float = 0.0) -> Tuple[List[int], bool, float]:
+        """
+        Best stash for a roll and what to do after it.
+
+        Args:
+            dice_values: Dice on the table (list or DiceHand)
+            stashed_count: Dice already in the stash before this roll
+            carry_points: Stash plus stash stash points before this roll
+            risk_bonus: Points added to every roll-on value (positive = bolder)
+
+        Returns:
+            Tuple (indices to stash, roll_after, expected value); roll_after is
+            also True when the stash fills up and the reroll is forced.
+            Indices are empty when nothing can be stashed.
+        """
+        hand = DiceHand.of(dice_values)
+        options = self._options.get(hand.key)
+        if options is None:
+            options = self._options[hand.key] = stash_options(get_ruleset(self.ruleset), hand.counts)
+        best_value, best_option, best_roll = -1.0, None, False
+        for gain, size, rest, stash_key in options:
+            carry = carry_points + gain
+            dice_left = MAX_DICE - stashed_count - size
+            if dice_left <= 0:
+                value, roll_after = self.roll_value(MAX_DICE, carry) + risk_bonus, True
+            else:
+                roll = self.roll_value(dice_left, carry) + risk_bonus
+                bank = carry + rest
+                value, roll_after = (roll, True) if roll > bank else (bank, False)
+            if value > best_value:
+                best_value, best_option, best_roll = value, stash_key, roll_after
+        if best_option is None:
+            return [], False, 0.0
+        indices = []
+        for face_index in range(6):
+            take = (best_option >> (3 * face_index)) & 0b111
+            indices.extend(hand.face_indices[face_index][:take])
+        indices.sort()
+        return indices, best_roll, best_value
+
+    def __repr__(self):
+        return f"PolicyTable(ruleset={self.ruleset!r}, unit={self.unit}, max_points={self.max_units * self.unit})"
+
+
+# ============================================================================
+# SOLVER
+# ============================================================================
+
+def solve_policy(ruleset: str = "STANDARD", max_points: int = DEFAULT_MAX_POINTS) -> PolicyTable:
+    """
+    Solve the expected-points turn policy for a ruleset.
+
+    Args:
+        ruleset: Ruleset name
+        max_points: Carry up to which values are solved exactly
+
+    Returns:
+        PolicyTable for the ruleset
+    """
+    compiled = get_ruleset(ruleset)
+    unit = point_unit(compiled)
+    max_units = max(1, max_points // unit)
+    outcome_groups = roll_outcome_groups(compiled, unit)
+
+    values = [array("d", [0.0]) * (max_units + 1) for _ in range(MAX_DICE + 1)]
+    # Beyond the cap, value ~ carry * ratio[n]; the ratios are refined at the top of the grid
+    ratios = [1.0] * (MAX_DICE + 1)
+
+    def value_at(dice_count: int, units: int) -> float:
+        if units <= max_units:
+            return values[dice_count][units]
+        return ratios[dice_count] * units
+
+    def evaluate(dice_count: int, units: int) -> float:
+        expected = 0.0
+        for probability, options in outcome_groups[dice_count]:
+            best = 0.0
+            for gain, dice_left, rest in options:
+                carry = units + gain
+                if dice_left == 0:
+                    value = value_at(MAX_DICE, carry)
+                else:
+                    value = value_at(dice_left, carry)
+                    if carry + rest > value:
+                        value = carry + rest
+                if value > best:
+                    best = value
+            expected += probability * best
+        return expected
+
+    for _ in range(30):
+        for dice_count in range(1, MAX_DICE + 1):
+            values[dice_count][max_units] = evaluate(dice_count, max_units)
+            ratios[dice_count] = values[dice_count][max_units] / max_units
+
+    for units in range(max_units - 1, -1, -1):
+        for dice_count in range(1, MAX_DICE + 1):
+            values[dice_count][units] = evaluate(dice_count, units)
+
+    # Stored in points rather than units
+    roll_values = [array("d", (value * unit for value in dice_values)) for dice_values in values]
+    return PolicyTable(compiled.name, ruleset_fingerprint(compiled), unit, max_units, roll_values)
+
+
+# ============================================================================
+# STORAGE
+# ============================================================================
+
+_policies: Dict[str, PolicyTable] = {}
+
+
+def policy_path(ruleset: str, directory: Optional[str] = None) -> str:
+    return os.path.join(directory or POLICY_DIR, f"{ruleset.lower()}.bin")
+
+
+def save_policy(policy: PolicyTable, directory: Optional[str] = None) -> str:
+    """Write a policy table to its binary store file and return the path"""
+    metadata = {
+        "kind": "policy",
+        "version": POLICY_VERSION,
+        "ruleset": policy.ruleset,
+        "fingerprint": policy.fingerprint,
+        "unit": policy.unit,
+        "max_units": policy.max_units,
+    }
+    # All dice counts in one row-major section (row 0 is the unused empty-cup row)
+    roll_values = array("d")
+    for values in policy.roll_values:
+        roll_values.extend(values)
+    return write_store(policy_path(policy.ruleset, directory), metadata, {"roll_values": roll_values})
+
+
+def load_policy(ruleset: str, directory: Optional[str] = None) -> Optional[PolicyTable]:
+    """
+    Memory-mapped policy table, or None if it is missing or does not match the current rules.
+
+    Nothing is read beyond the header until the bot looks values up.
+    """
+    compiled = get_ruleset(ruleset)
+    try:
+        metadata, sections = open_store(policy_path(compiled.name, directory),
+                                        ("kind", "version", "fingerprint", "unit", "max_units"), ("roll_values",))
+    except StoreError:
+        return None
+    if (metadata["kind"] != "policy" or metadata["version"] != POLICY_VERSION
+            or metadata["fingerprint"] != ruleset_fingerprint(compiled)):
+        return None
+    unit, max_units, flat = metadata["unit"], metadata["max_units"], sections["roll_values"]
+    if (not isinstance(unit, int) or not isinstance(max_units, int) or unit <= 0 or max_units < 0
+            or flat.format != "d" or len(flat) != (MAX_DICE + 1) * (max_units + 1)):
+        return None
+    width = max_units + 1
+    roll_values = [flat[row * width:(row + 1) * width] for row in range(MAX_DICE + 1)]
+    return PolicyTable(compiled.name, metadata["fingerprint"], unit, max_units, roll_values)
+
+
+def get_policy(ruleset: str = "STANDARD") -> PolicyTable:
+    """Policy table for a ruleset: cached, else loaded from disk, else solved"""
+    name = get_ruleset(ruleset).name
+    policy = _policies.get(name)
+    if policy is None:
+        policy = load_policy(name) or solve_policy(name)
+        _policies[name] = policy
+    return policy
+
+
+def main(argv=None):
+    parser = argparse.ArgumentParser(description="Regenerate GO-BOT policy tables")
+    parser.add_argument("--ruleset", action="append", help="Ruleset to solve (repeatable, default: all)")
+    parser.add_argument("--max-points", type=int, default=DEFAULT_MAX_POINTS, help="Carry solved exactly")
+    parser.add_argument("--output", default=POLICY_DIR, help="Directory for the policy files")
+    args = parser.parse_args(argv)
+
+    for ruleset in args.ruleset or RULESETS:
+        started = time.perf_counter()
+        policy = solve_policy(ruleset, args.max_points)
+        path = save_policy(policy, args.output)
+        print(f"{policy.ruleset}: roll value with 6 dice = {policy.roll_value(6, 0):.1f} points, "
+              f"written to {path} in {time.perf_counter() - started:.1f}s")
+
+
+if __name__ == "__main__":
+    main()
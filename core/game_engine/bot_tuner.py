@@ -0,0 +1,237 @@
+"""
+BOT TUNER MODULE
+Self-play tuner for the heuristic GO-BOT parameters (see bot_params).
+
+Each difficulty is tuned to hit a target win rate against a reference bot
+(the HARD bot by default) in heads-up games played without a window. The
+search is successive halving:
+
+1. Sample candidates around the current parameters (the first candidate is
+   the current set itself, so tuning never does worse than what shipped).
+2. Play every candidate the same games: seeds are shared and seats alternate
+   with the seed, so candidates are compared on identical dice.
+3. Keep the 1/eta candidates closest to the target, play eta times as many
+   games, and repeat until eta candidates or fewer are left; the closest of
+   those wins.
+
+Games are spread over a ProcessPoolExecutor in chunks; a rung only plays
+the seeds its survivors have not played yet. The winners are written to
+policies/bot_params.json, which every bot loads at startup:
+
+    python -m core.game_engine.bot_tuner --difficulty EASY --target 0.25
+"""
+
+import argparse
+import os
+import time
+from concurrent.futures import ProcessPoolExecutor
+from typing import Dict, List, Optional, Sequence, Tuple
+
+from core.game_engine import bot_turn
+from core.game_engine.bot_params import (DEFAULT_PARAMS, PARAMETER_SPACE, PARAMS_PATH, TUNED_DIFFICULTIES,
+                                         clip_params, get_bot_params, load_bot_params, save_bot_params)
+from core.game_engine.dice_rng import DiceRNG
+from core.game_engine.go_bot_ai import BotAI
+from core.game_state.game_state import GameStateManager
+
+# Win rate against the HARD bot each difficulty should land on
+DEFAULT_TARGETS = {"EASY": 0.25, "NORMAL": 0.40}
+DEFAULT_CANDIDATES = 27
+DEFAULT_MIN_GAMES = 100
+DEFAULT_ETA = 3
+# Candidates are drawn within this share of each parameter's range around the center
+DEFAULT_SPREAD = 0.25
+CHUNK_GAMES = 20
+
+
+# ============================================================================
+# HEADLESS GAMES
+# ============================================================================
+
+def play_game(seed: int, difficulty: str, params: dict, reference: str = "HARD",
+              ruleset: str = "STANDARD", endgoal: int = 4000) -> float:
+    """
+    Heads-up game of a parameterized bot against a reference bot, without a UI.
+
+    The tuned bot moves first on even seeds and second on odd ones.
+
+    Returns:
+        1.0 if the tuned bot wins, 0.5 for a tie, 0.0 if it loses
+    """
+    game = GameStateManager(None, 0, 2, endgoal=endgoal, ruleset=ruleset, bot_difficulty=difficulty, seed=seed)
+    tuned_seat = seed % 2
+    bots = [BotAI(game, difficulty=reference), BotAI(game, difficulty=reference)]
+    bots[tuned_seat] = BotAI(game, difficulty=difficulty, params=params)
+    bot_turn.play_game(game, bots)
+
+    tuned_score = game.players[tuned_seat].get_total_score()
+    reference_score = game.players[1 - tuned_seat].get_total_score()
+    if tuned_score == reference_score:
+        return 0.5
+    return 1.0 if tuned_score > reference_score else 0.0
+
+
+def _play_chunk(index: int, seeds: Sequence[int], difficulty: str, params: dict, reference: str,
+                ruleset: str, endgoal: int) -> Tuple[int, float]:
+    return index, sum(play_game(seed, difficulty, params, reference, ruleset, endgoal) for seed in seeds)
+
+
+# ============================================================================
+# SUCCESSIVE HALVING
+# ============================================================================
+
+class Candidate:
+    """A parameter set and the games it has played so far"""
+
+    __slots__ = ("params", "games", "wins")
+
+    def __init__(self, params: dict):
+        self.params = params
+        self.games = 0
+        self.wins = 0.0
+
+    @property
+    def win_rate(self) -> float:
+        return self.wins / self.games if self.games else 0.0
+
+    def error(self, target: float) -> float:
+        return abs(self.win_rate - target)
+
+    def __repr__(self):
+        return f"Candidate(win_rate={self.win_rate:.3f}, games={self.games})"
+
+
+def sample_candidates(center: dict, count: int, rng: DiceRNG, spread: float = DEFAULT_SPREAD) -> List[dict]:
+    """center itself plus count - 1 parameter sets drawn uniformly around it"""
+    candidates = [clip_params(center)]
+    while len(candidates) < count:
+        params = {}
+        for name, (default, low, high) in PARAMETER_SPACE.items():
+            reach = spread * (high - low)
+            value = center.get(name, default)
+            params[name] = rng.uniform(value - reach, value + reach)
+        candidates.append(clip_params(params))
+    return candidates
+
+
+class BotTuner:
+    """Successive-halving search for parameters that hit a target win rate"""
+
+    def __init__(self, difficulty: str, target: float, reference: str = "HARD", ruleset: str = "STANDARD",
+                 endgoal: int = 4000, workers: Optional[int] = None, seed: Optional[int] = None):
+        """
+        Args:
+            difficulty: Difficulty to tune (EASY or NORMAL)
+            target: Win rate against the reference bot to aim for
+            reference: Difficulty of the reference bot
+            ruleset: Game ruleset - "SIMPLE", "STANDARD", or "ADVANCED"
+            endgoal: Points needed to win a tuning game
+            workers: Worker processes (default: all cores); 0 plays games in this process
+            seed: Seed for candidate sampling and the game seeds
+        """
+        self.difficulty = difficulty.upper()
+        self.target = target
+        self.reference = reference.upper()
+        self.ruleset = ruleset
+        self.endgoal = endgoal
+        self.workers = (os.cpu_count() or 1) if workers is None else workers
+        self.rng = DiceRNG(seed, f"tuner/{self.difficulty}")
+        # Game seeds come from the tuner seed so every rung of every run is reproducible
+        self.seed_base = int(self.rng.random() * 2 ** 31)
+
+    def _play(self, executor: Optional[ProcessPoolExecutor], candidates: List[Candidate], games: int):
+        """Play every candidate up to `games` games on the shared seeds"""
+        tasks = []
+        for index, candidate in enumerate(candidates):
+            seeds = range(self.seed_base + candidate.games, self.seed_base + games)
+            for start in range(0, len(seeds), CHUNK_GAMES):
+                tasks.append((index, seeds[start:start + CHUNK_GAMES], self.difficulty, candidate.params,
+                              self.reference, self.ruleset, self.endgoal))
+        if executor is None:
+            results = [_play_chunk(*task) for task in tasks]
+        else:
+            results = executor.map(_play_chunk, *zip(*tasks)) if tasks else []
+        for index, wins in results:
+            candidates[index].wins += wins
+        for candidate in candidates:
+            candidate.games = max(candidate.games, games)
+
+    def tune(self, candidates: int = DEFAULT_CANDIDATES, min_games: int = DEFAULT_MIN_GAMES,
+             eta: int = DEFAULT_ETA, center: Optional[dict] = None, verbose: bool = True) -> Candidate:
+        """
+        Run successive halving and return the surviving candidate.
+
+        Args:
+            candidates: Parameter sets in the first rung
+            min_games: Games per candidate in the first rung
+            eta: Reduction factor: 1/eta of the candidates survive a rung,
+                with eta times as many games
+            center: Parameters to sample around (default: the current ones)
+        """
+        center = get_bot_params(self.difficulty) if center is None else center
+        pool = [Candidate(params) for params in sample_candidates(center, candidates, self.rng)]
+        executor = ProcessPoolExecutor(max_workers=self.workers) if self.workers > 0 else None
+        try:
+            games, rung = min_games, 0
+            while True:
+                started = time.perf_counter()
+                self._play(executor, pool, games)
+                pool.sort(key=lambda candidate: candidate.error(self.target))
+                if verbose:
+                    print(f"{self.difficulty} rung {rung}: {len(pool)} candidates x {games} games, "
+                          f"best {pool[0].win_rate:.3f} (target {self.target:.2f}) "
+                          f"in {time.perf_counter() - started:.1f}s")
+                # The last eta candidates are told apart on the largest sample
+                if len(pool) <= eta:
+                    break
+                pool = pool[:max(1, len(pool) // eta)]
+                games *= eta
+                rung += 1
+        finally:
+            if executor is not None:
+                executor.shutdown()
+        return pool[0]
+
+
+# ============================================================================
+# MAIN
+# ============================================================================
+
+def main(argv=None):
+    parser = argparse.ArgumentParser(description="Tune heuristic GO-BOT parameters by self-play")
+    parser.add_argument("--difficulty", action="append", choices=TUNED_DIFFICULTIES,
+                        help="Difficulty to tune (repeatable, default: all)")
+    parser.add_argument("--target", type=float, help="Target win rate against the reference bot")
+    parser.add_argument("--reference", default="HARD", help="Difficulty of the reference bot")
+    parser.add_argument("--ruleset", default="STANDARD", help="Ruleset of the tuning games")
+    parser.add_argument("--endgoal", type=int, default=4000, help="Endgoal of the tuning games")
+    parser.add_argument("--candidates", type=int, default=DEFAULT_CANDIDATES, help="Candidates in the first rung")
+    parser.add_argument("--min-games", type=int, default=DEFAULT_MIN_GAMES, help="Games per candidate in the first rung")
+    parser.add_argument("--eta", type=int, default=DEFAULT_ETA, help="Successive halving reduction factor")
+    parser.add_argument("--from-defaults", action="store_true", help="Sample around the hand-picked defaults")
+    parser.add_argument("--workers", type=int, help="Worker processes (default: all cores, 0 = no pool)")
+    parser.add_argument("--seed", type=int, default=0, help="Tuner seed")
+    parser.add_argument("--output", default=PARAMS_PATH, help="Parameter file to update")
+    args = parser.parse_args(argv)
+
+    entries: Dict[str, dict] = load_bot_params(args.output)
+    for difficulty in args.difficulty or TUNED_DIFFICULTIES:
+        target = DEFAULT_TARGETS[difficulty] if args.target is None else args.target
+        tuner = BotTuner(difficulty, target, args.reference, args.ruleset, args.endgoal, args.workers, args.seed)
+        center = DEFAULT_PARAMS if args.from_defaults else entries.get(difficulty, {}).get("params", DEFAULT_PARAMS)
+        best = tuner.tune(args.candidates, args.min_games, args.eta, center=center)
+        entries[difficulty] = {
+            "params": best.params,
+            "target_win_rate": target,
+            "win_rate": round(best.win_rate, 4),
+            "games": best.games,
+            "reference": tuner.reference,
+            "ruleset": args.ruleset,
+            "endgoal": args.endgoal,
+        }
+        save_bot_params(entries, args.output)
+        print(f"{difficulty}: win rate {best.win_rate:.3f} over {best.games} games -> {args.output}")
+
+
+if __name__ == "__main__":
+    main()
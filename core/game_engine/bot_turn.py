@@ -0,0 +1,163 @@
+"""
+BOT TURN MODULE
+Headless GO-BOT turns and whole games, without any UI.
+
+play_bot_turn runs the decision loop of one bot turn directly against a
+GameStateManager: ask the bot for a decision, check it against the
+referee's legal actions, perform it, repeat until the turn is over. Front
+ends follow along through the GameObserver bot hooks (the pygame UI paces
+and narrates the turn from them); without observers a turn is just engine
+calls. BotTurn is the same loop split into steps, for front ends that
+pace the turn from their own main loop.
+
+play_game plays a full game between bots, e.g. for simulations:
+
+    game = GameStateManager(None, 0, 2, bot_difficulty="HARD", seed=7)
+    winner = play_game(game, [BotAI(game), BotAI(game, difficulty="EASY")])
+"""
+
+from typing import Optional, Sequence
+
+# Safety limit against a bot that never ends its turn
+MAX_BOT_DECISIONS = 50
+# Safety limit against a game that never ends (every turn a bust)
+MAX_GAME_TURNS = 10000
+
+
+class BotTurn:
+    """
+    One bot turn played a step at a time.
+
+    Each step() either makes the bot's next decision or performs the decision
+    made in the step before, and notifies the same GameObserver bot hooks as
+    play_bot_turn. A front end can run one step per frame and pace the turn
+    between steps without blocking its main loop.
+    """
+
+    def __init__(self, game_state, bot, max_decisions: int = MAX_BOT_DECISIONS):
+        """
+        Args:
+            game_state: GameStateManager whose current player the bot plays
+            bot: BotAI (or subclass) bound to game_state
+            max_decisions: Decisions after which the turn is abandoned
+        """
+        self.game_state = game_state
+        self.bot = bot
+        self.max_decisions = max_decisions
+        self.decisions = 0
+        self.started = False
+        self.finished = False
+        # Decision made but not yet performed
+        self.pending: Optional[str] = None
+
+    def step(self) -> bool:
+        """Play the next step of the turn; False once the turn is over"""
+        if self.finished:
+            return False
+        if not self.started:
+            self.started = True
+            self.game_state.notify("on_bot_turn_started", self.bot)
+        if self.pending is None:
+            return self._decide()
+        decision, self.pending = self.pending, None
+        if not self._perform(decision):
+            return self._finish()
+        return True
+
+    def _decide(self) -> bool:
+        """Ask the bot for its next decision, or end the turn"""
+        if self.game_state.referee.is_turn_over() or self.decisions >= self.max_decisions:
+            return self._finish()
+        self.decisions += 1
+        decision, thinking_message = self.bot.make_decision()
+        self.pending = decision
+        self.game_state.notify("on_bot_decision", self.bot, decision, thinking_message)
+        return True
+
+    def _perform(self, decision: str) -> bool:
+        """Perform a decision; False if the turn cannot go on after it"""
+        game_state = self.game_state
+        referee = game_state.referee
+        bot = self.bot
+        notify = game_state.notify
+
+        if decision == "START_TURN":
+            game_state.start_turn()
+            return True
+
+        if decision == "STASH":
+            stash_indices = bot.get_stash_indices()
+            if not stash_indices:
+                notify("on_bot_action_rejected", bot, decision)
+                return False
+            game_state.stash_dice(stash_indices)
+            notify("on_bot_action", bot, decision)
+            return True
+
+        if decision == "END_TURN":
+            notify("on_bot_action", bot, decision)
+            return False
+
+        if decision not in ("ROLL", "BANK", "START_NEW_STASH"):
+            # Unknown decision: nothing sensible left to do this turn
+            notify("on_bot_action_rejected", bot, decision)
+            return False
+
+        if decision not in referee.legal_actions():
+            notify("on_bot_action_rejected", bot, decision)
+            return True
+
+        if decision == "ROLL":
+            game_state.roll_dice()
+        elif decision == "BANK":
+            referee.bank_points()
+        else:
+            game_state.start_new_stash()
+        notify("on_bot_action", bot, decision)
+        return decision != "BANK"
+
+    def _finish(self) -> bool:
+        self.finished = True
+        hit_limit = self.decisions >= self.max_decisions and not self.game_state.referee.is_turn_over()
+        self.game_state.notify("on_bot_turn_ended", self.bot, self.decisions, hit_limit)
+        return False
+
+
+def play_bot_turn(game_state, bot, max_decisions: int = MAX_BOT_DECISIONS) -> int:
+    """
+    Play the current player's turn with bot until it banks, busts or runs out of moves.
+
+    The turn is not ended: call game_state.referee.end_turn() afterwards.
+
+    Args:
+        game_state: GameStateManager whose current player the bot plays
+        bot: BotAI (or subclass) bound to game_state
+        max_decisions: Decisions after which the turn is abandoned
+
+    Returns:
+        Number of decisions made
+    """
+    turn = BotTurn(game_state, bot, max_decisions)
+    while turn.step():
+        pass
+    return turn.decisions
+
+
+def play_game(game_state, bots: Sequence, max_turns: int = MAX_GAME_TURNS) -> Optional[object]:
+    """
+    Play a whole game between bots, one per player in seat order.
+
+    Args:
+        game_state: Fresh GameStateManager
+        bots: One BotAI per entry of game_state.players
+
+    Returns:
+        The winning Player, or None if max_turns ran out first
+    """
+    referee = game_state.referee
+    for _ in range(max_turns):
+        if referee.is_game_over():
+            return game_state.get_winner()
+        play_bot_turn(game_state, bots[game_state.current_player_index])
+        referee.end_turn()
+    return None
@@ -0,0 +1,194 @@
+"""
+EXPECTIMAX MODULE
+Depth-limited expectimax search over stash choices for the NORMAL GO-BOT.
+
+A decision node is a roll on the table: the bot picks a stash, then either
+banks or rolls on. A chance node is a roll of the dice left in the cup,
+averaged over every distinct outcome (multiset) weighted by its probability.
+The search looks `depth` rolls ahead; at the horizon it banks whatever it can
+(a forced STASHSTASH reroll at the horizon counts the points carried).
+
+Values only depend on the canonical turn state, never on dice order, so both
+node kinds are memoized in one transposition cache:
+
+- decision nodes by (packed count vector, stash size, turn points, depth)
+- chance nodes by (dice in cup, turn points, depth)
+
+The cache is an LRU bounded by cache_size. Searches are shared per ruleset
+and depth through get_search, so positions repeated across turns and games
+are answered from the cache. A search given a deadline raises SearchTimeout
+when it runs out of time; every node finished before that stays cached, so
+the next search of the same position picks up where it stopped.
+"""
+
+import time
+from collections import OrderedDict
+from typing import Dict, List, Optional, Tuple
+
+from core.game_engine.bot_policy import stash_options
+from games.livedice_f.livedice_f_dice_hand import MAX_DICE, DiceHand, pack_counts
+from games.livedice_f.livedice_f_odds import multiset_outcomes
+from games.livedice_f.livedice_f_rulesets import get_ruleset
+
+DEFAULT_DEPTH = 2
+DEFAULT_CACHE_SIZE = 100000
+
+
+class SearchTimeout(Exception):
+    """The search deadline passed before the root was solved"""
+
+
+class ExpectimaxSearch:
+    """Expectimax over stash choices and rolls with an LRU transposition cache"""
+
+    def __init__(self, ruleset: str = "STANDARD", depth: int = DEFAULT_DEPTH, cache_size: int = DEFAULT_CACHE_SIZE):
+        """
+        Args:
+            ruleset: Game ruleset - "SIMPLE", "STANDARD", or "ADVANCED"
+            depth: Rolls to look ahead after the current one
+            cache_size: Maximum number of cached nodes
+        """
+        self.ruleset = get_ruleset(ruleset)
+        self.depth = depth
+        self.cache_size = cache_size
+        self.cache: "OrderedDict[tuple, float]" = OrderedDict()
+        self.hits = 0
+        self.misses = 0
+        # Per dice count: (packed key, counts, probability) of every non-bust outcome
+        self._outcomes: List[List[Tuple[int, Tuple[int, ...], float]]] = [[]]
+        for dice_count in range(1, MAX_DICE + 1):
+            total = 6 ** dice_count
+            self._outcomes.append([
+                (pack_counts(counts), counts, ways / total)
+                for counts, ways in multiset_outcomes(dice_count)
+                if stash_options(self.ruleset, counts)
+            ])
+        self._options: Dict[int, list] = {}
+        self._deadline: Optional[float] = None
+
+    # ========================================================================
+    # CACHE
+    # ========================================================================
+
+    def _lookup(self, key: tuple):
+        value = self.cache.get(key)
+        if value is None:
+            self.misses += 1
+            return None
+        self.hits += 1
+        self.cache.move_to_end(key)
+        return value
+
+    def _store(self, key: tuple, value: float):
+        cache = self.cache
+        cache[key] = value
+        if len(cache) > self.cache_size:
+            cache.popitem(last=False)
+
+    def _stash_options(self, counts: Tuple[int, ...]):
+        key = pack_counts(counts)
+        options = self._options.get(key)
+        if options is None:
+            options = self._options[key] = stash_options(self.ruleset, counts)
+        return options
+
+    # ========================================================================
+    # SEARCH
+    # ========================================================================
+
+    def roll_value(self, dice_count: int, carry: int, depth: int) -> float:
+        """Expected banked points when rolling dice_count dice carrying carry points (chance node)"""
+        key = (dice_count, carry, depth)
+        value = self._lookup(key)
+        if value is None:
+            if self._deadline is not None and time.perf_counter() >= self._deadline:
+                raise SearchTimeout
+            stashed_count = MAX_DICE - dice_count
+            value = 0.0
+            for roll_key, counts, probability in self._outcomes[dice_count]:
+                value += probability * self._decision_value(roll_key, counts, stashed_count, carry, depth - 1)
+            self._store(key, value)
+        return value
+
+    def _decision_value(self, roll_key: int, counts: Tuple[int, ...], stashed_count: int, carry: int, depth: int) -> float:
+        key = (roll_key, stashed_count, carry, depth)
+        value = self._lookup(key)
+        if value is None:
+            value = max(
+                self._option_value(option, stashed_count, carry, depth)[0]
+                for option in self._stash_options(counts)
+            )
+            self._store(key, value)
+        return value
+
+    def _option_value(self, option, stashed_count: int, carry: int, depth: int) -> Tuple[float, bool]:
+        gain, size, rest, _ = option
+        carry += gain
+        dice_left = MAX_DICE - stashed_count - size
+        if dice_left <= 0:
+            # A full stash forces a reroll of all six dice
+            return (self.roll_value(MAX_DICE, carry, depth) if depth > 0 else float(carry)), True
+        bank = carry + rest
+        if depth > 0:
+            roll = self.roll_value(dice_left, carry, depth)
+            if roll > bank:
+                return roll, True
+        return float(bank), False
+
+    def choose_stash(self, dice_values, stashed_count: int, carry_points: int,
+                     deadline: Optional[float] = None) -> Tuple[List[int], bool, float]:
+        """
+        Best stash for a roll within the search horizon.
+
+        Args:
+            dice_values: Dice on the table (list or DiceHand)
+            stashed_count: Dice already in the stash before this roll
+            carry_points: Stash plus stash stash points before this roll
+            deadline: time.perf_counter() value to give up at (None = no limit)
+
+        Returns:
+            Tuple (indices to stash, roll_after, expected value); indices are
+            empty when nothing can be stashed
+
+        Raises:
+            SearchTimeout: If the deadline passes first
+        """
+        hand = DiceHand.of(dice_values)
+        best_value, best_key, best_roll = -1.0, None, False
+        self._deadline = deadline
+        try:
+            for option in self._stash_options(hand.counts):
+                value, roll_after = self._option_value(option, stashed_count, carry_points, self.depth)
+                if value > best_value:
+                    best_value, best_key, best_roll = value, option[3], roll_after
+        finally:
+            self._deadline = None
+        if best_key is None:
+            return [], False, 0.0
+        indices = []
+        for face_index in range(6):
+            indices.extend(hand.face_indices[face_index][:(best_key >> (3 * face_index)) & 0b111])
+        indices.sort()
+        return indices, best_roll, best_value
+
+    def clear(self):
+        """Drop every cached node"""
+        self.cache.clear()
+        self.hits = 0
+        self.misses = 0
+
+    def __repr__(self):
+        return (f"ExpectimaxSearch(ruleset={self.ruleset.name!r}, depth={self.depth}, "
+                f"cached={len(self.cache)}, hits={self.hits}, misses={self.misses})")
+
+
+_searches: Dict[Tuple[str, int], ExpectimaxSearch] = {}
+
+
+def get_search(ruleset: str = "STANDARD", depth: int = DEFAULT_DEPTH) -> ExpectimaxSearch:
+    """Shared search (and cache) for a ruleset and depth"""
+    name = get_ruleset(ruleset).name
+    search = _searches.get((name, depth))
+    if search is None:
+        search = _searches[(name, depth)] = ExpectimaxSearch(name, depth)
+    return search
@@ -1,9 +1,118 @@
-from typing import List, Tuple, Optional
+from typing import Callable, Dict, FrozenSet, List, Tuple, Optional
 from games.livedice_f.livedice_f_rules import LiveDiceFRules, GameStateEnum
+from games.livedice_f.livedice_f_rulesets import StashPartition, get_ruleset
+from games.livedice_f.livedice_f_odds import RollOdds, get_roll_odds
+from core.game_engine.turn_advisor import Advice, TurnAdvisor
+
+# ============================================================================
+# TRANSITION TABLE
+# ============================================================================
+# Action legality depends on the game state plus a handful of turn facts.
+# The facts are packed into a bitmask, TRANSITIONS maps (state, action) to
+# (guard on the facts, state the action leads to), and LEGAL_ACTIONS
+# precompiles the guards for every (state, facts) pair, so legal_actions() is
+# a single dict lookup.
+
+FACT_STASHED_THIS_ROLL = 1
+FACT_CAN_ROLL_ONCE = 2
+FACT_CAN_ROLL_SIX_DICE = 4
+FACT_DICE_ON_TABLE = 8
+FACT_DICE_SELECTED = 16
+FACT_FULL_STASH = 32
+FACT_HAS_TURN_SCORE = 64
+_FACT_COMBINATIONS = 128
+
+ACTIONS = ("ROLL", "STASH", "BANK", "START_NEW_STASH", "END_TURN")
+
+SUMMARY_STATES = frozenset((
+    GameStateEnum.BUST_TURN_SUMMARY,
+    GameStateEnum.BANKED_TURN_SUMMARY,
+    GameStateEnum.END_GAME_SUMMARY,
+))
+
+# States where the dice on the table cannot be selected
+SELECTION_LOCKED_STATES = SUMMARY_STATES
+
+# States where BANK is never allowed (the player must stash or skip green dice first)
+_NO_BANK_STATES = SUMMARY_STATES | {
+    GameStateEnum.START_TURN,
+    GameStateEnum.ROLLRESULT_POSITIVE_STASHOPTIONS,
+    GameStateEnum.ROLLRESULT_POSITIVE_STASHOPTIONS_NOSTASH,
+}
+
+
+def _always(facts: int) -> bool:
+    return True
+
+
+def _roll_after_stash(facts: int) -> bool:
+    return bool(facts & (FACT_CAN_ROLL_ONCE | FACT_STASHED_THIS_ROLL))
+
+
+def _roll_once_only(facts: int) -> bool:
+    return bool(facts & FACT_CAN_ROLL_ONCE)
+
+
+def _roll_default(facts: int) -> bool:
+    if facts & FACT_CAN_ROLL_ONCE:
+        return True
+    return bool(facts & FACT_STASHED_THIS_ROLL) and bool(facts & (FACT_CAN_ROLL_SIX_DICE | FACT_DICE_ON_TABLE))
+
+
+def _bank(facts: int) -> bool:
+    return bool(facts & FACT_STASHED_THIS_ROLL) and bool(facts & FACT_HAS_TURN_SCORE)
+
+
+def _stash(facts: int) -> bool:
+    return bool(facts & FACT_DICE_SELECTED)
+
+
+def _start_new_stash(facts: int) -> bool:
+    return bool(facts & FACT_FULL_STASH)
+
+
+_ROLL_GUARDS: Dict[GameStateEnum, Callable[[int], bool]] = {
+    GameStateEnum.START_TURN: _always,
+    GameStateEnum.NEW_STASH: _always,
+    GameStateEnum.ROLLRESULT_POSITIVE_STASHOPTIONS_HAVESTASHED_CURRENTROLL: _roll_after_stash,
+    GameStateEnum.STASHCHOICE_STASHED_FULL_READY_TO_ROLL: _roll_after_stash,
+    GameStateEnum.ROLLRESULT_POSITIVE_STASHOPTIONS_NOSTASH: _roll_once_only,
+}
+
+
+def _build_transitions() -> Dict[Tuple[GameStateEnum, str], Tuple[Callable[[int], bool], Optional[GameStateEnum]]]:
+    # Next state is where the action normally leads; None means the outcome
+    # decides (a roll can bust, a stash can empty or fill the table).
+    transitions = {}
+    for state in GameStateEnum:
+        if state not in SUMMARY_STATES:
+            transitions[(state, "ROLL")] = (_ROLL_GUARDS.get(state, _roll_default), None)
+        if state not in _NO_BANK_STATES:
+            transitions[(state, "BANK")] = (_bank, GameStateEnum.BANKED_TURN_SUMMARY)
+        transitions[(state, "STASH")] = (_stash, None)
+        transitions[(state, "START_NEW_STASH")] = (_start_new_stash, GameStateEnum.NEW_STASH)
+        transitions[(state, "END_TURN")] = (_always, GameStateEnum.NEXTUP_READYUP)
+    return transitions
+
+
+TRANSITIONS = _build_transitions()
+
+LEGAL_ACTIONS: Dict[Tuple[GameStateEnum, int], FrozenSet[str]] = {
+    (state, facts): frozenset(
+        action for action in ACTIONS
+        if (state, action) in TRANSITIONS and TRANSITIONS[(state, action)][0](facts)
+    )
+    for state in GameStateEnum
+    for facts in range(_FACT_COMBINATIONS)
+}
+
 
 class GameReferee:
     def __init__(self, game_state_manager):
         self.game_state_manager = game_state_manager
+        # Compiled ruleset tables, resolved once per game instead of per rules call
+        self.rules = get_ruleset(game_state_manager.ruleset)
+        self._advisor: Optional[TurnAdvisor] = None
 
     def update_game_state(self):
         """
@@ -25,23 +134,26 @@ class GameReferee:
                 self.set_game_state(GameStateEnum.END_GAME_SUMMARY)
                 return
         
-        # Normal game state logic
-        state_conditions = [
-            (lambda: self.bust_state, GameStateEnum.BUST_TURN_SUMMARY),
-            (lambda: self.turn_banked, GameStateEnum.BANKED_TURN_SUMMARY),
-            (self.referee.is_full_stash, GameStateEnum.STASHCHOICE_STASHED_FULL),
-            (lambda: len(self.dice_values) == 0 and self.referee.has_stashed_dice(), GameStateEnum.STASHCHOICE_STASHED_ALL),
-            (lambda: self.referee.get_stashable_dice(self.dice_values) and self.referee.has_stashed_dice(), GameStateEnum.ROLLRESULT_POSITIVE_STASHOPTIONS_HAVESTASHED),
-            (lambda: self.referee.get_stashable_dice(self.dice_values), GameStateEnum.ROLLRESULT_POSITIVE_STASHOPTIONS),
-            (lambda: True, GameStateEnum.STASHCHOICE_STASHED_PARTIAL)
-        ]
-
-        for condition, state in state_conditions:
-            if condition():
-                self.referee.set_game_state(state)
-                break
-
-        self.real_time_counters.update_counters(self)
+        # Normal game state logic, first matching condition wins
+        game_state_manager = self.game_state_manager
+        if game_state_manager.bust_state:
+            state = GameStateEnum.BUST_TURN_SUMMARY
+        elif game_state_manager.turn_banked:
+            state = GameStateEnum.BANKED_TURN_SUMMARY
+        elif self.is_full_stash():
+            state = GameStateEnum.STASHCHOICE_STASHED_FULL
+        elif not game_state_manager.dice_values and self.has_stashed_dice():
+            state = GameStateEnum.STASHCHOICE_STASHED_ALL
+        elif not self.rules.is_bust(game_state_manager.dice_hand):
+            if self.has_stashed_dice():
+                state = GameStateEnum.ROLLRESULT_POSITIVE_STASHOPTIONS_HAVESTASHED
+            else:
+                state = GameStateEnum.ROLLRESULT_POSITIVE_STASHOPTIONS
+        else:
+            state = GameStateEnum.STASHCHOICE_STASHED_PARTIAL
+        self.set_game_state(state)
+
+        game_state_manager.real_time_counters.update_counters(game_state_manager)
 
     def calculate_total_score(self) -> int:
         current_state = self.game_state_manager.current_game_state
@@ -55,7 +167,7 @@ class GameReferee:
         return self.calculate_turn_score()
     
     def calculate_table_score(self) -> int:
-        return LiveDiceFRules.calculate_score(self.game_state_manager.dice_values, False, self.game_state_manager.ruleset)
+        return self.rules.calculate_score(self.game_state_manager.dice_hand)
 
     def calculate_stash_score(self) -> int:
         return self.game_state_manager.current_player.get_stash_score()
@@ -69,10 +181,10 @@ class GameReferee:
                 self.calculate_stash_stash_score())
 
     def get_total_score(self, player) -> int:
-        return sum(turn["SCORE"] for turn in player.turn_scores.values())
+        return player.get_total_score()
 
     def is_bust(self) -> bool:
-        return LiveDiceFRules.is_bust(self.game_state_manager.dice_values, self.game_state_manager.ruleset)
+        return self.rules.is_bust(self.game_state_manager.dice_hand)
 
     def can_stash(self) -> bool:
         return LiveDiceFRules.can_stash(self.game_state_manager.selected_dice)
@@ -81,10 +193,20 @@ class GameReferee:
         return LiveDiceFRules.is_full_stash(self.game_state_manager.current_player.stashed_dice)
 
     def get_stashable_dice(self, dice_values: List[int]) -> List[int]:
-        return LiveDiceFRules.get_stashable_dice(dice_values, self.game_state_manager.ruleset)
+        return self.rules.get_stashable_dice(dice_values)
 
     def get_scoring_combinations(self, dice_values: List[int]) -> List[Tuple[str, int]]:
-        return LiveDiceFRules.get_scoring_combinations(dice_values, self.game_state_manager.ruleset)
+        return self.rules.get_scoring_combinations(dice_values)
+
+    def get_roll_odds(self, dice_count: Optional[int] = None) -> RollOdds:
+        """Exact bust chance and score distribution for the next roll (defaults to the dice in the cup)"""
+        if dice_count is None:
+            dice_count = LiveDiceFRules.MAX_DICE - len(self.game_state_manager.current_player.stashed_dice)
+        return get_roll_odds(dice_count, self.rules.name)
+
+    def solve_stash(self, dice_values: List[int]) -> StashPartition:
+        """Highest-scoring split of the given dice into combinations"""
+        return self.rules.solve_stash(dice_values)
 
     def get_stash_number(self) -> str:
         return LiveDiceFRules.get_stash_number(self.game_state_manager.current_player.stash_level)
@@ -100,31 +222,37 @@ class GameReferee:
     def is_scoring_dice(self, dice: List[int]) -> bool:
         return LiveDiceFRules.is_scoring_dice(dice)
 
+    def get_turn_facts(self) -> int:
+        """Bitmask of the FACT_* flags the transition guards depend on"""
+        game_state_manager = self.game_state_manager
+        player = game_state_manager.current_player
+        facts = 0
+        if player.stashed_dice_this_roll:
+            facts |= FACT_STASHED_THIS_ROLL
+        if game_state_manager.can_roll_once:
+            facts |= FACT_CAN_ROLL_ONCE
+        if LiveDiceFRules.can_roll_six_dice(game_state_manager.turn_started, player.stashed_dice, player.roll_count):
+            facts |= FACT_CAN_ROLL_SIX_DICE
+        if game_state_manager.dice_values:
+            facts |= FACT_DICE_ON_TABLE
+        if game_state_manager.selected_dice:
+            facts |= FACT_DICE_SELECTED
+        if LiveDiceFRules.is_full_stash(player.stashed_dice):
+            facts |= FACT_FULL_STASH
+        if player.stashed_dice_this_roll and self.calculate_virtual_score() > 0:
+            facts |= FACT_HAS_TURN_SCORE
+        return facts
+
+    def legal_actions(self) -> FrozenSet[str]:
+        """Actions allowed right now (subset of ACTIONS), one table lookup"""
+        return LEGAL_ACTIONS[(self.game_state_manager.current_game_state, self.get_turn_facts())]
+
+    def get_transition(self, action: str) -> Optional[Tuple[Callable[[int], bool], Optional[GameStateEnum]]]:
+        """(guard, next state) for action in the current state, or None if it is never allowed there"""
+        return TRANSITIONS.get((self.game_state_manager.current_game_state, action))
+
     def can_roll(self) -> bool:
-        current_state = self.game_state_manager.current_game_state
-        has_stashed_this_turn = self.game_state_manager.current_player.stashed_dice_this_roll
-        
-        if current_state in [GameStateEnum.BUST_TURN_SUMMARY, 
-                             GameStateEnum.BANKED_TURN_SUMMARY, 
-                             GameStateEnum.END_GAME_SUMMARY]:
-            return False
-        
-        if current_state in [GameStateEnum.START_TURN, GameStateEnum.NEW_STASH]:
-            return True
-        
-        if self.game_state_manager.can_roll_once:
-            return True
-        
-        return (LiveDiceFRules.can_roll_again(has_stashed_this_turn) and
-                (LiveDiceFRules.can_roll_six_dice(
-                    self.game_state_manager.turn_started,
-                    self.game_state_manager.current_player.stashed_dice,
-                    self.game_state_manager.current_player.roll_count
-                ) or
-                (has_stashed_this_turn and len(self.game_state_manager.dice_values) > 0) or
-                current_state == GameStateEnum.ROLLRESULT_POSITIVE_STASHOPTIONS_HAVESTASHED_CURRENTROLL or
-                current_state == GameStateEnum.STASHCHOICE_STASHED_FULL_READY_TO_ROLL) and
-                current_state != GameStateEnum.ROLLRESULT_POSITIVE_STASHOPTIONS_NOSTASH)
+        return "ROLL" in self.legal_actions()
 
     def can_roll_six_dice(self, turn_started: bool, stashed_dice: List[int], roll_count: int) -> bool:
         return LiveDiceFRules.can_roll_six_dice(turn_started, stashed_dice, roll_count)
@@ -140,45 +268,22 @@ class GameReferee:
             return "CANNOT ROLL"  # This button should be disabled when there are no dice to roll
 
     def can_bank(self) -> bool:
-        current_state = self.game_state_manager.current_game_state
-        has_stashed_this_turn = self.game_state_manager.current_player.stashed_dice_this_roll
-        virtual_score = self.calculate_virtual_score()
-        
         # CRITICAL FIX: BANK not allowed when player has unstashed green dice
-        # Added ROLLRESULT_POSITIVE_STASHOPTIONS to exclusion list
+        # (ROLLRESULT_POSITIVE_STASHOPTIONS is in _NO_BANK_STATES)
         # Player must make stashing decision (stash or skip) before banking
-        return (LiveDiceFRules.can_bank(has_stashed_this_turn, virtual_score) and
-                current_state not in [GameStateEnum.BUST_TURN_SUMMARY, 
-                                      GameStateEnum.BANKED_TURN_SUMMARY, 
-                                      GameStateEnum.END_GAME_SUMMARY,
-                                      GameStateEnum.START_TURN,
-                                      GameStateEnum.ROLLRESULT_POSITIVE_STASHOPTIONS,
-                                      GameStateEnum.ROLLRESULT_POSITIVE_STASHOPTIONS_NOSTASH])
-
-    def get_stash_button_text(self) -> str:
-        stash_points = LiveDiceFRules.calculate_score([self.game_state_manager.dice_values[i] for i in self.game_state_manager.selected_dice])
-        total_stash_points = self.game_state_manager.real_time_counters.stashplusselection_vscore
-        stash_stash_points = self.game_state_manager.real_time_counters.stashstash_vscore
-        full_stashes_moved = self.game_state_manager.current_player.full_stashes_moved
-        return f"STASH {self.game_state_manager.format_number(stash_points)} POINTS\nTOTAL STASH: {self.game_state_manager.format_number(total_stash_points)} POINTS\nSTASH STASH: {self.game_state_manager.format_number(stash_stash_points)} POINTS ({self.game_state_manager.format_number(full_stashes_moved)} STASHES)"
-
-    def get_bank_button_text(self) -> str:
-        virtual_score = self.calculate_virtual_score()
-        return f"BANK {self.game_state_manager.format_number(virtual_score)} POINTS\n" \
-            f"TABLE: {self.game_state_manager.format_number(self.game_state_manager.real_time_counters.table_vscore)} / " \
-            f"STASH: {self.game_state_manager.format_number(self.game_state_manager.real_time_counters.stash_vscore)} / " \
-            f"STASH STASH: {self.game_state_manager.format_number(self.game_state_manager.real_time_counters.stashstash_vscore)}"
-
-    def get_full_stash_button_text(self) -> str:
-        stash_points = self.game_state_manager.real_time_counters.stash_vscore
-        return f"FULL STASH\nMOVE {self.game_state_manager.format_number(stash_points)} POINTS TO STASH STASH\nSTART {self.get_next_stash_number()} STASH"
+        return "BANK" in self.legal_actions()
+
+    def get_advice(self) -> Optional[Advice]:
+        """Bust chance and expected values of rolling on vs banking right now, None between turns"""
+        if self._advisor is None:
+            self._advisor = TurnAdvisor(self.game_state_manager)
+        return self._advisor.get_advice()
 
     def can_select_dice(self, dice_index: Optional[int] = None) -> bool:
-        current_state = self.game_state_manager.current_game_state
-        if current_state in [GameStateEnum.BUST_TURN_SUMMARY, GameStateEnum.BANKED_TURN_SUMMARY, GameStateEnum.END_GAME_SUMMARY]:
+        if self.game_state_manager.current_game_state in SELECTION_LOCKED_STATES:
             return False
         if dice_index is not None:
-            return dice_index in self.get_stashable_dice(self.game_state_manager.dice_values)
+            return dice_index in self.get_stashable_dice(self.game_state_manager.dice_hand)
         return True
 
     def is_turn_over(self) -> bool:
@@ -228,7 +333,7 @@ class GameReferee:
         return all_equal_turns
 
     def calculate_score(self, dice_values: List[int], stashed_together: bool = False) -> int:
-        return LiveDiceFRules.calculate_score(dice_values, stashed_together, self.game_state_manager.ruleset)
+        return self.rules.calculate_score(dice_values, stashed_together)
 
     def describe_stash(self, stashed: List[int]) -> str:
         return LiveDiceFRules.describe_stash(stashed)
@@ -243,29 +348,15 @@ class GameReferee:
         return len(self.game_state_manager.current_player.stashed_dice) > 0
     
     def validate_action(self, action: str) -> bool:
-        valid_actions = {
-            "ROLL": self.can_roll,
-            "STASH": self.can_stash,
-            "BANK": self.can_bank,
-            "START_NEW_STASH": self.is_full_stash,
-            "END_TURN": lambda: True  # Always allow ending turn
-        }
-        return valid_actions.get(action, lambda: False)()
+        return action in self.legal_actions()
 
     def perform_action(self, action: str):
         if not self.validate_action(action):
             raise ValueError(f"Invalid action: {action} in game state: {self.game_state_manager.current_game_state}")
 
-        # CRITICAL FIX: Wrap roll_dice to include animation
-        if action == "ROLL":
-            # Roll the dice
-            self.game_state_manager.roll_dice()
-            # CRITICAL: Trigger animation after rolling
-            if hasattr(self.game_state_manager, 'ui') and self.game_state_manager.ui:
-                self.game_state_manager.ui.animate_dice_roll()
-            return
-
+        # Observers animate the roll from GameObserver.on_dice_rolled
         action_methods = {
+            "ROLL": self.game_state_manager.roll_dice,
             "STASH": lambda: self.game_state_manager.stash_dice(self.game_state_manager.selected_dice),
             "BANK": self.bank_points,
             "START_NEW_STASH": self.start_new_stash,
@@ -292,6 +383,7 @@ class GameReferee:
         
         self.game_state_manager.next_player()
         self.set_game_state(GameStateEnum.NEXTUP_READYUP)
+        self.game_state_manager.notify("on_turn_ended")
 
     def start_new_stash(self):
         current_player = self.game_state_manager.current_player
@@ -302,6 +394,7 @@ class GameReferee:
         current_player.stashes_this_turn = 0
         current_player.stash_level += 1
         self.set_game_state(GameStateEnum.NEW_STASH)
+        self.game_state_manager.notify("on_new_stash_started")
 
     def bust(self):
         self.game_state_manager.bust_state = True
@@ -334,6 +427,9 @@ class GameReferee:
             current_player.roll_count, current_player.full_stashes_moved_this_turn
         )
         self.game_state_manager.turn_banked = True
+        if current_player.is_human():
+            self.game_state_manager.opponent_model.observe_bank(current_player.user.username, total_score)
+        self.game_state_manager.save_profiles_if_game_over()
         
         # CRITICAL: G-REF announces bank for ALL players (human and bot)
         player_name = current_player.user.username
@@ -359,7 +455,9 @@ class GameReferee:
                 self.game_state_manager.message_manager.add_gref_official_statement(
                     f"{player_name} HAS REACHED THE ENDGOAL! FINAL TURNS BEGINNING!"
                 )
+                self.game_state_manager.notify("on_points_banked", total_score)
                 return
         
         self.set_game_state(GameStateEnum.BANKED_TURN_SUMMARY)
         current_player.stash_stash = 0
+        self.game_state_manager.notify("on_points_banked", total_score)
@@ -1,42 +1,170 @@
-import random
+import time
 from games.livedice_f.livedice_f_rules import GameStateEnum, LiveDiceFRules
+from games.livedice_f.livedice_f_odds import get_bust_probability
+from core.game_engine.bot_params import get_bot_params
+from core.game_engine.bot_policy import PolicyTable, get_policy
+from core.game_engine.expectimax import DEFAULT_DEPTH, SearchTimeout, get_search
+from core.game_engine.win_model import (
+    FIRST, SECOND, WinModel, get_best_response, get_win_model, pop_best_response_failure,
+)
+
+# Decision that only depends on the game state
+FIXED_DECISIONS = {
+    GameStateEnum.NEXTUP_READYUP: "START_TURN",
+    GameStateEnum.START_TURN: "ROLL",
+    GameStateEnum.STASHCHOICE_STASHED_FULL: "START_NEW_STASH",
+    GameStateEnum.STASHCHOICE_STASHED_FULL_READY_TO_ROLL: "ROLL",
+    GameStateEnum.NEW_STASH: "ROLL",
+    GameStateEnum.BANKED_TURN_SUMMARY: "END_TURN",
+    GameStateEnum.BUST_TURN_SUMMARY: "END_TURN",
+}
+
+# BotAI method deciding in the other states (any state not listed banks)
+STATE_DECIDERS = {
+    GameStateEnum.ROLLRESULT_POSITIVE_STASHOPTIONS: "decide_stash_or_bank",
+    GameStateEnum.ROLLRESULT_POSITIVE_STASHOPTIONS_HAVESTASHED: "decide_stash_or_bank",
+    GameStateEnum.ROLLRESULT_POSITIVE_STASHOPTIONS_HAVESTASHED_CURRENTROLL: "decide_roll_or_bank",
+    GameStateEnum.ROLLRESULT_POSITIVE_STASHSELECTION_PARTIAL: "decide_stash_or_bank",
+    GameStateEnum.ROLLRESULT_POSITIVE_STASHSELECTION_FULL: "decide_stash_or_bank",
+    GameStateEnum.STASHCHOICE_STASHED_ALL: "decide_roll_or_bank",
+    GameStateEnum.STASHCHOICE_STASHED_PARTIAL: "decide_roll_or_bank",
+}
 
 class BotAI:
-    def __init__(self, game_state):
+    def __init__(self, game_state, think_budget=None, max_search_depth=DEFAULT_DEPTH, adaptive=True,
+                 difficulty=None, params=None, verbose=False):
+        """
+        Args:
+            game_state: GameStateManager the bot plays in
+            think_budget: Seconds of search per decision (e.g. 0.05 in the UI,
+                0 for the cheap answer only); None searches to max_search_depth
+            max_search_depth: Deepest expectimax search the NORMAL bot runs
+            adaptive: HARD bot plays a best response to a leading human's
+                observed bank threshold once it is known
+            difficulty: EASY, NORMAL or HARD (default: the game's bot difficulty)
+            params: Roll/bank heuristic parameters (default: the tuned values
+                for the difficulty, see bot_params)
+            verbose: Print the state and decision of every move on stdout
+        """
         self.game_state = game_state
+        self.difficulty = (difficulty or game_state.bot_difficulty).upper()
+        self.params = get_bot_params(self.difficulty) if params is None else params
         self.thinking_message = ""
+        self.think_budget = think_budget
+        self.max_search_depth = max_search_depth
+        self.adaptive = adaptive
+        self.verbose = verbose
+        # Search completed for the last decision: source of the answer
+        # ("rules", "heuristic", "policy" or "expectimax"), depth reached,
+        # whether the deadline cut the search short, and time spent
+        self.search_stats = {"source": "rules", "depth": 0, "timed_out": False, "elapsed_ms": 0.0}
+        self._deadline = None
+        self._policy = None
+        self._win_model = None
+
+    @staticmethod
+    def decide_batch(states, ruleset="STANDARD", risk_bonus=0.0):
+        """
+        Decide thousands of independent turns in one vectorized call (needs NumPy).
+
+        Args:
+            states: (N, 9) encoded turn states, see bot_batch.encode_turn_state
+            ruleset: Game ruleset - "SIMPLE", "STANDARD", or "ADVANCED"
+            risk_bonus: Points added to roll-on values, scalar or one per state
+
+        Returns:
+            Tuple (actions, stash_masks) of bot_batch.ACTION_* codes and (N, 6) dice masks
+        """
+        from core.game_engine.bot_batch import decide_batch
+        return decide_batch(states, ruleset, risk_bonus)
+
+    @property
+    def policy(self) -> PolicyTable:
+        """Expected-points policy table for the game's ruleset (HARD bot), loaded on first use"""
+        if self._policy is None:
+            self._policy = get_policy(self.game_state.ruleset)
+        return self._policy
+
+    @property
+    def win_model(self) -> WinModel:
+        """Win-probability model for the game's ruleset and endgoal (HARD bot), loaded on first use"""
+        if self._win_model is None:
+            self._win_model = get_win_model(self.game_state.ruleset, self.game_state.endgoal)
+        return self._win_model
+
+    def get_turn_plan(self):
+        """
+        Turn strategy for the HARD bot from the scoreboard at the start of the turn.
+
+        The win model is heads-up against the leader. The seat tells it whether
+        the leader still moves this round (reaching the endgoal then gives the
+        leader a final turn) or has already moved (reaching it ends the game).
+
+        Returns:
+            ("EV", risk bonus points) to play the expected-points policy with
+            extra (or less) appetite for rolling, or ("CHASE", turn points) to
+            roll until at least that many points can be banked
+        """
+        current_player = self.game_state.current_player
+        my_score = current_player.get_total_score()
+        others = [player for player in self.game_state.players if player != current_player]
+        if not others:
+            return "EV", 0
+        leader = max(others, key=lambda player: player.get_total_score())
+        leader_score = leader.get_total_score()
+        if leader_score >= self.game_state.endgoal:
+            # Someone reached the endgoal: this is our last turn, beat them or lose
+            need = leader_score - my_score + self.win_model.unit
+            return ("CHASE", need) if need > 0 else ("EV", 0)
+        seat = SECOND if leader.turn_count > current_player.turn_count else FIRST
+        if self.adaptive and leader.is_human():
+            threshold = self.game_state.opponent_model.estimated_threshold(leader.user.username)
+            if threshold is not None:
+                # Solved in the background on first use; the generic model covers until then
+                response = get_best_response(self.game_state.ruleset, self.game_state.endgoal, threshold)
+                if response is not None:
+                    return response.strategy(my_score, leader_score, seat)
+                failure = pop_best_response_failure(self.game_state.ruleset, self.game_state.endgoal, threshold)
+                if failure is not None:
+                    self.game_state.message_manager.add_bot_thinking(
+                        current_player.user.username,
+                        f"COULD NOT WORK OUT A COUNTER TO {leader.user.username} ({failure}) - "
+                        f"PLAYING THE STANDARD ENDGAME")
+        return self.win_model.strategy(my_score, leader_score, seat)
+
+    def get_carry_points(self) -> int:
+        """Points kept when rolling on: stash plus stash stash"""
+        player = self.game_state.current_player
+        return player.get_stash_score() + player.stash_stash
 
     def make_decision(self):
+        """
+        Anytime decision: the cheap answer first, refined until the think budget runs out.
+
+        Returns:
+            Tuple (decision, thinking message); search_stats reports how much
+            search backed the decision
+        """
+        started = time.perf_counter()
+        self._deadline = None if self.think_budget is None else started + self.think_budget
+        self.search_stats = {"source": "rules", "depth": 0, "timed_out": False, "elapsed_ms": 0.0}
         current_state = self.game_state.current_game_state
-        print(f"BotAI: Current game state is {current_state}")
-
-        state_decisions = {
-            GameStateEnum.NEXTUP_READYUP: "START_TURN",
-            GameStateEnum.START_TURN: "ROLL",
-            GameStateEnum.ROLLRESULT_POSITIVE_STASHOPTIONS: self.decide_stash_or_bank,
-            GameStateEnum.ROLLRESULT_POSITIVE_STASHOPTIONS_HAVESTASHED: self.decide_stash_or_bank,
-            GameStateEnum.ROLLRESULT_POSITIVE_STASHOPTIONS_HAVESTASHED_CURRENTROLL: self.decide_roll_or_bank,
-            GameStateEnum.ROLLRESULT_POSITIVE_STASHSELECTION_PARTIAL: self.decide_stash_or_bank,
-            GameStateEnum.ROLLRESULT_POSITIVE_STASHSELECTION_FULL: self.decide_stash_or_bank,
-            GameStateEnum.STASHCHOICE_STASHED_ALL: self.decide_roll_or_bank,
-            GameStateEnum.STASHCHOICE_STASHED_PARTIAL: self.decide_roll_or_bank,
-            GameStateEnum.STASHCHOICE_STASHED_FULL: "START_NEW_STASH",
-            GameStateEnum.STASHCHOICE_STASHED_FULL_READY_TO_ROLL: "ROLL",
-            GameStateEnum.NEW_STASH: "ROLL",
-            GameStateEnum.BANKED_TURN_SUMMARY: "END_TURN",
-            GameStateEnum.BUST_TURN_SUMMARY: "END_TURN"
-        }
+        if self.verbose:
+            print(f"BotAI: Current game state is {current_state}")
 
-        decision = state_decisions.get(current_state, lambda: "BANK")
-        if callable(decision):
-            decision = decision()
+        decision = FIXED_DECISIONS.get(current_state)
+        if decision is None:
+            decider = STATE_DECIDERS.get(current_state)
+            decision = getattr(self, decider)() if decider else "BANK"
 
-        print(f"BotAI decision: {decision}")
+        self.search_stats["elapsed_ms"] = (time.perf_counter() - started) * 1000
+        if self.verbose:
+            print(f"BotAI decision: {decision} ({self.search_stats})")
         return decision, self.thinking_message
 
     def decide_stash_or_bank(self):
         """Smart stashing decision with value-per-dice calculation"""
-        stashable_dice = self.game_state.referee.get_stashable_dice(self.game_state.dice_values)
+        stashable_dice = self.game_state.referee.get_stashable_dice(self.game_state.dice_hand)
         
         if not stashable_dice:
             self.thinking_message = "NO SCORING DICE AVAILABLE"
@@ -50,13 +178,25 @@ class BotAI:
         return self.decide_roll_or_bank()
 
     def smart_stash_selection(self):
+        """Select which dice to stash: policy table (HARD), anytime search (NORMAL) or heuristics"""
+        # HARD bots stash whatever maximizes expected turn points
+        if self.difficulty == "HARD":
+            return self.policy_stash_selection()
+        
+        # NORMAL bots search a few rolls ahead, as deep as the think budget allows
+        if self.difficulty == "NORMAL":
+            return self.anytime_stash_selection()
+        
+        return self.heuristic_stash_selection()
+
+    def heuristic_stash_selection(self):
         """Intelligently select which dice to stash based on value-per-dice"""
+        self.search_stats["source"] = "heuristic"
         dice_values = self.game_state.dice_values
-        stashable = self.game_state.referee.get_stashable_dice(dice_values)
+        stashable = self.game_state.referee.get_stashable_dice(self.game_state.dice_hand)
         
         # CRITICAL FIX: NORMAL/HARD bots ALWAYS take optimal STASHSTASH move
-        bot_difficulty = self.game_state.bot_difficulty
-        if bot_difficulty in ["NORMAL", "HARD"]:
+        if self.difficulty in ["NORMAL", "HARD"]:
             if len(stashable) == len(dice_values):
                 current_stash_count = len(self.game_state.current_player.stashed_dice)
                 if current_stash_count + len(stashable) == 6:
@@ -66,8 +206,7 @@ class BotAI:
         
         # CRITICAL FIX: NORMAL/HARD bots ALWAYS take optimal STASHSTASH move
         # When all dice are stashable AND fills stash = free reroll with all 6 dice
-        bot_difficulty = self.game_state.bot_difficulty
-        if bot_difficulty in ["NORMAL", "HARD"]:
+        if self.difficulty in ["NORMAL", "HARD"]:
             # Check if all dice are stashable
             if len(stashable) == len(dice_values):
                 # Check if stashing all would fill the stash
@@ -123,13 +262,101 @@ class BotAI:
         self.game_state.selected_dice = to_stash
         return "STASH"
 
+    def anytime_stash_selection(self):
+        """Start from the heuristic stash and deepen the expectimax search until the deadline"""
+        decision = self.heuristic_stash_selection()
+        for depth in range(1, self.max_search_depth + 1):
+            if self._deadline is not None and time.perf_counter() >= self._deadline:
+                self.search_stats["timed_out"] = True
+                break
+            try:
+                decision = self.search_stash_selection(depth)
+            except SearchTimeout:
+                # Finished nodes stay cached, so the next decision gets further
+                self.search_stats["timed_out"] = True
+                break
+        return decision
+
+    def search_stash_selection(self, depth=DEFAULT_DEPTH):
+        """Pick the stash with the best expectimax value looking depth rolls ahead"""
+        stashed_count = len(self.game_state.current_player.stashed_dice)
+        to_stash, roll_after, expected = get_search(self.game_state.ruleset, depth).choose_stash(
+            self.game_state.dice_hand, stashed_count, self.get_carry_points(), deadline=self._deadline
+        )
+        self.search_stats["source"] = "expectimax"
+        self.search_stats["depth"] = depth
+        if not to_stash:
+            self.thinking_message = "NO SCORING DICE AVAILABLE"
+            return "END_TURN"
+        if stashed_count + len(to_stash) == 6:
+            self.thinking_message = "ALL DICE GREEN! FILLING STASH FOR STASHSTASH - OPTIMAL MOVE!"
+        elif roll_after:
+            remaining_dice = 6 - stashed_count - len(to_stash)
+            self.thinking_message = f"STASHING {len(to_stash)} DICE - KEEPING {remaining_dice} DICE, LOOKING AT {int(expected)} POINTS"
+        else:
+            self.thinking_message = f"STASHING {len(to_stash)} DICE - {int(expected)} POINTS IS GOOD ENOUGH"
+        self.game_state.selected_dice = to_stash
+        return "STASH"
+
+    def policy_stash_selection(self):
+        """Pick the stash that best serves the turn plan (expected points or reaching a target)"""
+        self.search_stats["source"] = "policy"
+        stashed_count = len(self.game_state.current_player.stashed_dice)
+        carry_points = self.get_carry_points()
+        kind, parameter = self.get_turn_plan()
+        if kind == "CHASE":
+            to_stash, roll_after, chance = self.win_model.choose_chase_stash(
+                self.game_state.dice_hand, stashed_count, parameter - carry_points
+            )
+        else:
+            to_stash, roll_after, expected = self.policy.choose_stash(
+                self.game_state.dice_hand, stashed_count, carry_points, risk_bonus=parameter
+            )
+        if not to_stash:
+            self.thinking_message = "NO SCORING DICE AVAILABLE"
+            return "END_TURN"
+        if kind == "CHASE":
+            self.thinking_message = f"NEED {parameter} POINTS THIS TURN - STASHING {len(to_stash)} DICE ({int(chance * 100)}% TO MAKE IT)"
+        elif stashed_count + len(to_stash) == 6:
+            self.thinking_message = f"FILLING STASH FOR STASHSTASH - EXPECTING {int(expected)} POINTS THIS TURN"
+        elif roll_after:
+            self.thinking_message = f"STASHING {len(to_stash)} DICE AND ROLLING ON - EXPECTING {int(expected)} POINTS"
+        else:
+            self.thinking_message = f"STASHING {len(to_stash)} DICE TO BANK"
+        self.game_state.selected_dice = to_stash
+        return "STASH"
+
+    def policy_decision(self, virtual_score, remaining_dice):
+        """Roll or bank by the turn plan: a target check or one expected-value table lookup"""
+        self.search_stats["source"] = "policy"
+        carry_points = self.get_carry_points()
+        kind, parameter = self.get_turn_plan()
+        if kind == "CHASE":
+            if virtual_score >= parameter:
+                self.thinking_message = f"BANKING {virtual_score} POINTS - ENOUGH TO SECURE THE GAME"
+                return "BANK"
+            chance = self.win_model.chase_probability(remaining_dice, parameter - carry_points)
+            self.thinking_message = f"NEED {parameter} POINTS THIS TURN - ROLLING {remaining_dice} DICE ({int(chance * 100)}% TO MAKE IT)"
+            return "ROLL"
+        roll_value = self.policy.roll_value(remaining_dice, carry_points)
+        if roll_value + parameter > virtual_score:
+            self.thinking_message = f"ROLLING {remaining_dice} DICE IS WORTH {int(roll_value)} POINTS ON AVERAGE - ROLLING"
+            return "ROLL"
+        self.thinking_message = f"BANKING {virtual_score} POINTS - ROLLING IS ONLY WORTH {int(roll_value)}"
+        return "BANK"
+
     def decide_roll_or_bank(self):
         """Advanced decision-making considering game state, risk, and strategy"""
+        self.search_stats["source"] = "heuristic"
         virtual_score = self.game_state.referee.calculate_turn_score()
         remaining_dice = self.game_state.real_time_counters.rollcupdice_var
         current_score = self.game_state.referee.get_total_score(self.game_state.current_player)
         target_score = self.game_state.endgoal
         
+        # HARD bots play the win-probability plan, which already covers the endgame
+        if self.difficulty == "HARD":
+            return self.policy_decision(virtual_score, remaining_dice)
+        
         # Check if we can win by banking now
         if current_score + virtual_score >= target_score:
             return self.evaluate_winning_position(current_score, virtual_score, remaining_dice)
@@ -192,7 +419,7 @@ class BotAI:
         
         lead_amount = my_score - max_other
         leading = lead_amount > 0
-        close_race = abs(lead_amount) < 500  # Within 500 points
+        close_race = abs(lead_amount) < self.params["close_race_margin"]
         
         return {
             "leading": leading,
@@ -202,51 +429,48 @@ class BotAI:
         }
 
     def calculate_bust_risk(self, remaining_dice):
-        """Calculate probability of busting based on remaining dice"""
-        if remaining_dice >= 5:
-            return 0.1  # Very low risk
-        elif remaining_dice == 4:
-            return 0.25  # Low risk
-        elif remaining_dice == 3:
-            return 0.45  # Moderate risk
-        elif remaining_dice == 2:
-            return 0.70  # High risk
-        else:  # 1 die
-            return 0.85  # Very high risk
+        """Exact probability of busting when rolling the remaining dice under the game's ruleset"""
+        return get_bust_probability(remaining_dice, self.game_state.ruleset)
 
     def conservative_decision(self, virtual_score, remaining_dice, bust_risk):
         """Conservative strategy when leading"""
-        if virtual_score >= 600:
+        params = self.params
+        if virtual_score >= params["conservative_bank_points"]:
             self.thinking_message = f"LEADING THE GAME - BANKING {virtual_score} POINTS TO PROTECT MY LEAD"
             return "BANK"
         elif remaining_dice >= 5:
             self.thinking_message = "SAFE TO ROLL WITH MANY DICE"
             return "ROLL"
-        elif remaining_dice >= 3 and virtual_score < 400:
+        elif remaining_dice >= 3 and virtual_score < params["conservative_low_points"]:
             self.thinking_message = "SCORE TOO LOW - ONE MORE ROLL"
             return "ROLL"
-        elif bust_risk > 0.5:
+        elif bust_risk > params["conservative_max_bust_risk"]:
             self.thinking_message = f"BANKING {virtual_score} POINTS - TOO RISKY TO CONTINUE"
             return "BANK"
         else:
             self.thinking_message = "ONE MORE CALCULATED ROLL"
-            return "ROLL" if random.random() > 0.6 else "BANK"
+            # Drawn as "random > 1 - chance" so seeded games replay exactly as before tuning
+            return "ROLL" if self.game_state.bot_rng.random() > 1 - params["conservative_roll_chance"] else "BANK"
 
     def balanced_decision(self, virtual_score, remaining_dice, bust_risk):
         """Balanced strategy in close race"""
-        if virtual_score >= 500:
-            if bust_risk > 0.6:
+        params = self.params
+        if virtual_score >= params["balanced_push_points"]:
+            if bust_risk > params["balanced_max_bust_risk"]:
                 self.thinking_message = f"BANKING {virtual_score} POINTS IN CLOSE RACE"
                 return "BANK"
             else:
                 self.thinking_message = "PUSHING FOR MORE IN CLOSE RACE"
-                return "ROLL" if random.random() > 0.5 else "BANK"
+                return "ROLL" if self.game_state.bot_rng.random() > 1 - params["balanced_push_chance"] else "BANK"
         elif remaining_dice >= 4:
             self.thinking_message = f"ROLLING AGAIN WITH {remaining_dice} DICE"
             return "ROLL"
         elif remaining_dice >= 2:
-            roll_chance = 0.7 if virtual_score < 350 else 0.4
-            decision = "ROLL" if random.random() < roll_chance else "BANK"
+            if virtual_score < params["balanced_low_points"]:
+                roll_chance = params["balanced_low_roll_chance"]
+            else:
+                roll_chance = params["balanced_high_roll_chance"]
+            decision = "ROLL" if self.game_state.bot_rng.random() < roll_chance else "BANK"
             self.thinking_message = f"{'ROLLING' if decision == 'ROLL' else 'BANKING'} WITH {remaining_dice} DICE AND {virtual_score} POINTS"
             return decision
         else:
@@ -257,24 +481,26 @@ class BotAI:
         """Aggressive strategy when behind"""
         position = self.get_position_analysis()
         points_behind = abs(position["lead_amount"])
+        params = self.params
         
-        if virtual_score >= 700:
+        if virtual_score >= params["aggressive_bank_points"]:
             self.thinking_message = f"GREAT SCORE OF {virtual_score} - BANKING TO CATCH UP"
             return "BANK"
         elif remaining_dice >= 3:
             self.thinking_message = f"BEHIND BY {points_behind} - TAKING RISKS TO CATCH UP"
             return "ROLL"
         elif remaining_dice == 2:
-            if virtual_score < 400:
+            if virtual_score < params["aggressive_two_dice_points"]:
                 self.thinking_message = "NEED MORE POINTS - ROLLING WITH 2 DICE"
-                return "ROLL" if random.random() < 0.6 else "BANK"
+                return "ROLL" if self.game_state.bot_rng.random() < params["aggressive_two_dice_chance"] else "BANK"
             else:
                 self.thinking_message = f"BANKING {virtual_score} POINTS"
                 return "BANK"
         else:
-            if virtual_score < 300 and points_behind > 1000:
+            if (virtual_score < params["aggressive_desperate_points"]
+                    and points_behind > params["aggressive_desperate_deficit"]):
                 self.thinking_message = "DESPERATE SITUATION - RISKING ONE DIE ROLL"
-                return "ROLL" if random.random() < 0.3 else "BANK"
+                return "ROLL" if self.game_state.bot_rng.random() < params["aggressive_desperate_chance"] else "BANK"
             else:
                 self.thinking_message = f"BANKING {virtual_score} POINTS"
                 return "BANK"
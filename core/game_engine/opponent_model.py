@@ -0,0 +1,253 @@
+"""
+OPPONENT MODEL MODULE
+Learns how each human player banks and stashes, for the adaptive HARD GO-BOT.
+
+GameStateManager reports every human decision as it happens:
+
+- rolling on while the turn could have been banked (and for how many points)
+- banking (and for how many points)
+- which dice were stashed, compared with the expected-points policy
+
+Each player's profile keeps only sufficient statistics: fixed-size histograms
+of the turn points at which they banked or rolled on, plus counters. Every
+observation is an O(1) update. The bank threshold that best separates their
+banks from their roll-ons is derived from the histograms on demand and cached
+until the next observation.
+
+The HARD bot plays a best response (see win_model.get_best_response) against
+a leading human's estimated threshold. Profiles are saved as JSON in the
+user's home directory when a game ends and when the program exits (never
+between turns), and picked up again in the next session.
+"""
+
+import atexit
+import json
+import os
+from typing import Dict, List, Optional
+
+from core.game_engine.bot_policy import get_policy
+from games.livedice_f.livedice_f_dice_hand import DiceHand
+
+PROFILE_VERSION = 1
+DEFAULT_PROFILE_PATH = os.path.join(os.path.expanduser("~"), ".livedice", "opponent_profiles.json")
+
+# Turn points are binned in THRESHOLD_STEP steps; the last bin is open-ended
+THRESHOLD_STEP = 50
+THRESHOLD_BINS = 60
+# Bank/roll decisions needed before a threshold estimate is trusted
+MIN_DECISIONS = 12
+
+
+class PlayerProfile:
+    """Sufficient statistics of one player's bank and stash decisions"""
+
+    __slots__ = ("bank_bins", "roll_bins", "banks", "roll_ons", "bank_points", "busts",
+                 "stashes", "policy_stashes", "_threshold")
+
+    def __init__(self):
+        self.bank_bins = [0] * THRESHOLD_BINS
+        self.roll_bins = [0] * THRESHOLD_BINS
+        self.banks = 0
+        self.roll_ons = 0
+        self.bank_points = 0
+        self.busts = 0
+        self.stashes = 0
+        # Stashes that matched the expected-points policy's choice
+        self.policy_stashes = 0
+        self._threshold: Optional[int] = None
+
+    @staticmethod
+    def _bin(points: int) -> int:
+        return min(max(points, 0) // THRESHOLD_STEP, THRESHOLD_BINS - 1)
+
+    # ========================================================================
+    # OBSERVATIONS (O(1) each)
+    # ========================================================================
+
+    def record_bank(self, turn_points: int):
+        self.bank_bins[self._bin(turn_points)] += 1
+        self.banks += 1
+        self.bank_points += turn_points
+        self._threshold = None
+
+    def record_roll_on(self, turn_points: int):
+        self.roll_bins[self._bin(turn_points)] += 1
+        self.roll_ons += 1
+        self._threshold = None
+
+    def record_bust(self):
+        self.busts += 1
+
+    def record_stash(self, matched_policy: bool):
+        self.stashes += 1
+        if matched_policy:
+            self.policy_stashes += 1
+
+    # ========================================================================
+    # ESTIMATES
+    # ========================================================================
+
+    @property
+    def decisions(self) -> int:
+        return self.banks + self.roll_ons
+
+    @property
+    def bank_threshold(self) -> int:
+        """
+        Turn points from which this player banks.
+
+        The threshold minimizing banks below it plus roll-ons at or above it,
+        found with one pass over the fixed-size histograms.
+        """
+        if self._threshold is None:
+            errors = sum(self.roll_bins)  # threshold 0: every roll-on is a mistake
+            best_errors, best_bin = errors, 0
+            for index in range(1, THRESHOLD_BINS):
+                errors += self.bank_bins[index - 1] - self.roll_bins[index - 1]
+                if errors < best_errors:
+                    best_errors, best_bin = errors, index
+            self._threshold = best_bin * THRESHOLD_STEP
+        return self._threshold
+
+    @property
+    def policy_agreement(self) -> float:
+        """Share of stashes that matched the expected-points policy"""
+        return self.policy_stashes / self.stashes if self.stashes else 0.0
+
+    # ========================================================================
+    # SERIALIZATION
+    # ========================================================================
+
+    def to_dict(self) -> dict:
+        return {
+            "bank_bins": self.bank_bins,
+            "roll_bins": self.roll_bins,
+            "banks": self.banks,
+            "roll_ons": self.roll_ons,
+            "bank_points": self.bank_points,
+            "busts": self.busts,
+            "stashes": self.stashes,
+            "policy_stashes": self.policy_stashes,
+        }
+
+    @classmethod
+    def from_dict(cls, data: dict) -> "PlayerProfile":
+        profile = cls()
+        for name in ("bank_bins", "roll_bins"):
+            values = list(data.get(name, []))[:THRESHOLD_BINS]
+            setattr(profile, name, values + [0] * (THRESHOLD_BINS - len(values)))
+        for name in ("banks", "roll_ons", "bank_points", "busts", "stashes", "policy_stashes"):
+            setattr(profile, name, int(data.get(name, 0)))
+        return profile
+
+    def __repr__(self):
+        return (f"PlayerProfile(decisions={self.decisions}, bank_threshold={self.bank_threshold}, "
+                f"policy_agreement={self.policy_agreement:.2f})")
+
+
+class OpponentModel:
+    """Profiles of every observed player, persisted between sessions"""
+
+    def __init__(self, path: Optional[str] = DEFAULT_PROFILE_PATH):
+        """
+        Args:
+            path: JSON file the profiles are loaded from and saved to (None = memory only)
+        """
+        self.path = path
+        self.profiles: Dict[str, PlayerProfile] = {}
+        self.dirty = False
+        self.load()
+
+    def copy(self) -> "OpponentModel":
+        """In-memory copy of the profiles (path None): what the copy learns is never saved"""
+        model = OpponentModel(None)
+        model.profiles = {name: PlayerProfile.from_dict(profile.to_dict()) for name, profile in self.profiles.items()}
+        return model
+
+    def profile(self, player_name: str) -> PlayerProfile:
+        profile = self.profiles.get(player_name)
+        if profile is None:
+            profile = self.profiles[player_name] = PlayerProfile()
+        return profile
+
+    # ========================================================================
+    # OBSERVATIONS
+    # ========================================================================
+
+    def observe_roll_on(self, player_name: str, turn_points: int):
+        """Player rolled again although they could have banked turn_points"""
+        self.profile(player_name).record_roll_on(turn_points)
+        self.dirty = True
+
+    def observe_bank(self, player_name: str, turn_points: int):
+        self.profile(player_name).record_bank(turn_points)
+        self.dirty = True
+
+    def observe_bust(self, player_name: str):
+        self.profile(player_name).record_bust()
+        self.dirty = True
+
+    def observe_stash(self, player_name: str, ruleset: str, dice_hand: DiceHand, dice_indices: List[int],
+                      stashed_count: int, carry_points: int):
+        """Player stashed dice_indices from dice_hand with stashed_count dice and carry_points already kept"""
+        policy_indices, _, _ = get_policy(ruleset).choose_stash(dice_hand, stashed_count, carry_points)
+        matched = dice_hand.select(dice_indices).key == dice_hand.select(policy_indices).key
+        self.profile(player_name).record_stash(matched)
+        self.dirty = True
+
+    def estimated_threshold(self, player_name: str) -> Optional[int]:
+        """Bank threshold of a player, or None until enough decisions were seen"""
+        profile = self.profiles.get(player_name)
+        if profile is None or profile.decisions < MIN_DECISIONS:
+            return None
+        return profile.bank_threshold
+
+    # ========================================================================
+    # PERSISTENCE
+    # ========================================================================
+
+    def load(self):
+        """Replace the profiles with the ones saved at path (missing or unreadable files are ignored)"""
+        if not self.path:
+            return
+        try:
+            with open(self.path, "r", encoding="utf-8") as handle:
+                data = json.load(handle)
+        except (OSError, ValueError):
+            return
+        if data.get("version") != PROFILE_VERSION:
+            return
+        self.profiles = {name: PlayerProfile.from_dict(entry) for name, entry in data.get("profiles", {}).items()}
+        self.dirty = False
+
+    def save(self):
+        """Write the profiles to path if anything changed"""
+        if not self.path or not self.dirty:
+            return
+        data = {
+            "version": PROFILE_VERSION,
+            "profiles": {name: profile.to_dict() for name, profile in self.profiles.items()},
+        }
+        try:
+            os.makedirs(os.path.dirname(self.path), exist_ok=True)
+            temporary = f"{self.path}.tmp"
+            with open(temporary, "w", encoding="utf-8") as handle:
+                json.dump(data, handle, separators=(",", ":"))
+            os.replace(temporary, self.path)
+        except OSError as error:
+            print(f"OpponentModel: could not save profiles to {self.path}: {error}")
+            return
+        self.dirty = False
+
+
+_model: Optional[OpponentModel] = None
+
+
+def get_opponent_model() -> OpponentModel:
+    """Process-wide opponent model, loaded from the default profile file on first use"""
+    global _model
+    if _model is None:
+        _model = OpponentModel()
+        # Games quit half way still keep what was learned
+        atexit.register(_model.save)
+    return _model
@@ -0,0 +1,145 @@
+"""
+POLICY STORE MODULE
+Versioned binary files for solved bot tables, read through mmap.
+
+A store file is a small fixed header, a JSON metadata block and a set of
+8-byte-aligned array sections:
+
+    magic "LDBT" | format version (uint16) | metadata length (uint32)
+    metadata JSON (kind, version, ruleset, fingerprint, ..., section table)
+    section data
+
+Opening a store maps the file read-only and returns zero-copy memoryviews
+over the sections, so loading is independent of table size and every process
+that opens the same file shares its pages through the OS page cache. Files
+are written to a temporary name and renamed into place, so a reader never
+maps a half-written table.
+"""
+
+import json
+import mmap
+import os
+import struct
+from array import array
+from typing import Dict, Iterable, Tuple, Union
+
+MAGIC = b"LDBT"
+FORMAT_VERSION = 1
+_HEADER = struct.Struct("<4sHI")
+_ALIGNMENT = 8
+
+Section = Union[array, bytes, bytearray]
+
+
+class StoreError(ValueError):
+    """A store file is missing, truncated or not in a supported format"""
+
+
+def _pad(length: int) -> int:
+    return -length % _ALIGNMENT
+
+
+def write_store(path: str, metadata: dict, sections: Dict[str, Section]) -> str:
+    """
+    Write metadata and array sections to a store file.
+
+    Args:
+        path: Destination file
+        metadata: JSON-serializable metadata (kind, version, fingerprint, ...)
+        sections: Named arrays; bytes sections are stored with typecode "B"
+
+    Returns:
+        The path written
+    """
+    layout = {}
+    payloads = []
+    offset = 0
+    for name, data in sections.items():
+        typecode = data.typecode if isinstance(data, array) else "B"
+        payload = data.tobytes() if isinstance(data, array) else bytes(data)
+        layout[name] = [offset, len(data), typecode]
+        payloads.append(payload + b"\0" * _pad(len(payload)))
+        offset += len(payloads[-1])
+
+    header_json = json.dumps(dict(metadata, sections=layout), separators=(",", ":")).encode("utf-8")
+    header_json += b" " * _pad(_HEADER.size + len(header_json))
+
+    os.makedirs(os.path.dirname(os.path.abspath(path)), exist_ok=True)
+    temporary = f"{path}.tmp{os.getpid()}"
+    with open(temporary, "wb") as handle:
+        handle.write(_HEADER.pack(MAGIC, FORMAT_VERSION, len(header_json)))
+        handle.write(header_json)
+        for payload in payloads:
+            handle.write(payload)
+    os.replace(temporary, path)
+    return path
+
+
+def _parse_header(buffer, path: str) -> Tuple[dict, int]:
+    if len(buffer) < _HEADER.size:
+        raise StoreError(f"{path}: truncated header")
+    magic, version, length = _HEADER.unpack_from(buffer, 0)
+    if magic != MAGIC or version != FORMAT_VERSION:
+        raise StoreError(f"{path}: not a version {FORMAT_VERSION} table store")
+    if len(buffer) < _HEADER.size + length:
+        raise StoreError(f"{path}: truncated metadata")
+    try:
+        metadata = json.loads(bytes(buffer[_HEADER.size:_HEADER.size + length]))
+    except ValueError as error:
+        raise StoreError(f"{path}: unreadable metadata") from error
+    if not isinstance(metadata, dict):
+        raise StoreError(f"{path}: metadata is not an object")
+    return metadata, _HEADER.size + length
+
+
+def read_store_metadata(path: str) -> dict:
+    """Metadata of a store file without mapping its sections"""
+    try:
+        with open(path, "rb") as handle:
+            head = handle.read(_HEADER.size)
+            length = _HEADER.unpack(head)[2] if len(head) == _HEADER.size else 0
+            return _parse_header(head + handle.read(length), path)[0]
+    except OSError as error:
+        raise StoreError(str(error)) from error
+
+
+def open_store(path: str, keys: Iterable[str] = (),
+               section_names: Iterable[str] = ()) -> Tuple[dict, Dict[str, memoryview]]:
+    """
+    Map a store file and return its metadata and section views.
+
+    The views keep the mapping alive; it is released once they are garbage
+    collected.
+
+    Args:
+        path: Store file
+        keys: Metadata keys the caller reads
+        section_names: Sections the caller reads
+
+    Raises:
+        StoreError: If the file is missing, truncated, of another format, or
+            lacks one of keys or section_names
+    """
+    try:
+        with open(path, "rb") as handle:
+            mapping = mmap.mmap(handle.fileno(), 0, access=mmap.ACCESS_READ)
+    except (OSError, ValueError) as error:
+        raise StoreError(f"{path}: {error}") from error
+    view = memoryview(mapping)
+    metadata, base = _parse_header(view, path)
+    sections = {}
+    try:
+        for name, (offset, count, typecode) in metadata.pop("sections").items():
+            itemsize = array(typecode).itemsize
+            start = base + offset
+            if offset < 0 or count < 0 or start + count * itemsize > len(view):
+                raise StoreError(f"{path}: section {name!r} is truncated")
+            sections[name] = view[start:start + count * itemsize].cast(typecode)
+    except StoreError:
+        raise
+    except (AttributeError, KeyError, TypeError, ValueError) as error:
+        raise StoreError(f"{path}: invalid section table ({error!r})") from error
+    missing = [key for key in keys if key not in metadata] + [name for name in section_names if name not in sections]
+    if missing:
+        raise StoreError(f"{path}: missing {', '.join(missing)}")
+    return metadata, sections
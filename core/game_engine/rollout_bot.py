@@ -0,0 +1,332 @@
+"""
+ROLLOUT BOT MODULE
+Monte Carlo rollout GO-BOT for benchmarking the table-based bots.
+
+At every decision the rollout bot lists its candidate actions (every legal
+stash subset followed by rolling on or banking, or plain ROLL against BANK)
+and estimates each one by simulating turn continuations with real dice. The
+continuation after the candidate is played by the expected-points policy
+table, so the estimate is an independent, sampled check of what the tables
+predict, and the bot itself plays a one-step improvement of the table policy.
+
+Rollouts run in batches on a ProcessPoolExecutor. Every worker loads the
+ruleset and policy once; batches are independent and seeded from their own
+DiceRNG stream, so throughput grows with the number of cores and results are
+reproducible for a fixed seed and batch count. The search keeps submitting
+batches until its time budget runs out and then returns the best candidate
+seen so far.
+
+    search = RolloutSearch("STANDARD", time_budget=2.0)
+    bot = RolloutBotAI(game_state, search=search)
+"""
+
+import math
+import os
+import time
+from concurrent.futures import FIRST_COMPLETED, ProcessPoolExecutor, wait
+from typing import Dict, List, Optional, Tuple
+
+from core.game_engine.bot_policy import get_policy, stash_options
+from core.game_engine.dice_rng import DiceRNG
+from core.game_engine.go_bot_ai import BotAI
+from games.livedice_f.livedice_f_dice_hand import MAX_DICE, DiceHand, pack_dice, unpack_counts
+from games.livedice_f.livedice_f_rulesets import get_ruleset
+
+DEFAULT_TIME_BUDGET = 1.0
+DEFAULT_BATCH_SIZE = 200
+
+# A rollout start: (dice to roll next, carried points, points banked now).
+# Starts with dice_count 0 bank immediately and are never simulated.
+RolloutStart = Tuple[int, int, int]
+
+
+# ============================================================================
+# ROLLOUTS
+# ============================================================================
+
+class _RolloutWorker:
+    """Per-process ruleset, policy and stash option cache"""
+
+    def __init__(self, ruleset: str):
+        self.ruleset = get_ruleset(ruleset)
+        self.policy = get_policy(self.ruleset.name)
+        self.options: Dict[int, list] = {}
+
+    def play_turn(self, rng: DiceRNG, dice_count: int, carry: int) -> int:
+        """Finish a turn with the policy table from rolling dice_count dice; returns banked points"""
+        options_cache = self.options
+        roll_value = self.policy.roll_value
+        while True:
+            key = pack_dice(rng.roll(dice_count))
+            options = options_cache.get(key)
+            if options is None:
+                options = options_cache[key] = stash_options(self.ruleset, tuple(unpack_counts(key)))
+            if not options:
+                return 0
+            best_value, best = -1.0, None
+            for gain, size, rest, _ in options:
+                dice_left = dice_count - size
+                if dice_left <= 0:
+                    value, bank = roll_value(MAX_DICE, carry + gain), -1
+                else:
+                    value = roll_value(dice_left, carry + gain)
+                    bank = carry + gain + rest
+                    if bank >= value:
+                        value = bank
+                    else:
+                        bank = -1
+                if value > best_value:
+                    best_value, best = value, (gain, dice_left, bank)
+            gain, dice_left, bank = best
+            if bank >= 0:
+                return bank
+            carry += gain
+            dice_count = dice_left or MAX_DICE
+
+    def run_batch(self, seed: int, batch: int, starts: List[RolloutStart], rollouts: int) -> List[Tuple[float, float]]:
+        """(sum, sum of squares) of banked points per start over rollouts simulated turns"""
+        results = []
+        for dice_count, carry, bank in starts:
+            if dice_count <= 0:
+                results.append((float(bank) * rollouts, float(bank) * bank * rollouts))
+                continue
+            # Every start replays the same dice stream (common random numbers),
+            # which makes the difference between candidates far less noisy
+            rng = DiceRNG(seed, f"rollout/{batch}")
+            total = squares = 0.0
+            for _ in range(rollouts):
+                points = self.play_turn(rng, dice_count, carry)
+                total += points
+                squares += points * points
+            results.append((total, squares))
+        return results
+
+
+_worker: Optional[_RolloutWorker] = None
+
+
+def _init_worker(ruleset: str):
+    global _worker
+    _worker = _RolloutWorker(ruleset)
+
+
+def _run_batch(seed: int, batch: int, starts: List[RolloutStart], rollouts: int) -> List[Tuple[float, float]]:
+    return _worker.run_batch(seed, batch, starts, rollouts)
+
+
+class RolloutEstimate:
+    """Sampled mean turn points of one candidate"""
+
+    __slots__ = ("samples", "total", "squares")
+
+    def __init__(self):
+        self.samples = 0
+        self.total = 0.0
+        self.squares = 0.0
+
+    @property
+    def mean(self) -> float:
+        return self.total / self.samples if self.samples else 0.0
+
+    @property
+    def stderr(self) -> float:
+        if self.samples < 2:
+            return math.inf
+        variance = max(0.0, self.squares / self.samples - self.mean ** 2)
+        return math.sqrt(variance / (self.samples - 1))
+
+    def __repr__(self):
+        return f"RolloutEstimate(mean={self.mean:.1f}, stderr={self.stderr:.1f}, samples={self.samples})"
+
+
+# ============================================================================
+# SEARCH
+# ============================================================================
+
+class RolloutSearch:
+    """Time-budgeted parallel rollout evaluation of candidate starts"""
+
+    def __init__(self, ruleset: str = "STANDARD", time_budget: float = DEFAULT_TIME_BUDGET,
+                 workers: Optional[int] = None, batch_size: int = DEFAULT_BATCH_SIZE, seed: Optional[int] = None):
+        """
+        Args:
+            ruleset: Game ruleset - "SIMPLE", "STANDARD", or "ADVANCED"
+            time_budget: Default seconds per evaluation
+            workers: Worker processes (default: all cores); 0 runs batches in this process
+            batch_size: Rollouts per candidate per batch
+            seed: Master seed for the rollout dice streams
+        """
+        self.ruleset = get_ruleset(ruleset).name
+        self.time_budget = time_budget
+        self.workers = (os.cpu_count() or 1) if workers is None else workers
+        self.batch_size = batch_size
+        self.rng = DiceRNG(seed, "rollout")
+        self._batches = 0
+        self._executor: Optional[ProcessPoolExecutor] = None
+        self._local: Optional[_RolloutWorker] = None
+
+    def _get_executor(self) -> ProcessPoolExecutor:
+        if self._executor is None:
+            self._executor = ProcessPoolExecutor(max_workers=self.workers, initializer=_init_worker,
+                                                 initargs=(self.ruleset,))
+        return self._executor
+
+    def _next_batch(self) -> int:
+        self._batches += 1
+        return self._batches
+
+    def _add(self, estimates: List[RolloutEstimate], results: List[Tuple[float, float]]):
+        for estimate, (total, squares) in zip(estimates, results):
+            estimate.samples += self.batch_size
+            estimate.total += total
+            estimate.squares += squares
+
+    def evaluate(self, starts: List[RolloutStart], time_budget: Optional[float] = None) -> List[RolloutEstimate]:
+        """
+        Estimate the expected banked points of every start until the budget runs out.
+
+        At least one batch is always completed, so every estimate has samples
+        even with a zero budget.
+        """
+        budget = self.time_budget if time_budget is None else time_budget
+        deadline = time.perf_counter() + budget
+        estimates = [RolloutEstimate() for _ in starts]
+        starts = list(starts)
+
+        if self.workers <= 0:
+            if self._local is None:
+                self._local = _RolloutWorker(self.ruleset)
+            while True:
+                self._add(estimates, self._local.run_batch(self.rng.seed, self._next_batch(), starts, self.batch_size))
+                if time.perf_counter() >= deadline:
+                    return estimates
+
+        executor = self._get_executor()
+        # Two batches in flight per worker keep every core busy while results come back
+        pending = {executor.submit(_run_batch, self.rng.seed, self._next_batch(), starts, self.batch_size)
+                   for _ in range(2 * self.workers)}
+        completed = 0
+        try:
+            while pending:
+                remaining = deadline - time.perf_counter()
+                done, pending = wait(pending, timeout=max(remaining, 0.0) if completed else None,
+                                     return_when=FIRST_COMPLETED)
+                for future in done:
+                    self._add(estimates, future.result())
+                    completed += 1
+                if time.perf_counter() >= deadline and completed:
+                    break
+                for _ in done:
+                    pending.add(executor.submit(_run_batch, self.rng.seed, self._next_batch(), starts, self.batch_size))
+        finally:
+            # Batches still running finish in the background and are discarded
+            for future in pending:
+                future.cancel()
+        return estimates
+
+    def close(self):
+        """Shut the worker pool down"""
+        if self._executor is not None:
+            self._executor.shutdown(wait=True, cancel_futures=True)
+            self._executor = None
+
+    def __enter__(self):
+        return self
+
+    def __exit__(self, exc_type, exc_value, traceback):
+        self.close()
+
+
+# ============================================================================
+# BOT
+# ============================================================================
+
+class RolloutBotAI(BotAI):
+    """GO-BOT that picks stashes and roll/bank decisions by Monte Carlo rollouts"""
+
+    def __init__(self, game_state, search: Optional[RolloutSearch] = None,
+                 time_budget: float = DEFAULT_TIME_BUDGET, workers: Optional[int] = None):
+        super().__init__(game_state)
+        self.search = search or RolloutSearch(game_state.ruleset, time_budget=time_budget, workers=workers,
+                                              seed=game_state.bot_rng.seed)
+        # Follow-up chosen together with the last stash ("ROLL" or "BANK")
+        self._follow_up: Optional[str] = None
+
+    def smart_stash_selection(self):
+        """Evaluate every legal stash (then roll or bank) and take the best estimate"""
+        hand = self.game_state.dice_hand
+        stashed_count = len(self.game_state.current_player.stashed_dice)
+        carry_points = self.get_carry_points()
+        ruleset = get_ruleset(self.game_state.ruleset)
+
+        candidates = []
+        starts: List[RolloutStart] = []
+        for gain, size, rest, stash_key in stash_options(ruleset, hand.counts, prune=False):
+            carry = carry_points + gain
+            dice_left = MAX_DICE - stashed_count - size
+            if dice_left <= 0:
+                candidates.append((stash_key, "ROLL"))
+                starts.append((MAX_DICE, carry, 0))
+                continue
+            candidates.append((stash_key, "ROLL"))
+            starts.append((dice_left, carry, 0))
+            candidates.append((stash_key, "BANK"))
+            starts.append((0, carry, carry + rest))
+        if not candidates:
+            self.thinking_message = "NO SCORING DICE AVAILABLE"
+            return "END_TURN"
+
+        estimates = self.search.evaluate(starts)
+        best = max(range(len(candidates)), key=lambda index: estimates[index].mean)
+        stash_key, follow_up = candidates[best]
+        to_stash = []
+        for face_index in range(6):
+            to_stash.extend(hand.face_indices[face_index][:(stash_key >> (3 * face_index)) & 0b111])
+        to_stash.sort()
+
+        self._follow_up = follow_up if stashed_count + len(to_stash) < MAX_DICE else None
+        self.thinking_message = (f"{len(candidates)} LINES, {estimates[best].samples} ROLLOUTS EACH - STASHING "
+                                 f"{len(to_stash)} DICE AND {follow_up}ING ({int(estimates[best].mean)} POINTS EXPECTED)")
+        self.game_state.selected_dice = to_stash
+        return "STASH"
+
+    def decide_roll_or_bank(self):
+        """Roll or bank by comparing the sampled value of rolling on with banking now"""
+        virtual_score = self.game_state.referee.calculate_turn_score()
+        remaining_dice = self.game_state.real_time_counters.rollcupdice_var
+        follow_up, self._follow_up = self._follow_up, None
+        if follow_up is not None:
+            self.thinking_message = f"{follow_up}ING AS PLANNED WITH {virtual_score} POINTS"
+            return follow_up
+
+        roll, = self.search.evaluate([(remaining_dice, self.get_carry_points(), 0)])
+        if roll.mean > virtual_score:
+            self.thinking_message = f"ROLLOUTS SAY ROLLING IS WORTH {int(roll.mean)} POINTS ({roll.samples} SAMPLES) - ROLLING"
+            return "ROLL"
+        self.thinking_message = f"BANKING {virtual_score} POINTS - ROLLOUTS SAY ROLLING IS WORTH {int(roll.mean)}"
+        return "BANK"
+
+
+def benchmark_hand(dice_values, ruleset: str = "STANDARD", stashed_count: int = 0, carry_points: int = 0,
+                   time_budget: float = DEFAULT_TIME_BUDGET, workers: Optional[int] = None) -> Dict[str, float]:
+    """
+    Rollout estimate next to the policy table's value for the table's chosen stash.
+
+    Returns:
+        {"table": value the policy table predicts, "rollout": sampled value, "stderr": sampling error}
+    """
+    hand = DiceHand.of(dice_values)
+    policy = get_policy(ruleset)
+    indices, roll_after, expected = policy.choose_stash(hand, stashed_count, carry_points)
+    if not indices:
+        return {"table": 0.0, "rollout": 0.0, "stderr": 0.0}
+    compiled = get_ruleset(ruleset)
+    carry = carry_points + compiled.partitions[hand.select(indices).key].score
+    dice_left = MAX_DICE - stashed_count - len(indices)
+    if roll_after:
+        start = (dice_left or MAX_DICE, carry, 0)
+    else:
+        start = (0, carry, carry + compiled.table[hand.without(indices).key].score)
+    with RolloutSearch(ruleset, time_budget=time_budget, workers=workers) as search:
+        estimate, = search.evaluate([start])
+    return {"table": expected, "rollout": estimate.mean, "stderr": estimate.stderr}
@@ -0,0 +1,404 @@
+"""
+TOURNAMENT MODULE
+Multi-process bot-vs-bot tournaments on the headless engine.
+
+A tournament plays N games of one lineup (e.g. HARD vs EASY, or three
+NORMAL bots) under one ruleset and endgoal. Seats rotate with the game
+number, so every entrant moves first equally often, and game g always
+plays seed base + g: any game of a run can be replayed on its own.
+
+Games are split into chunks spread over a ProcessPoolExecutor. Each chunk
+returns a TournamentStats; the parent merges them as they arrive and
+prints a running summary, then the full report:
+
+- win rate per entrant (ties split the win) with a Wilson 95% interval
+- average game length in turns, with a 95% interval
+- bust rate (share of turns that bust) and STASHSTASH starts per turn
+- final score mean with a 95% interval and its 10/50/90th percentiles
+
+Run it from the project root:
+
+    python livedice_sim.py --bots HARD EASY --games 100000
+"""
+
+import argparse
+import json
+import math
+import os
+import time
+from concurrent.futures import FIRST_COMPLETED, ProcessPoolExecutor, wait
+from typing import Dict, List, Optional, Sequence, Tuple
+
+from core.game_engine.bot_turn import play_game
+from core.game_engine.go_bot_ai import BotAI
+from core.game_state.game_observer import GameObserver
+from core.game_state.game_state import GameStateManager
+
+DIFFICULTIES = ("EASY", "NORMAL", "HARD")
+DEFAULT_CHUNK_GAMES = 200
+DEFAULT_REPORT_SECONDS = 5.0
+# Final scores are bucketed this coarsely for the percentiles
+SCORE_BUCKET = 50
+# z for two-sided 95% intervals
+Z_95 = 1.959964
+
+
+# ============================================================================
+# STATISTICS
+# ============================================================================
+
+def wilson_interval(successes: float, trials: float, z: float = Z_95) -> Tuple[float, float]:
+    """Wilson score interval of a binomial proportion"""
+    if trials <= 0:
+        return 0.0, 0.0
+    p = successes / trials
+    denominator = 1 + z * z / trials
+    center = (p + z * z / (2 * trials)) / denominator
+    margin = z * math.sqrt(p * (1 - p) / trials + z * z / (4 * trials * trials)) / denominator
+    return max(0.0, center - margin), min(1.0, center + margin)
+
+
+class RunningMean:
+    """Count, sum and sum of squares of a sample, mergeable across processes"""
+
+    __slots__ = ("count", "total", "squares")
+
+    def __init__(self):
+        self.count = 0
+        self.total = 0.0
+        self.squares = 0.0
+
+    def add(self, value: float):
+        self.count += 1
+        self.total += value
+        self.squares += value * value
+
+    def merge(self, other: "RunningMean"):
+        self.count += other.count
+        self.total += other.total
+        self.squares += other.squares
+
+    @property
+    def mean(self) -> float:
+        return self.total / self.count if self.count else 0.0
+
+    def margin(self, z: float = Z_95) -> float:
+        """Half width of the normal-approximation interval of the mean"""
+        if self.count < 2:
+            return 0.0
+        variance = max(0.0, (self.squares - self.total * self.total / self.count) / (self.count - 1))
+        return z * math.sqrt(variance / self.count)
+
+
+class EntrantStats:
+    """Results of one lineup entry over all games it played"""
+
+    __slots__ = ("games", "wins", "turns", "busts", "stash_stashes", "scores", "score_buckets")
+
+    def __init__(self):
+        self.games = 0
+        self.wins = 0.0
+        self.turns = 0
+        self.busts = 0
+        self.stash_stashes = 0
+        self.scores = RunningMean()
+        self.score_buckets: Dict[int, int] = {}
+
+    def merge(self, other: "EntrantStats"):
+        self.games += other.games
+        self.wins += other.wins
+        self.turns += other.turns
+        self.busts += other.busts
+        self.stash_stashes += other.stash_stashes
+        self.scores.merge(other.scores)
+        for bucket, count in other.score_buckets.items():
+            self.score_buckets[bucket] = self.score_buckets.get(bucket, 0) + count
+
+    def score_percentile(self, fraction: float) -> int:
+        """Final score below which `fraction` of the games ended (bucket resolution)"""
+        needed = fraction * self.scores.count
+        seen = 0
+        for bucket in sorted(self.score_buckets):
+            seen += self.score_buckets[bucket]
+            if seen >= needed:
+                return bucket * SCORE_BUCKET
+        return 0
+
+    def summary(self) -> dict:
+        low, high = wilson_interval(self.wins, self.games)
+        bust_low, bust_high = wilson_interval(self.busts, self.turns)
+        return {
+            "games": self.games,
+            "win_rate": self.wins / self.games if self.games else 0.0,
+            "win_rate_ci": [low, high],
+            "bust_rate": self.busts / self.turns if self.turns else 0.0,
+            "bust_rate_ci": [bust_low, bust_high],
+            "stash_stash_per_turn": self.stash_stashes / self.turns if self.turns else 0.0,
+            "score_mean": self.scores.mean,
+            "score_mean_margin": self.scores.margin(),
+            "score_p10": self.score_percentile(0.1),
+            "score_p50": self.score_percentile(0.5),
+            "score_p90": self.score_percentile(0.9),
+        }
+
+
+class TournamentStats:
+    """Aggregated results of a set of games; chunks merge into the run total"""
+
+    def __init__(self, lineup: Sequence[str]):
+        self.lineup = list(lineup)
+        self.games = 0
+        # Games that hit the turn limit without a winner
+        self.unfinished = 0
+        self.ties = 0
+        self.game_turns = RunningMean()
+        self.entrants = [EntrantStats() for _ in self.lineup]
+
+    def merge(self, other: "TournamentStats"):
+        self.games += other.games
+        self.unfinished += other.unfinished
+        self.ties += other.ties
+        self.game_turns.merge(other.game_turns)
+        for entrant, other_entrant in zip(self.entrants, other.entrants):
+            entrant.merge(other_entrant)
+
+    def entrant_names(self) -> List[str]:
+        return [f"{index + 1}:{difficulty}" for index, difficulty in enumerate(self.lineup)]
+
+    def summary(self) -> dict:
+        return {
+            "lineup": self.lineup,
+            "games": self.games,
+            "unfinished": self.unfinished,
+            "ties": self.ties,
+            "game_turns_mean": self.game_turns.mean,
+            "game_turns_margin": self.game_turns.margin(),
+            "entrants": {name: entrant.summary() for name, entrant in zip(self.entrant_names(), self.entrants)},
+        }
+
+
+# ============================================================================
+# GAMES
+# ============================================================================
+
+class _TurnCounter(GameObserver):
+    """Counts busts and STASHSTASH starts per player during one game"""
+
+    def __init__(self, players: int):
+        self.busts = [0] * players
+        self.stash_stashes = [0] * players
+
+    def on_dice_rolled(self, game_state, dice_values):
+        if game_state.bust_state:
+            self.busts[game_state.current_player_index] += 1
+
+    def on_bot_action(self, game_state, bot, decision):
+        if decision == "START_NEW_STASH":
+            self.stash_stashes[game_state.current_player_index] += 1
+
+
+def play_tournament_game(stats: TournamentStats, seed: int, ruleset: str = "STANDARD", endgoal: int = 4000):
+    """
+    Play game `seed` of the lineup and record it in stats.
+
+    The lineup is rotated by the seed, so entrant i sits in seat (i + seed) % players.
+    """
+    lineup = stats.lineup
+    players = len(lineup)
+    counter = _TurnCounter(players)
+    game = GameStateManager(counter, 0, players, endgoal=endgoal, ruleset=ruleset, seed=seed)
+    # seat -> entrant
+    seating = [(seat - seed) % players for seat in range(players)]
+    winner = play_game(game, [BotAI(game, difficulty=lineup[entrant]) for entrant in seating])
+
+    stats.games += 1
+    stats.game_turns.add(game.get_game_turns())
+    if winner is None:
+        stats.unfinished += 1
+    else:
+        best = winner.get_total_score()
+        leaders = [seat for seat, player in enumerate(game.players) if player.get_total_score() == best]
+        if len(leaders) > 1:
+            stats.ties += 1
+        for seat in leaders:
+            stats.entrants[seating[seat]].wins += 1.0 / len(leaders)
+
+    for seat, player in enumerate(game.players):
+        entrant = stats.entrants[seating[seat]]
+        score = player.get_total_score()
+        entrant.games += 1
+        entrant.turns += player.turn_count
+        entrant.busts += counter.busts[seat]
+        entrant.stash_stashes += counter.stash_stashes[seat]
+        entrant.scores.add(score)
+        bucket = score // SCORE_BUCKET
+        entrant.score_buckets[bucket] = entrant.score_buckets.get(bucket, 0) + 1
+
+
+def play_chunk(lineup: Sequence[str], seeds: Sequence[int], ruleset: str, endgoal: int) -> TournamentStats:
+    """Play a run of seeds and return their stats (worker entry point)"""
+    stats = TournamentStats(lineup)
+    for seed in seeds:
+        play_tournament_game(stats, seed, ruleset, endgoal)
+    return stats
+
+
+# ============================================================================
+# TOURNAMENT
+# ============================================================================
+
+class Tournament:
+    """Plays a lineup many times over worker processes and streams the running totals"""
+
+    def __init__(self, lineup: Sequence[str], ruleset: str = "STANDARD", endgoal: int = 4000,
+                 workers: Optional[int] = None, seed: int = 0, chunk_games: int = DEFAULT_CHUNK_GAMES):
+        """
+        Args:
+            lineup: Difficulty of every entrant, 2 to 6 of EASY / NORMAL / HARD
+            ruleset: Game ruleset - "SIMPLE", "STANDARD", or "ADVANCED"
+            endgoal: Points needed to win
+            workers: Worker processes (default: all cores); 0 plays games in this process
+            seed: Seed of the first game; game g plays seed + g
+            chunk_games: Games per worker task
+        """
+        self.lineup = [difficulty.upper() for difficulty in lineup]
+        for difficulty in self.lineup:
+            if difficulty not in DIFFICULTIES:
+                raise ValueError(f"Unknown difficulty: {difficulty}")
+        if not 2 <= len(self.lineup) <= 6:
+            raise ValueError(f"A lineup needs 2 to 6 bots, got {len(self.lineup)}")
+        self.ruleset = ruleset
+        self.endgoal = endgoal
+        self.workers = (os.cpu_count() or 1) if workers is None else workers
+        self.seed = seed
+        self.chunk_games = max(1, chunk_games)
+
+    def _chunks(self, games: int):
+        for start in range(0, games, self.chunk_games):
+            yield range(self.seed + start, self.seed + min(games, start + self.chunk_games))
+
+    def run(self, games: int, report=None, report_seconds: float = DEFAULT_REPORT_SECONDS) -> TournamentStats:
+        """
+        Play `games` games.
+
+        Args:
+            games: Number of games
+            report: Called as report(stats, elapsed_seconds) at most every
+                report_seconds while games are played
+            report_seconds: Interval between reports
+
+        Returns:
+            Stats of all games
+        """
+        stats = TournamentStats(self.lineup)
+        started = last_report = time.perf_counter()
+
+        def merge(chunk_stats: TournamentStats):
+            nonlocal last_report
+            stats.merge(chunk_stats)
+            now = time.perf_counter()
+            if report is not None and now - last_report >= report_seconds:
+                last_report = now
+                report(stats, now - started)
+
+        chunks = self._chunks(games)
+        if self.workers <= 0:
+            for seeds in chunks:
+                merge(play_chunk(self.lineup, seeds, self.ruleset, self.endgoal))
+            return stats
+
+        # A few tasks per worker in flight keeps the pool busy without queueing millions of futures
+        with ProcessPoolExecutor(max_workers=self.workers) as executor:
+            pending = set()
+            for seeds in chunks:
+                pending.add(executor.submit(play_chunk, self.lineup, seeds, self.ruleset, self.endgoal))
+                if len(pending) >= self.workers * 4:
+                    done, pending = wait(pending, return_when=FIRST_COMPLETED)
+                    for future in done:
+                        merge(future.result())
+            for future in pending:
+                merge(future.result())
+        return stats
+
+
+# ============================================================================
+# REPORTS
+# ============================================================================
+
+def format_progress(stats: TournamentStats, elapsed: float) -> str:
+    """One-line running summary"""
+    rate = stats.games / elapsed if elapsed > 0 else 0.0
+    parts = [f"{stats.games} games ({rate:.0f}/s)"]
+    for name, entrant in zip(stats.entrant_names(), stats.entrants):
+        low, high = wilson_interval(entrant.wins, entrant.games)
+        rate = entrant.wins / entrant.games if entrant.games else 0.0
+        parts.append(f"{name} {rate:.1%} [{low:.1%}, {high:.1%}]")
+    return " | ".join(parts)
+
+
+def format_report(stats: TournamentStats, elapsed: float) -> str:
+    """Full results table"""
+    summary = stats.summary()
+    rate = stats.games / elapsed if elapsed > 0 else 0.0
+    lines = [
+        f"{' vs '.join(stats.lineup)}: {stats.games} games in {elapsed:.1f}s ({rate:.0f} games/s, "
+        f"{rate * 3600:,.0f} games/h)",
+        f"game length {summary['game_turns_mean']:.2f} +/- {summary['game_turns_margin']:.2f} turns, "
+        f"{stats.ties} ties, {stats.unfinished} unfinished",
+        f"{'ENTRANT':<10} {'WIN RATE':>24} {'BUST RATE':>24} {'STASHSTASH':>11} "
+        f"{'SCORE':>16} {'P10':>6} {'P50':>6} {'P90':>6}",
+    ]
+    for name, entrant in summary["entrants"].items():
+        win_low, win_high = entrant["win_rate_ci"]
+        bust_low, bust_high = entrant["bust_rate_ci"]
+        lines.append(
+            f"{name:<10} "
+            f"{entrant['win_rate']:>7.2%} [{win_low:>6.2%}, {win_high:>6.2%}] "
+            f"{entrant['bust_rate']:>7.2%} [{bust_low:>6.2%}, {bust_high:>6.2%}] "
+            f"{entrant['stash_stash_per_turn']:>11.4f} "
+            f"{entrant['score_mean']:>7.0f} +/- {entrant['score_mean_margin']:<5.0f} "
+            f"{entrant['score_p10']:>6} {entrant['score_p50']:>6} {entrant['score_p90']:>6}"
+        )
+    return "\n".join(lines)
+
+
+# ============================================================================
+# MAIN
+# ============================================================================
+
+def main(argv=None):
+    parser = argparse.ArgumentParser(description="Play bot-vs-bot LIVEDICE tournaments without a window")
+    parser.add_argument("--bots", nargs="+", default=["HARD", "HARD"], type=str.upper,
+                        help="Difficulty of every bot in the lineup, e.g. --bots HARD EASY NORMAL")
+    parser.add_argument("--games", type=int, default=10000, help="Games to play")
+    parser.add_argument("--ruleset", default="STANDARD", help="Game ruleset")
+    parser.add_argument("--endgoal", type=int, default=4000, help="Points needed to win")
+    parser.add_argument("--workers", type=int, help="Worker processes (default: all cores, 0 = no pool)")
+    parser.add_argument("--seed", type=int, default=0, help="Seed of the first game")
+    parser.add_argument("--chunk", type=int, default=DEFAULT_CHUNK_GAMES, help="Games per worker task")
+    parser.add_argument("--report-every", type=float, default=DEFAULT_REPORT_SECONDS,
+                        help="Seconds between running summaries")
+    parser.add_argument("--json", help="Also write the final results to this JSON file")
+    args = parser.parse_args(argv)
+
+    try:
+        tournament = Tournament(args.bots, args.ruleset, args.endgoal, args.workers, args.seed, args.chunk)
+    except ValueError as error:
+        parser.error(str(error))
+
+    started = time.perf_counter()
+    stats = tournament.run(args.games, report=lambda stats, elapsed: print(format_progress(stats, elapsed), flush=True),
+                           report_seconds=args.report_every)
+    elapsed = time.perf_counter() - started
+    print(format_report(stats, elapsed))
+
+    if args.json:
+        summary = dict(stats.summary(), ruleset=args.ruleset, endgoal=args.endgoal, seed=args.seed,
+                       seconds=round(elapsed, 3))
+        with open(args.json, "w", encoding="utf-8") as handle:
+            json.dump(summary, handle, indent=2)
+            handle.write("\n")
+
+
+if __name__ == "__main__":
+    main()
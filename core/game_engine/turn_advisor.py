@@ -0,0 +1,120 @@
+"""
+TURN ADVISOR MODULE
+Live expected-value advice for the player whose turn it is.
+
+For the current turn state the advisor reports:
+
+- the exact chance that the next roll busts (roll odds tables)
+- the expected points banked this turn when rolling on, playing the rest of
+  the turn optimally (expected-points policy table)
+- the points banked when banking now
+- the best action and the stash the policy would take from this roll
+
+While dice are selected, rolling and banking are evaluated as if the
+selection were stashed, so the advice follows the selection as the player
+clicks dice. Everything is a handful of table lookups, and the last result
+is kept per turn state, so the UI can ask for advice every frame.
+"""
+
+from typing import List, Optional, Tuple
+
+from core.game_engine.bot_policy import get_policy
+from games.livedice_f.livedice_f_dice_hand import MAX_DICE
+from games.livedice_f.livedice_f_odds import get_bust_probability
+from games.livedice_f.livedice_f_rules import GameStateEnum
+from games.livedice_f.livedice_f_rulesets import get_ruleset
+
+# No advice while a turn summary or the end of the game is on screen
+_IDLE_STATES = frozenset((
+    GameStateEnum.BUST_TURN_SUMMARY,
+    GameStateEnum.BANKED_TURN_SUMMARY,
+    GameStateEnum.END_GAME_SUMMARY,
+))
+
+
+class Advice:
+    """Expected values of rolling on and banking for one turn state"""
+
+    __slots__ = ("bust_chance", "roll_value", "bank_value", "best_action", "best_stash", "best_value")
+
+    def __init__(self, bust_chance: float, roll_value: float, bank_value: int,
+                 best_stash: List[int], best_value: float):
+        # Chance the next roll (after the selection, if any) scores nothing
+        self.bust_chance = bust_chance
+        self.roll_value = roll_value
+        self.bank_value = bank_value
+        self.best_action = "ROLL" if roll_value > bank_value else "BANK"
+        # Dice values of the best stash from this roll, empty once stashed
+        self.best_stash = best_stash
+        # Expected points of the best stash followed by the best action
+        self.best_value = best_value
+
+    def __repr__(self):
+        return (f"Advice(bust_chance={self.bust_chance:.3f}, roll_value={self.roll_value:.1f}, "
+                f"bank_value={self.bank_value}, best_action={self.best_action!r}, best_stash={self.best_stash})")
+
+
+class TurnAdvisor:
+    """Advice for a GameStateManager's current turn, cached per turn state"""
+
+    def __init__(self, game_state):
+        self.game_state = game_state
+        self._key: Optional[tuple] = None
+        self._advice: Optional[Advice] = None
+
+    def _state_key(self) -> tuple:
+        game_state = self.game_state
+        player = game_state.current_player
+        return (game_state.current_player_index, game_state.current_game_state, game_state.dice_hand.key,
+                tuple(sorted(game_state.selected_dice)), len(player.stashed_dice), player.get_stash_score(),
+                player.stash_stash, player.stashed_dice_this_roll, game_state.ruleset)
+
+    def get_advice(self) -> Optional[Advice]:
+        """Advice for the current turn state, or None between turns"""
+        if self.game_state.current_game_state in _IDLE_STATES or self.game_state.referee.is_turn_over():
+            return None
+        key = self._state_key()
+        if key != self._key:
+            self._advice = self._compute()
+            self._key = key
+        return self._advice
+
+    def _after_stash(self, indices: List[int], stashed_count: int, carry: int) -> Tuple[int, int, int]:
+        """(dice to roll next, points carried, points banked) after stashing indices from the table"""
+        hand = self.game_state.dice_hand
+        ruleset = get_ruleset(self.game_state.ruleset)
+        partition = ruleset.solve_stash(hand.select(indices))
+        carry += partition.score
+        dice_left = MAX_DICE - stashed_count - partition.dice_used
+        bank = carry + ruleset.calculate_score(hand.without(indices))
+        return dice_left if dice_left > 0 else MAX_DICE, carry, bank
+
+    def _compute(self) -> Advice:
+        game_state = self.game_state
+        player = game_state.current_player
+        policy = get_policy(game_state.ruleset)
+        hand = game_state.dice_hand
+        stashed_count = len(player.stashed_dice)
+        carry = player.get_stash_score() + player.stash_stash
+
+        best_stash, best_value = [], 0.0
+        must_stash = len(hand) > 0 and not player.stashed_dice_this_roll
+        if must_stash:
+            indices, _, best_value = policy.choose_stash(hand, stashed_count, carry)
+            best_stash = hand.select(indices).to_list()
+
+        if game_state.selected_dice:
+            dice_left, carry_after, bank = self._after_stash(game_state.selected_dice, stashed_count, carry)
+        elif must_stash and best_stash:
+            dice_left, carry_after, bank = self._after_stash(indices, stashed_count, carry)
+        else:
+            dice_left = MAX_DICE - stashed_count
+            if dice_left <= 0:
+                dice_left = MAX_DICE
+            carry_after = carry
+            bank = carry + get_ruleset(game_state.ruleset).calculate_score(hand)
+
+        roll = policy.roll_value(dice_left, carry_after)
+        if not must_stash:
+            best_value = max(roll, bank)
+        return Advice(get_bust_probability(dice_left, game_state.ruleset), roll, bank, best_stash, best_value)
@@ -0,0 +1,301 @@
+"""
+TURN STATE MODULE
+Immutable turn states for bot lookahead.
+
+A TurnState is the part of a game a search needs: the dice on the table,
+the current stash and STASHSTASH, whether the player stashed this roll, the
+phase of the turn and every player's banked score. apply(action) returns a
+new state and never touches the one it came from, the GameStateManager or
+its MessageManager, so a search can branch as often as it likes:
+
+    state = TurnState.from_game(game_state)
+    for probability, rolled in state.roll_outcomes():
+        stashed = rolled.apply("STASH", rolled.stashable_indices())
+
+Children share everything that did not change with their parent (the
+immutable DiceHand, the score tuple, the compiled ruleset) and keep a link
+to it, so a path costs one small object per action and history() recovers
+the actions that led to a state.
+
+Actions follow the rules as the engine applies them (same scoring, same
+stash solver, same bank value including scoring dice left on the table),
+without the UI states in between:
+
+    ROLL              dice values as argument (dice_to_roll of them)
+    STASH             dice indices (default: every stashable die)
+    BANK              bank turn_points
+    START_NEW_STASH   move a full stash to the STASHSTASH
+    END_TURN          after a bank or bust, the next player's turn starts
+"""
+
+from typing import FrozenSet, Iterable, List, Optional, Tuple
+
+from games.livedice_f.livedice_f_dice_hand import MAX_DICE, DiceHand
+from games.livedice_f.livedice_f_odds import multiset_outcomes
+from games.livedice_f.livedice_f_rules import GameStateEnum
+from games.livedice_f.livedice_f_rulesets import get_ruleset
+
+# Turn phases
+READY = "READY"        # the next action is a roll (turn start, new stash), or a bank after a new stash
+ROLLED = "ROLLED"      # dice are on the table
+BANKED = "BANKED"
+BUST = "BUST"
+
+_EMPTY_HAND = DiceHand()
+
+# Engine states in which the next action is a roll of fresh dice
+_READY_STATES = frozenset((
+    GameStateEnum.NEXTUP_READYUP,
+    GameStateEnum.START_TURN,
+    GameStateEnum.NEW_STASH,
+    GameStateEnum.STASHCHOICE_STASHED_FULL_READY_TO_ROLL,
+))
+
+# Ready states reached by moving a full stash; the stash still counts as
+# stashed this roll there, so the STASHSTASH can be banked without rolling
+_NEW_STASH_STATES = frozenset((
+    GameStateEnum.NEW_STASH,
+    GameStateEnum.STASHCHOICE_STASHED_FULL_READY_TO_ROLL,
+))
+
+_FIELDS = ("ruleset", "hand", "stashed_count", "stash_points", "stash_stash", "stashed_this_roll",
+           "phase", "scores", "player", "parent", "action")
+
+
+class TurnState:
+    """Immutable turn state; apply(action) returns the next one"""
+
+    __slots__ = _FIELDS
+
+    def __init__(self, ruleset: str = "STANDARD", scores: Iterable[int] = (0, 0), player: int = 0,
+                 hand: Iterable[int] = (), stashed_count: int = 0, stash_points: int = 0, stash_stash: int = 0,
+                 stashed_this_roll: bool = False, phase: str = READY):
+        """
+        Build a root state (from_game builds one from a live game).
+
+        Args:
+            ruleset: Game ruleset - "SIMPLE", "STANDARD", or "ADVANCED"
+            scores: Banked score of every player
+            player: Index of the player whose turn it is
+            hand: Dice on the table
+            stashed_count: Dice in the current stash
+            stash_points: Points in the current stash
+            stash_stash: Points moved to the STASHSTASH this turn
+            stashed_this_roll: Whether the player stashed since the last roll
+            phase: READY, ROLLED, BANKED or BUST
+        """
+        _init(self, get_ruleset(ruleset), DiceHand.of(hand), stashed_count, stash_points, stash_stash,
+              stashed_this_roll, phase, tuple(scores), player, None, None)
+
+    @classmethod
+    def from_game(cls, game_state) -> "TurnState":
+        """State of the current turn of a GameStateManager"""
+        player = game_state.current_player
+        if game_state.bust_state:
+            phase = BUST
+        elif game_state.turn_banked:
+            phase = BANKED
+        elif game_state.current_game_state in _READY_STATES:
+            phase = READY
+        else:
+            phase = ROLLED
+        # Before a roll the dice left on the table and (except after a new
+        # stash) the stashed-this-roll flag are leftovers the roll replaces
+        ready = phase == READY
+        hand = _EMPTY_HAND if ready else game_state.dice_hand
+        stashed_this_roll = player.stashed_dice_this_roll and (
+            not ready or game_state.current_game_state in _NEW_STASH_STATES)
+        state = object.__new__(cls)
+        _init(state, get_ruleset(game_state.ruleset), hand, len(player.stashed_dice),
+              player.get_stash_score(), 0 if phase == BANKED else player.stash_stash,
+              stashed_this_roll, phase,
+              tuple(p.get_total_score() for p in game_state.players), game_state.current_player_index, None, None)
+        return state
+
+    # ========================================================================
+    # QUERIES
+    # ========================================================================
+
+    @property
+    def turn_points(self) -> int:
+        """Points banking would score now (table, stash and STASHSTASH)"""
+        if self.phase == BUST:
+            return 0
+        return self.ruleset.calculate_score(self.hand) + self.stash_points + self.stash_stash
+
+    @property
+    def dice_to_roll(self) -> int:
+        """Dice the next roll throws"""
+        if self.phase == READY:
+            return MAX_DICE
+        return MAX_DICE - self.stashed_count
+
+    def is_turn_over(self) -> bool:
+        return self.phase == BANKED or self.phase == BUST
+
+    def stashable_indices(self) -> List[int]:
+        """Indices of the dice on the table that can be stashed"""
+        return self.ruleset.get_stashable_dice(self.hand) if self.phase == ROLLED else []
+
+    def legal_actions(self) -> FrozenSet[str]:
+        """Actions apply accepts in this state"""
+        phase = self.phase
+        if phase == READY:
+            if self.stashed_this_roll and self.turn_points > 0:
+                return frozenset(("ROLL", "BANK"))
+            return frozenset(("ROLL",))
+        if phase != ROLLED:
+            return frozenset(("END_TURN",))
+        actions = []
+        if not self.ruleset.is_bust(self.hand):
+            actions.append("STASH")
+        if self.stashed_count >= MAX_DICE:
+            actions.append("START_NEW_STASH")
+        elif self.stashed_this_roll:
+            actions.append("ROLL")
+        if self.stashed_this_roll and self.turn_points > 0:
+            actions.append("BANK")
+        return frozenset(actions)
+
+    @property
+    def key(self) -> tuple:
+        """Transposition key: equal for the same situation whatever the dice order"""
+        return (self.hand.key, self.stashed_count, self.stash_points, self.stash_stash, self.stashed_this_roll,
+                self.phase, self.scores, self.player, self.ruleset.name)
+
+    def history(self) -> List[Tuple[str, object]]:
+        """(action, argument) pairs from the root to this state"""
+        actions = []
+        state = self
+        while state.parent is not None:
+            actions.append(state.action)
+            state = state.parent
+        actions.reverse()
+        return actions
+
+    # ========================================================================
+    # TRANSITIONS
+    # ========================================================================
+
+    def apply(self, action: str, argument=None) -> "TurnState":
+        """
+        State after action; this state is left unchanged.
+
+        Args:
+            action: ROLL, STASH, BANK, START_NEW_STASH or END_TURN
+            argument: Dice values for ROLL, dice indices for STASH
+
+        Raises:
+            ValueError: If the action is not legal here or its argument does not fit
+        """
+        if action not in self.legal_actions():
+            raise ValueError(f"Invalid action: {action} in turn phase {self.phase}")
+
+        if action == "ROLL":
+            if argument is None:
+                raise ValueError("ROLL needs the dice values")
+            hand = DiceHand.of(argument)
+            if len(hand) != self.dice_to_roll:
+                raise ValueError(f"Expected {self.dice_to_roll} dice, got {len(hand)}")
+            phase = BUST if self.ruleset.is_bust(hand) else ROLLED
+            stashed_count = 0 if self.phase == READY else self.stashed_count
+            return self._child(action, hand.values, hand, stashed_count, self.stash_points, self.stash_stash,
+                               False, phase, self.scores, self.player)
+
+        if action == "STASH":
+            indices = self.stashable_indices() if argument is None else list(argument)
+            hand = self.hand
+            partition = self.ruleset.solve_stash(hand.select(indices))
+            if not partition.combinations:
+                raise ValueError(f"Nothing to stash in {hand.select(indices).to_list()}")
+            # Selected dice that fit no combination stay on the table, as in stash_dice
+            if partition.dice_used < len(indices):
+                needed = [0] * 7
+                for _, _, combination_dice in partition.combinations:
+                    for value in combination_dice:
+                        needed[value] += 1
+                used = []
+                for index in indices:
+                    if needed[hand[index]] > 0:
+                        needed[hand[index]] -= 1
+                        used.append(index)
+                indices = used
+            return self._child(action, tuple(sorted(indices)), hand.without(indices),
+                               self.stashed_count + partition.dice_used, self.stash_points + partition.score,
+                               self.stash_stash, True, ROLLED, self.scores, self.player)
+
+        if action == "BANK":
+            scores = list(self.scores)
+            scores[self.player] += self.turn_points
+            # The STASHSTASH is paid out with the bank
+            return self._child(action, None, self.hand, self.stashed_count, self.stash_points, 0,
+                               self.stashed_this_roll, BANKED, tuple(scores), self.player)
+
+        if action == "START_NEW_STASH":
+            return self._child(action, None, _EMPTY_HAND, 0, 0, self.stash_stash + self.stash_points,
+                               True, READY, self.scores, self.player)
+
+        # END_TURN
+        return self._child(action, None, _EMPTY_HAND, 0, 0, 0, False, READY, self.scores,
+                           (self.player + 1) % len(self.scores))
+
+    def roll_outcomes(self) -> List[Tuple[float, "TurnState"]]:
+        """Every distinct roll from here (sorted dice) with its probability, busts included"""
+        dice_count = self.dice_to_roll
+        total = 6 ** dice_count
+        return [(ways / total, self.apply("ROLL", DiceHand.from_counts(counts)))
+                for counts, ways in multiset_outcomes(dice_count)]
+
+    def _child(self, action: str, argument, hand: DiceHand, stashed_count: int, stash_points: int,
+               stash_stash: int, stashed_this_roll: bool, phase: str, scores: Tuple[int, ...],
+               player: int) -> "TurnState":
+        child = object.__new__(TurnState)
+        _init(child, self.ruleset, hand, stashed_count, stash_points, stash_stash, stashed_this_roll, phase,
+              scores, player, self, (action, argument))
+        return child
+
+    # ========================================================================
+    # PROTOCOLS
+    # ========================================================================
+
+    def __setattr__(self, name, value):
+        raise AttributeError("TurnState is immutable")
+
+    def __delattr__(self, name):
+        raise AttributeError("TurnState is immutable")
+
+    def __copy__(self):
+        return self
+
+    def __deepcopy__(self, memo):
+        return self
+
+    def __eq__(self, other):
+        if isinstance(other, TurnState):
+            return self.key == other.key and self.hand == other.hand
+        return NotImplemented
+
+    def __hash__(self):
+        return hash(self.key)
+
+    def __repr__(self):
+        return (f"TurnState(phase={self.phase}, player={self.player}, hand={list(self.hand)}, "
+                f"stashed_count={self.stashed_count}, stash_points={self.stash_points}, "
+                f"stash_stash={self.stash_stash}, scores={list(self.scores)})")
+
+
+def _init(state: TurnState, ruleset, hand: DiceHand, stashed_count: int, stash_points: int, stash_stash: int,
+          stashed_this_roll: bool, phase: str, scores: Tuple[int, ...], player: int,
+          parent: Optional[TurnState], action: Optional[Tuple[str, object]]):
+    setter = object.__setattr__
+    setter(state, "ruleset", ruleset)
+    setter(state, "hand", hand)
+    setter(state, "stashed_count", stashed_count)
+    setter(state, "stash_points", stash_points)
+    setter(state, "stash_stash", stash_stash)
+    setter(state, "stashed_this_roll", stashed_this_roll)
+    setter(state, "phase", phase)
+    setter(state, "scores", scores)
+    setter(state, "player", player)
+    setter(state, "parent", parent)
+    setter(state, "action", action)
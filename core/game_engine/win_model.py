@@ -0,0 +1,554 @@
+"""
+WIN MODEL MODULE
+Win-probability endgame model for the HARD GO-BOT.
+
+Expected turn points (bot_policy) is the right objective early on, but near
+the endgoal the bot has to play the scoreboard: protect a lead, or chase a
+leader who is about to win. This module solves a heads-up Markov model of
+the whole game against the strongest opponent:
+
+- A chase table gives, for every dice count and points still needed, the
+  best probability of banking at least that many points this turn.
+- A family of turn strategies (the expected-points policy with a risk bonus,
+  and "roll until at least T turn points" chases) is turned into exact
+  turn-score distributions by forward propagation over the turn.
+- Scores are quantized into ENDGOAL / SCORE_BUCKETS buckets, and a dynamic
+  program over (my score, opponent score, seat) picks the strategy with the
+  best win probability. The seat follows the engine's end rule: the game
+  ends once someone is at the endgoal and every player has had the same
+  number of turns. The first mover of a round who reaches the endgoal gives
+  the opponent one final chase turn, scored exactly from the chase table;
+  the second mover who reaches it has won.
+
+Models are built per ruleset for the endgoals offered in the start menu,
+stored as one memory-mapped binary file per ruleset and endgoal next to the
+policy tables, and looked up with a few array reads. Regenerate with:
+
+    python -m core.game_engine.win_model [--ruleset NAME]
+"""
+
+import argparse
+import math
+import os
+import threading
+import time
+from array import array
+from typing import Dict, List, Optional, Tuple
+
+from core.game_engine.bot_policy import (
+    POLICY_DIR, get_policy, point_unit, roll_outcome_groups, ruleset_fingerprint, stash_options,
+)
+from core.game_engine.policy_store import StoreError, open_store, write_store
+from games.livedice_f.livedice_f_dice_hand import MAX_DICE, DiceHand
+from games.livedice_f.livedice_f_rulesets import RULESETS, get_ruleset
+
+WIN_MODEL_VERSION = 2
+ENDGOALS = (2000, 4000, 8000)
+SCORE_BUCKETS = 40
+MAX_CHASE_POINTS = 20000
+MAX_TURN_POINTS = 10000
+
+# Risk bonuses (points) for the expected-points policy and turn targets (points)
+# for chase strategies; together they are the turn strategies the model picks from.
+RISK_BONUSES = (-200, -100, 0, 100, 250, 500, 1000)
+CHASE_TARGETS = (
+    tuple(range(50, 1001, 50)) + tuple(range(1250, 4001, 250)) + tuple(range(4500, 8001, 500))
+)
+STRATEGIES: Tuple[Tuple[str, int], ...] = (
+    tuple(("EV", bonus) for bonus in RISK_BONUSES) + tuple(("CHASE", target) for target in CHASE_TARGETS)
+)
+
+_MIN_PROBABILITY = 1e-9
+
+
+# ============================================================================
+# TURN MODEL
+# ============================================================================
+
+def solve_chase_table(outcome_groups, max_units: int) -> List[array]:
+    """
+    Probability of banking at least d more units this turn when rolling n dice.
+
+    Every stash gains at least one unit, so the need only ever shrinks and one
+    sweep over increasing needs solves the table.
+
+    Returns:
+        chase[n][d] for n in 1..6 (index 0 unused) and d in 0..max_units
+    """
+    chase = [array("d", [0.0]) * (max_units + 1) for _ in range(MAX_DICE + 1)]
+    for need in range(max_units + 1):
+        for dice_count in range(1, MAX_DICE + 1):
+            total = 0.0
+            for probability, options in outcome_groups[dice_count]:
+                best = 0.0
+                for gain, dice_left, rest in options:
+                    if gain + rest >= need:
+                        best = 1.0
+                        break
+                    value = chase[dice_left or MAX_DICE][need - gain]
+                    if value > best:
+                        best = value
+                total += probability * best
+            chase[dice_count][need] = total
+    return chase
+
+
+def turn_distribution(strategy: Tuple[str, int], outcome_groups, roll_values: List[array],
+                      chase: List[array], unit: int, max_units: int) -> array:
+    """
+    Distribution of banked turn points for one turn strategy.
+
+    Args:
+        strategy: ("EV", risk bonus points) or ("CHASE", target turn points)
+        outcome_groups: Output of bot_policy.roll_outcome_groups
+        roll_values: Expected-points roll values in units, per dice count
+        chase: Chase table in units
+        unit: Point unit of the ruleset
+        max_units: Turn points are capped here
+
+    Returns:
+        Probabilities indexed by banked units; index 0 includes busts
+    """
+    kind, parameter = strategy
+    parameter_units = parameter / unit
+    value_cap = len(roll_values[1]) - 1
+    chase_cap = len(chase[1]) - 1
+    result = array("d", [0.0]) * (max_units + 1)
+    mass = [array("d", [0.0]) * (max_units + 1) for _ in range(MAX_DICE + 1)]
+    mass[MAX_DICE][0] = 1.0
+
+    for units in range(max_units + 1):
+        for dice_count in range(1, MAX_DICE + 1):
+            weight = mass[dice_count][units]
+            if weight < _MIN_PROBABILITY:
+                continue
+            survived = 0.0
+            for probability, options in outcome_groups[dice_count]:
+                survived += probability
+                best_value, best_bank, best_roll = -1.0, -1, None
+                for gain, dice_left, rest in options:
+                    carry = units + gain
+                    cup = dice_left or MAX_DICE
+                    if kind == "EV":
+                        roll = roll_values[cup][min(carry, value_cap)] + parameter_units
+                        if dice_left and carry + rest >= roll:
+                            value, bank, next_roll = carry + rest, carry + rest, None
+                        else:
+                            value, bank, next_roll = roll, -1, (cup, carry)
+                    else:
+                        need = parameter_units - units
+                        if dice_left and gain + rest >= need:
+                            value, bank, next_roll = 1.0, carry + rest, None
+                        else:
+                            value = chase[cup][min(max(0, math.ceil(need - gain)), chase_cap)]
+                            bank, next_roll = -1, (cup, carry)
+                    if value > best_value or (value == best_value and bank > best_bank):
+                        best_value, best_bank, best_roll = value, bank, next_roll
+                share = weight * probability
+                if best_roll is None:
+                    result[min(best_bank, max_units)] += share
+                else:
+                    cup, carry = best_roll
+                    if carry > max_units:
+                        result[max_units] += share
+                    else:
+                        mass[cup][carry] += share
+            result[0] += weight * (1.0 - survived)
+    return result
+
+
+# ============================================================================
+# WIN MODEL
+# ============================================================================
+
+# Seat of the player to move within the round, relative to the opponent
+FIRST = 0    # the opponent still moves this round (and gets a final turn)
+SECOND = 1   # the opponent has moved this round (reaching the endgoal wins)
+
+class WinModel:
+    """Quantized win probabilities and best turn strategies for one ruleset and endgoal"""
+
+    __slots__ = ("ruleset", "fingerprint", "endgoal", "buckets", "unit", "strategies", "win", "choice", "chase")
+
+    def __init__(self, ruleset: str, fingerprint: str, endgoal: int, buckets: int, unit: int,
+                 strategies: Tuple[Tuple[str, int], ...], win: array, choice: bytes, chase: List[array]):
+        self.ruleset = ruleset
+        self.fingerprint = fingerprint
+        self.endgoal = endgoal
+        self.buckets = buckets
+        self.unit = unit
+        self.strategies = strategies
+        # win[(seat * buckets + a) * buckets + b]: chance the player to move
+        # (score bucket a, FIRST or SECOND seat) beats the opponent (bucket b);
+        # choice holds the strategy index achieving it
+        self.win = win
+        self.choice = choice
+        self.chase = chase
+
+    def _index(self, my_score: int, opponent_score: int, seat: int) -> int:
+        buckets = self.buckets
+        my_bucket = min(my_score * buckets // self.endgoal, buckets - 1)
+        opponent_bucket = min(opponent_score * buckets // self.endgoal, buckets - 1)
+        return (seat * buckets + my_bucket) * buckets + opponent_bucket
+
+    def win_probability(self, my_score: int, opponent_score: int, seat: int = FIRST) -> float:
+        """Chance of winning when starting a turn at my_score against opponent_score from seat"""
+        return self.win[self._index(my_score, opponent_score, seat)]
+
+    def strategy(self, my_score: int, opponent_score: int, seat: int = FIRST) -> Tuple[str, int]:
+        """Best turn strategy from seat: ("EV", risk bonus) or ("CHASE", target turn points)"""
+        return self.strategies[self.choice[self._index(my_score, opponent_score, seat)]]
+
+    def chase_probability(self, dice_count: int, need_points: int) -> float:
+        """Best chance of banking at least need_points more this turn when rolling dice_count dice"""
+        if need_points <= 0:
+            need_points = 0
+        need = -(-need_points // self.unit)
+        values = self.chase[dice_count or MAX_DICE]
+        return values[need] if need < len(values) else 0.0
+
+    def choose_chase_stash(self, dice_values, stashed_count: int, need_points: int) -> Tuple[List[int], bool, float]:
+        """
+        Stash that maximizes the chance of banking need_points more this turn.
+
+        Returns:
+            Tuple (indices to stash, roll_after, success probability)
+        """
+        hand = DiceHand.of(dice_values)
+        best = (-1.0, -1, None, False)
+        for gain, size, rest, stash_key in stash_options(get_ruleset(self.ruleset), hand.counts):
+            dice_left = MAX_DICE - stashed_count - size
+            if dice_left > 0 and gain + rest >= need_points:
+                candidate = (1.0, gain + rest, stash_key, False)
+            else:
+                candidate = (self.chase_probability(max(dice_left, 0), need_points - gain), -1, stash_key, True)
+            if candidate[:2] > best[:2]:
+                best = candidate
+        probability, _, stash_key, roll_after = best
+        if stash_key is None:
+            return [], False, 0.0
+        indices = []
+        for face_index in range(6):
+            indices.extend(hand.face_indices[face_index][:(stash_key >> (3 * face_index)) & 0b111])
+        indices.sort()
+        return indices, roll_after, probability
+
+    def __repr__(self):
+        return f"WinModel(ruleset={self.ruleset!r}, endgoal={self.endgoal}, buckets={self.buckets})"
+
+
+def _bucket_distributions(distributions: List[array], unit: int, bucket_size: float, limit: int):
+    """Rebin turn distributions onto score buckets (split linearly between neighbours)"""
+    bucketed = []
+    for distribution in distributions:
+        weights: Dict[int, float] = {}
+        for units, probability in enumerate(distribution):
+            if probability < _MIN_PROBABILITY:
+                continue
+            position = units * unit / bucket_size
+            low = int(position)
+            fraction = position - low
+            low, high = min(low, limit), min(low + 1, limit)
+            weights[low] = weights.get(low, 0.0) + probability * (1.0 - fraction)
+            if fraction:
+                weights[high] = weights.get(high, 0.0) + probability * fraction
+        stay = weights.pop(0, 0.0)
+        bucketed.append((stay, sorted(weights.items())))
+    return bucketed
+
+
+def solve_win_model(ruleset: str, endgoal: int, distributions: List[array], chase: List[array],
+                    unit: int, buckets: int = SCORE_BUCKETS,
+                    opponent_distributions: Optional[List[array]] = None) -> WinModel:
+    """
+    Dynamic program over quantized (my score, opponent score, seat) for one endgoal.
+
+    W_s(a, b) = max over strategies of sum_x P(x) * V_s(a + x, b), where
+    V_s(a', b) = 1 - U_t(b, a') below the endgoal (t the other seat), and at
+    or above it 1 - P(opponent banks more than the gap in their final turn)
+    from the FIRST seat and 1 from the SECOND seat; U is the opponent's win
+    chance on their turn. Only busts and tiny banks keep the sum a + b
+    unchanged, so states are solved in decreasing order of a + b and each
+    W_s(a, b) / U_t(b, a) couple is iterated to a fixed point.
+
+    Without opponent_distributions the opponent plays as well as we do (U = W).
+    With them, the opponent picks among those distributions only, and the
+    result is our best response to that opponent.
+    """
+    bucket_size = endgoal / buckets
+    bucketed = _bucket_distributions(distributions, unit, bucket_size, 2 * buckets)
+    symmetric = opponent_distributions is None
+    opponent_bucketed = bucketed if symmetric else _bucket_distributions(
+        opponent_distributions, unit, bucket_size, 2 * buckets)
+    chase_six = chase[MAX_DICE]
+    chase_cap = len(chase_six) - 1
+
+    def terminal(my_bucket: int, opponent_bucket: int, seat: int) -> float:
+        if seat == SECOND:
+            return 1.0
+        gap_units = int((my_bucket - opponent_bucket) * bucket_size // unit) + 1
+        return 1.0 - (chase_six[gap_units] if gap_units <= chase_cap else 0.0)
+
+    cells = buckets * buckets
+    win = array("d", [0.0]) * (2 * cells)
+    choice = bytearray(2 * cells)
+    opponent_win = win if symmetric else array("d", [0.0]) * (2 * cells)
+
+    def continuation(options, my_bucket: int, opponent_bucket: int, seat: int,
+                     other_win: array) -> List[Tuple[float, float]]:
+        # (stay probability, value of every other outcome) per strategy
+        other = (1 - seat) * cells + opponent_bucket * buckets
+        terms = []
+        for stay, weights in options:
+            value = 0.0
+            for offset, probability in weights:
+                target = my_bucket + offset
+                if target >= buckets:
+                    value += probability * terminal(target, opponent_bucket, seat)
+                else:
+                    value += probability * (1.0 - other_win[other + target])
+            terms.append((stay, value))
+        return terms
+
+    def best(terms, opponent_value: float) -> Tuple[float, int]:
+        best_value, best_index = -1.0, 0
+        for index, (stay, value) in enumerate(terms):
+            total = stay * (1.0 - opponent_value) + value
+            if total > best_value:
+                best_value, best_index = total, index
+        return best_value, best_index
+
+    # With U = W the couple of (SECOND, a, b) is (FIRST, b, a), already solved
+    seats = (FIRST,) if symmetric else (FIRST, SECOND)
+    for total in range(2 * buckets - 2, -1, -1):
+        for my_bucket in range(max(0, total - buckets + 1), min(total, buckets - 1) + 1):
+            opponent_bucket = total - my_bucket
+            for seat in seats:
+                mine = continuation(bucketed, my_bucket, opponent_bucket, seat, opponent_win)
+                theirs = continuation(opponent_bucketed, opponent_bucket, my_bucket, 1 - seat, win)
+                my_win, their_win = 0.5, 0.5
+                for _ in range(200):
+                    new_mine, my_choice = best(mine, their_win)
+                    new_theirs, their_choice = best(theirs, new_mine)
+                    converged = abs(new_mine - my_win) < 1e-10 and abs(new_theirs - their_win) < 1e-10
+                    my_win, their_win = new_mine, new_theirs
+                    if converged:
+                        break
+                mine_index = seat * cells + my_bucket * buckets + opponent_bucket
+                theirs_index = (1 - seat) * cells + opponent_bucket * buckets + my_bucket
+                win[mine_index] = my_win
+                choice[mine_index] = my_choice
+                opponent_win[theirs_index] = their_win
+                if symmetric:
+                    choice[theirs_index] = their_choice
+
+    compiled = get_ruleset(ruleset)
+    return WinModel(compiled.name, ruleset_fingerprint(compiled), endgoal, buckets, unit,
+                    STRATEGIES, win, bytes(choice), chase)
+
+
+_turn_models: Dict[str, Tuple[int, List[array], List[array]]] = {}
+_turn_model_lock = threading.Lock()
+
+
+def turn_model(ruleset: str = "STANDARD") -> Tuple[int, List[array], List[array]]:
+    """
+    Per-ruleset inputs of the game model, computed once per process.
+
+    Returns:
+        Tuple (point unit, chase table, turn distribution per entry of STRATEGIES)
+    """
+    compiled = get_ruleset(ruleset)
+    with _turn_model_lock:
+        model = _turn_models.get(compiled.name)
+        if model is None:
+            unit = point_unit(compiled)
+            outcome_groups = roll_outcome_groups(compiled, unit)
+            chase = solve_chase_table(outcome_groups, MAX_CHASE_POINTS // unit)
+            policy = get_policy(compiled.name)
+            roll_values = [array("d", (value / unit for value in values)) for values in policy.roll_values]
+            distributions = [
+                turn_distribution(strategy, outcome_groups, roll_values, chase, unit, MAX_TURN_POINTS // unit)
+                for strategy in STRATEGIES
+            ]
+            model = _turn_models[compiled.name] = (unit, chase, distributions)
+    return model
+
+
+def solve_win_models(ruleset: str = "STANDARD", endgoals=ENDGOALS) -> Dict[int, WinModel]:
+    """Solve the chase table, strategy distributions and one WinModel per endgoal"""
+    name = get_ruleset(ruleset).name
+    unit, chase, distributions = turn_model(name)
+    return {endgoal: solve_win_model(name, endgoal, distributions, chase, unit) for endgoal in endgoals}
+
+
+# ============================================================================
+# BEST RESPONSE
+# ============================================================================
+
+def nearest_chase_target(points: float) -> int:
+    """CHASE_TARGETS entry closest to a bank threshold"""
+    return min(CHASE_TARGETS, key=lambda target: abs(target - points))
+
+
+def solve_best_response(ruleset: str, endgoal: int, opponent_target: int) -> WinModel:
+    """
+    Best response to an opponent who banks as soon as a turn reaches opponent_target points.
+
+    A threshold player is modelled by the matching CHASE strategy: bank once
+    the turn is worth the target, otherwise keep the dice that give the best
+    chance of reaching it.
+    """
+    name = get_ruleset(ruleset).name
+    unit, chase, distributions = turn_model(name)
+    opponent = distributions[STRATEGIES.index(("CHASE", nearest_chase_target(opponent_target)))]
+    return solve_win_model(name, endgoal, distributions, chase, unit, opponent_distributions=[opponent])
+
+
+# Solved responses; None marks a key whose solve failed, which then keeps
+# falling back to the generic model instead of being solved again
+_best_responses: Dict[Tuple[str, int, int], Optional[WinModel]] = {}
+_pending_best_responses: Dict[Tuple[str, int, int], threading.Thread] = {}
+# Why a background solve failed, until a caller reports it
+_best_response_failures: Dict[Tuple[str, int, int], str] = {}
+_best_response_lock = threading.Lock()
+
+
+def _best_response_key(ruleset: str, endgoal: int, opponent_target: int) -> Tuple[str, int, int]:
+    return get_ruleset(ruleset).name, endgoal, nearest_chase_target(opponent_target)
+
+
+def _solve_best_response_in_background(key: Tuple[str, int, int]):
+    try:
+        model = solve_best_response(*key)
+    except Exception as error:
+        model = None
+        with _best_response_lock:
+            _best_response_failures[key] = f"{type(error).__name__}: {error}"
+    with _best_response_lock:
+        _best_responses[key] = model
+        _pending_best_responses.pop(key, None)
+
+
+def get_best_response(ruleset: str, endgoal: int, opponent_target: int, wait: bool = False) -> Optional[WinModel]:
+    """
+    Cached best response to a threshold opponent.
+
+    A missing response is solved on a daemon thread and None is returned
+    until it is ready, so callers never stall a frame and quitting never
+    waits for a solve; wait=True solves it on the calling thread instead. A
+    solve that fails is cached as None: callers keep using the generic model
+    for that opponent, and pop_best_response_failure says why.
+    """
+    key = _best_response_key(ruleset, endgoal, opponent_target)
+    with _best_response_lock:
+        if key in _best_responses or key in _pending_best_responses:
+            return _best_responses.get(key)
+        if not wait:
+            solver = threading.Thread(target=_solve_best_response_in_background, args=(key,),
+                                      name=f"best-response-{key[0]}-{key[1]}-{key[2]}", daemon=True)
+            _pending_best_responses[key] = solver
+            solver.start()
+            return None
+    try:
+        model = solve_best_response(*key)
+    except Exception:
+        _best_responses[key] = None
+        raise
+    _best_responses[key] = model
+    return model
+
+
+def pop_best_response_failure(ruleset: str, endgoal: int, opponent_target: int) -> Optional[str]:
+    """Why the background solve of this best response failed, once; None if it did not (yet)"""
+    with _best_response_lock:
+        return _best_response_failures.pop(_best_response_key(ruleset, endgoal, opponent_target), None)
+
+
+# ============================================================================
+# STORAGE
+# ============================================================================
+
+_models: Dict[Tuple[str, int], WinModel] = {}
+
+
+def win_model_path(ruleset: str, endgoal: int, directory: Optional[str] = None) -> str:
+    return os.path.join(directory or POLICY_DIR, f"win_{ruleset.lower()}_{endgoal}.bin")
+
+
+def save_win_model(model: WinModel, directory: Optional[str] = None) -> str:
+    """Write one win model to its binary store file and return the path"""
+    metadata = {
+        "kind": "win_model",
+        "version": WIN_MODEL_VERSION,
+        "ruleset": model.ruleset,
+        "fingerprint": model.fingerprint,
+        "endgoal": model.endgoal,
+        "buckets": model.buckets,
+        "unit": model.unit,
+        "strategies": [list(strategy) for strategy in model.strategies],
+    }
+    chase = array("d")
+    for values in model.chase:
+        chase.extend(values)
+    sections = {"win": array("d", model.win), "choice": bytes(model.choice), "chase": chase}
+    return write_store(win_model_path(model.ruleset, model.endgoal, directory), metadata, sections)
+
+
+def load_win_model(ruleset: str, endgoal: int, directory: Optional[str] = None) -> Optional[WinModel]:
+    """Memory-mapped win model, or None if it is missing or does not match the current rules"""
+    compiled = get_ruleset(ruleset)
+    try:
+        metadata, sections = open_store(win_model_path(compiled.name, endgoal, directory),
+                                        ("kind", "version", "fingerprint", "buckets", "unit", "strategies"),
+                                        ("win", "choice", "chase"))
+    except StoreError:
+        return None
+    if (metadata["kind"] != "win_model" or metadata["version"] != WIN_MODEL_VERSION
+            or metadata["fingerprint"] != ruleset_fingerprint(compiled)):
+        return None
+    buckets, unit = metadata["buckets"], metadata["unit"]
+    win, choice, flat = sections["win"], sections["choice"], sections["chase"]
+    if (not isinstance(buckets, int) or not isinstance(unit, int) or buckets <= 0 or unit <= 0
+            or win.format != "d" or len(win) != 2 * buckets * buckets or len(choice) != len(win)
+            or flat.format != "d" or not flat or len(flat) % (MAX_DICE + 1)):
+        return None
+    try:
+        strategies = tuple((str(kind), int(parameter)) for kind, parameter in metadata["strategies"])
+    except (TypeError, ValueError):
+        return None
+    if not strategies or max(choice) >= len(strategies):
+        return None
+    width = len(flat) // (MAX_DICE + 1)
+    chase = [flat[row * width:(row + 1) * width] for row in range(MAX_DICE + 1)]
+    return WinModel(compiled.name, metadata["fingerprint"], endgoal, buckets, unit, strategies, win, choice, chase)
+
+
+def get_win_model(ruleset: str = "STANDARD", endgoal: int = 4000) -> WinModel:
+    """Win model for a ruleset and endgoal: cached, else mapped from disk, else solved"""
+    name = get_ruleset(ruleset).name
+    model = _models.get((name, endgoal))
+    if model is None:
+        model = load_win_model(name, endgoal) or solve_win_models(name, (endgoal,))[endgoal]
+        _models[(name, endgoal)] = model
+    return model
+
+
+def main(argv=None):
+    parser = argparse.ArgumentParser(description="Regenerate GO-BOT win-probability models")
+    parser.add_argument("--ruleset", action="append", help="Ruleset to solve (repeatable, default: all)")
+    parser.add_argument("--output", default=POLICY_DIR, help="Directory for the model files")
+    args = parser.parse_args(argv)
+
+    for ruleset in args.ruleset or RULESETS:
+        started = time.perf_counter()
+        models = solve_win_models(ruleset)
+        for model in models.values():
+            save_win_model(model, args.output)
+        summary = ", ".join(f"{goal}: {model.win_probability(0, 0):.3f}" for goal, model in models.items())
+        print(f"{get_ruleset(ruleset).name}: first-mover win chance {summary}; "
+              f"written to {args.output} in {time.perf_counter() - started:.1f}s")
+
+
+if __name__ == "__main__":
+    main()
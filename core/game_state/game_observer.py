@@ -0,0 +1,68 @@
+"""
+GAME OBSERVER MODULE
+Interface between the UI-free game engine and whatever presents it.
+
+GameStateManager, GameReferee and the headless bot loop (bot_turn) never
+call into a front end. They notify every registered observer instead, once
+the game state already reflects the event:
+
+    game_state.add_observer(observer)
+
+Every hook does nothing by default, so an observer only implements what it
+shows. The pygame UI animates rolls and moves stashed dice from the engine
+hooks and paces bot turns from the bot hooks; simulations and servers run
+with no observer at all.
+"""
+
+from typing import List
+
+
+class GameObserver:
+    """Receives game events; override the hooks you need"""
+
+    # ========================================================================
+    # ENGINE EVENTS
+    # ========================================================================
+
+    def on_turn_started(self, game_state):
+        """The current player started their turn without rolling yet (bots)"""
+
+    def on_dice_rolled(self, game_state, dice_values: List[int]):
+        """Dice were rolled (game_state.bust_state tells whether the roll busted)"""
+
+    def on_selection_changed(self, game_state, selected_dice: List[int]):
+        """The dice selected for stashing changed to selected_dice (indices)"""
+
+    def on_dice_stashed(self, game_state, dice_indices: List[int], stashed_dice: List[int], points: int):
+        """dice_indices (positions before removal) were stashed for points"""
+
+    def on_points_banked(self, game_state, points: int):
+        """The current player banked points"""
+
+    def on_new_stash_started(self, game_state):
+        """The current player moved a full stash to the STASHSTASH"""
+
+    def on_turn_ended(self, game_state):
+        """A turn was ended; game_state.current_player is already the next player"""
+
+    def on_log_updated(self, game_state):
+        """A legacy log entry was added"""
+
+    # ========================================================================
+    # BOT TURN EVENTS (see core.game_engine.bot_turn)
+    # ========================================================================
+
+    def on_bot_turn_started(self, game_state, bot):
+        """A bot starts playing the current player's turn"""
+
+    def on_bot_decision(self, game_state, bot, decision: str, thinking_message: str):
+        """The bot decided on an action, before it is performed"""
+
+    def on_bot_action(self, game_state, bot, decision: str):
+        """The bot's action was performed"""
+
+    def on_bot_action_rejected(self, game_state, bot, decision: str):
+        """The bot's action is not allowed right now and was skipped"""
+
+    def on_bot_turn_ended(self, game_state, bot, decisions: int, hit_limit: bool):
+        """The bot's turn is over (hit_limit: stopped by the decision limit)"""
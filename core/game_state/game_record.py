@@ -0,0 +1,329 @@
+"""
+GAME RECORD MODULE
+Append-only binary event log of a game, and deterministic replay.
+
+Every change to a GameStateManager comes from a handful of actions, so a
+game is fully described by its setup plus the actions in order. Every
+GameStateManager keeps a GameRecorder among its observers that appends
+each action to a bytearray as it happens:
+
+    header   magic "LDR", version, then human players, bot players and
+             endgoal as varints, the seed as a zigzag varint (seeds can be
+             negative), ruleset and bot difficulty as length-prefixed ASCII
+    events   one opcode byte (high nibble: action, low nibble: argument),
+             followed by the action's payload, if any
+
+    START_TURN        1 byte
+    ROLL              2-3 bytes: count in the low nibble, faces as a
+                      little-endian base-6 number (1 byte up to 3 dice)
+    SELECT            2 bytes: bitmask of the dice now selected
+    STASH             2 bytes: bitmask of the stashed dice indices
+    BANK              1 byte
+    START_NEW_STASH   1 byte: low nibble 1 when the referee's variant
+                      (human players) moved the stash
+    END_TURN          1 byte
+
+A game of 4000 points takes a few hundred bytes. replay_record feeds the
+events into a fresh engine, with recorded dice instead of the random
+stream, and returns it in the recorded end state. Many records go in one
+file with write_records / read_records (varint length-prefixed).
+"""
+
+from typing import BinaryIO, Iterator, List, Optional, Tuple
+
+from core.game_state.game_observer import GameObserver
+from games.livedice_f.livedice_f_rules import GameStateEnum
+
+RECORD_MAGIC = b"LDR"
+RECORD_VERSION = 2
+
+OP_START_TURN = 0x1
+OP_ROLL = 0x2
+OP_SELECT = 0x3
+OP_STASH = 0x4
+OP_BANK = 0x5
+OP_START_NEW_STASH = 0x6
+OP_END_TURN = 0x7
+
+_OP_NAMES = {
+    OP_START_TURN: "START_TURN",
+    OP_ROLL: "ROLL",
+    OP_SELECT: "SELECT",
+    OP_STASH: "STASH",
+    OP_BANK: "BANK",
+    OP_START_NEW_STASH: "START_NEW_STASH",
+    OP_END_TURN: "END_TURN",
+}
+
+
+class RecordError(ValueError):
+    """Raised for data that is not a valid game record"""
+
+
+# ============================================================================
+# ENCODING HELPERS
+# ============================================================================
+
+def write_varint(buffer: bytearray, value: int):
+    """Append a non-negative int as a LEB128 varint"""
+    while value >= 0x80:
+        buffer.append((value & 0x7F) | 0x80)
+        value >>= 7
+    buffer.append(value)
+
+
+def read_varint(data: bytes, offset: int) -> Tuple[int, int]:
+    """(value, offset after it) of the varint at offset"""
+    value = shift = 0
+    while True:
+        if offset >= len(data):
+            raise RecordError("Truncated varint")
+        byte = data[offset]
+        offset += 1
+        value |= (byte & 0x7F) << shift
+        if byte < 0x80:
+            return value, offset
+        shift += 7
+
+
+def write_signed_varint(buffer: bytearray, value: int):
+    """Append any int as a zigzag varint (0, -1, 1, -2, ... stored as 0, 1, 2, 3, ...)"""
+    write_varint(buffer, value << 1 if value >= 0 else (-value << 1) - 1)
+
+
+def read_signed_varint(data: bytes, offset: int) -> Tuple[int, int]:
+    """(value, offset after it) of the zigzag varint at offset"""
+    value, offset = read_varint(data, offset)
+    return (value >> 1) ^ -(value & 1), offset
+
+
+def write_text(buffer: bytearray, text: str):
+    """Append ASCII text, prefixed with its length"""
+    encoded = text.encode("ascii")
+    write_varint(buffer, len(encoded))
+    buffer.extend(encoded)
+
+
+def read_text(data: bytes, offset: int) -> Tuple[str, int]:
+    """(text, offset after it) of the text at offset"""
+    length, offset = read_varint(data, offset)
+    if offset + length > len(data):
+        raise RecordError("Truncated text")
+    return data[offset:offset + length].decode("ascii"), offset + length
+
+
+def _index_mask(dice_indices: List[int]) -> int:
+    mask = 0
+    for index in dice_indices:
+        mask |= 1 << index
+    return mask
+
+
+def _mask_indices(mask: int) -> List[int]:
+    return [index for index in range(8) if mask >> index & 1]
+
+
+def _roll_size(count: int) -> int:
+    # 6 ** 3 = 216 fits a byte, 6 ** 6 = 46656 two
+    return 1 if count <= 3 else 2
+
+
+def _encode_roll(dice_values: List[int]) -> int:
+    packed = 0
+    for value in reversed(dice_values):
+        packed = packed * 6 + (value - 1)
+    return packed
+
+
+def _decode_roll(packed: int, count: int) -> List[int]:
+    dice_values = []
+    for _ in range(count):
+        packed, face = divmod(packed, 6)
+        dice_values.append(face + 1)
+    return dice_values
+
+
+# ============================================================================
+# RECORDING
+# ============================================================================
+
+class GameRecorder(GameObserver):
+    """Appends every action of a game to a compact binary record"""
+
+    def __init__(self, game_state):
+        """
+        Start a record with the setup of game_state (call before the first action).
+
+        Args:
+            game_state: GameStateManager whose players are already seated
+        """
+        self.data = bytearray(RECORD_MAGIC)
+        self.data.append(RECORD_VERSION)
+        humans = sum(1 for player in game_state.players if player.is_human())
+        write_varint(self.data, humans)
+        write_varint(self.data, len(game_state.players) - humans)
+        write_varint(self.data, game_state.endgoal)
+        write_signed_varint(self.data, game_state.rng.seed)
+        write_text(self.data, game_state.ruleset)
+        write_text(self.data, game_state.bot_difficulty)
+
+    def to_bytes(self) -> bytes:
+        return bytes(self.data)
+
+    def _append(self, op: int, argument: int = 0):
+        self.data.append(op << 4 | argument)
+
+    def on_turn_started(self, game_state):
+        self._append(OP_START_TURN)
+
+    def on_dice_rolled(self, game_state, dice_values):
+        self._append(OP_ROLL, len(dice_values))
+        self.data.extend(_encode_roll(dice_values).to_bytes(_roll_size(len(dice_values)), "little"))
+
+    def on_selection_changed(self, game_state, selected_dice):
+        self._append(OP_SELECT)
+        self.data.append(_index_mask(selected_dice))
+
+    def on_dice_stashed(self, game_state, dice_indices, stashed_dice, points):
+        self._append(OP_STASH)
+        self.data.append(_index_mask(dice_indices))
+
+    def on_points_banked(self, game_state, points):
+        self._append(OP_BANK)
+
+    def on_new_stash_started(self, game_state):
+        self._append(OP_START_NEW_STASH, 1 if game_state.current_game_state == GameStateEnum.NEW_STASH else 0)
+
+    def on_turn_ended(self, game_state):
+        self._append(OP_END_TURN)
+
+
+# ============================================================================
+# DECODING AND REPLAY
+# ============================================================================
+
+def decode_header(data: bytes) -> Tuple[dict, int]:
+    """
+    Game setup of a record.
+
+    Returns:
+        (setup, offset of the first event); setup holds human_players,
+        ai_players, endgoal, seed, ruleset and bot_difficulty
+    """
+    if data[:len(RECORD_MAGIC)] != RECORD_MAGIC:
+        raise RecordError("Not a game record")
+    offset = len(RECORD_MAGIC)
+    if offset >= len(data) or data[offset] != RECORD_VERSION:
+        raise RecordError(f"Unsupported record version: {data[offset] if offset < len(data) else None}")
+    offset += 1
+    setup = {}
+    for key in ("human_players", "ai_players", "endgoal"):
+        setup[key], offset = read_varint(data, offset)
+    setup["seed"], offset = read_signed_varint(data, offset)
+    for key in ("ruleset", "bot_difficulty"):
+        setup[key], offset = read_text(data, offset)
+    return setup, offset
+
+
+def iter_events(data: bytes) -> Iterator[Tuple[str, object]]:
+    """
+    Actions of a record in order.
+
+    Yields:
+        (action, argument): dice values for ROLL, dice indices for SELECT
+        and STASH, True for the referee's START_NEW_STASH, else None
+    """
+    _, offset = decode_header(data)
+    end = len(data)
+    while offset < end:
+        byte = data[offset]
+        offset += 1
+        op, argument = byte >> 4, byte & 0x0F
+        if op == OP_ROLL:
+            size = _roll_size(argument)
+            if offset + size > end:
+                raise RecordError("Truncated roll")
+            yield "ROLL", _decode_roll(int.from_bytes(data[offset:offset + size], "little"), argument)
+            offset += size
+        elif op in (OP_SELECT, OP_STASH):
+            if offset >= end:
+                raise RecordError("Truncated dice indices")
+            yield _OP_NAMES[op], _mask_indices(data[offset])
+            offset += 1
+        elif op == OP_START_NEW_STASH:
+            yield "START_NEW_STASH", bool(argument)
+        elif op in _OP_NAMES:
+            yield _OP_NAMES[op], None
+        else:
+            raise RecordError(f"Unknown event opcode {op} at byte {offset - 1}")
+
+
+def replay_record(data: bytes, observer: Optional[GameObserver] = None):
+    """
+    Rebuild a game from its record.
+
+    Args:
+        data: Record bytes (GameRecorder.to_bytes())
+        observer: Observer to attach to the replayed game, e.g. a UI
+
+    Returns:
+        GameStateManager in the state the record ends in; its own recorder
+        holds a byte-identical record. The replay learns into an empty
+        in-memory opponent model: the recorded human decisions were already
+        observed when the game was played.
+    """
+    # Imported here: game_state imports this module for its recorder
+    from core.game_engine.opponent_model import OpponentModel
+    from core.game_state.game_state import GameStateManager
+
+    setup, _ = decode_header(data)
+    game = GameStateManager(observer, setup["human_players"], setup["ai_players"], setup["endgoal"],
+                            setup["ruleset"], setup["bot_difficulty"], setup["seed"], OpponentModel(None))
+    referee = game.referee
+    for action, argument in iter_events(data):
+        if action == "ROLL":
+            game.roll_dice(argument)
+        elif action == "SELECT":
+            game.set_selected_dice(argument)
+        elif action == "STASH":
+            game.stash_dice(argument)
+        elif action == "BANK":
+            referee.bank_points()
+        elif action == "START_NEW_STASH":
+            if argument:
+                referee.start_new_stash()
+            else:
+                game.start_new_stash()
+        elif action == "END_TURN":
+            referee.end_turn()
+        else:
+            game.start_turn()
+    return game
+
+
+# ============================================================================
+# RECORD FILES
+# ============================================================================
+
+def write_records(handle: BinaryIO, records) -> int:
+    """Append records to a binary file, each prefixed with its length; returns bytes written"""
+    written = 0
+    for record in records:
+        prefix = bytearray()
+        write_varint(prefix, len(record))
+        handle.write(prefix)
+        handle.write(record)
+        written += len(prefix) + len(record)
+    return written
+
+
+def read_records(handle: BinaryIO) -> Iterator[bytes]:
+    """Records of a file written by write_records"""
+    data = handle.read()
+    offset = 0
+    while offset < len(data):
+        length, offset = read_varint(data, offset)
+        if offset + length > len(data):
+            raise RecordError("Truncated record file")
+        yield data[offset:offset + length]
+        offset += length
@@ -0,0 +1,303 @@
+"""
+GAME SNAPSHOT MODULE
+Compact, versioned snapshots of a game in progress.
+
+A snapshot holds everything the game needs to continue exactly where it
+was: the setup, every player's turn history, stash and STASHSTASH, the dice
+on the table and the selection, the turn and final-turns bookkeeping and the
+position of each random stream (dice, physics, bot choices). The G-REF
+message history and the legacy text log are presentation and are not kept;
+the event record (game_record) is included unless asked otherwise.
+
+Layout: magic "LDS", version, then varints (zigzag for the seed, which can
+be negative), length-prefixed ASCII and raw bytes (dice faces and indices)
+in a fixed order; see encode_snapshot. A
+snapshot takes one to two hundred bytes plus the record.
+
+    data = game.snapshot()
+    game = GameStateManager.restore(data)   # well under a millisecond
+
+Uses: resuming after a crash (the UI autosaves after every turn to
+AUTOSAVE_PATH), fast-forwarding simulations from mid-game positions, and
+forking a game for bot search (GameStateManager.fork) without deep copies.
+"""
+
+import os
+from typing import List, Optional, Tuple
+
+from core.game_state.game_record import (
+    RecordError, read_signed_varint, read_text, read_varint, write_signed_varint, write_text, write_varint,
+)
+from games.livedice_f.livedice_f_rules import GameStateEnum
+
+SNAPSHOT_MAGIC = b"LDS"
+SNAPSHOT_VERSION = 2
+AUTOSAVE_PATH = os.path.join(os.path.expanduser("~"), ".livedice", "autosave.lds")
+
+# Flag bits of the game and player flag bytes
+_TURN_STARTED, _TURN_BANKED, _BUST_STATE, _CAN_ROLL_ONCE, _FINAL_TURNS = (1, 2, 4, 8, 16)
+_STASHED_THIS_ROLL, _IS_ACTIVE = (1, 2)
+
+
+class SnapshotError(RecordError):
+    """Raised for data that is not a valid snapshot"""
+
+
+# ============================================================================
+# ENCODING
+# ============================================================================
+
+def _write_small_ints(buffer: bytearray, values: List[int]):
+    # Dice faces and dice indices: count, then one byte each
+    write_varint(buffer, len(values))
+    buffer.extend(values)
+
+
+def _read_small_ints(data: bytes, offset: int) -> Tuple[List[int], int]:
+    count, offset = read_varint(data, offset)
+    if offset + count > len(data):
+        raise SnapshotError("Truncated snapshot")
+    return list(data[offset:offset + count]), offset + count
+
+
+def _write_ints(buffer: bytearray, values):
+    write_varint(buffer, len(values))
+    for value in values:
+        write_varint(buffer, value)
+
+
+def _read_ints(data: bytes, offset: int) -> Tuple[List[int], int]:
+    count, offset = read_varint(data, offset)
+    values = []
+    for _ in range(count):
+        value, offset = read_varint(data, offset)
+        values.append(value)
+    return values, offset
+
+
+def _player_index(game_state, player) -> int:
+    """1-based seat of player, 0 for None"""
+    return game_state.players.index(player) + 1 if player is not None else 0
+
+
+def encode_snapshot(game_state, include_record: bool = True) -> bytes:
+    """
+    Snapshot of a GameStateManager.
+
+    Args:
+        game_state: Game to snapshot
+        include_record: Also store the event record so far (needed to replay
+            the game later; forks for search leave it out)
+    """
+    buffer = bytearray(SNAPSHOT_MAGIC)
+    buffer.append(SNAPSHOT_VERSION)
+
+    # Setup
+    humans = sum(1 for player in game_state.players if player.is_human())
+    for value in (humans, len(game_state.players) - humans, game_state.endgoal):
+        write_varint(buffer, value)
+    write_signed_varint(buffer, game_state.rng.seed)
+    write_text(buffer, game_state.ruleset)
+    write_text(buffer, game_state.bot_difficulty)
+
+    # Turn and final-turns bookkeeping
+    flags = ((_TURN_STARTED if game_state.turn_started else 0)
+             | (_TURN_BANKED if game_state.turn_banked else 0)
+             | (_BUST_STATE if game_state.bust_state else 0)
+             | (_CAN_ROLL_ONCE if game_state.can_roll_once else 0)
+             | (_FINAL_TURNS if game_state.final_turns_triggered else 0))
+    buffer.append(flags)
+    for value in (game_state.current_player_index, game_state.current_game_state.value,
+                  game_state.current_turn_number, game_state.total_turns,
+                  _player_index(game_state, game_state.busted_player), game_state.busted_lost_score,
+                  _player_index(game_state, game_state.final_turns_player),
+                  game_state.final_turns_turn_number, game_state.final_turns_score):
+        write_varint(buffer, value)
+    _write_small_ints(buffer, game_state.dice_values)
+    _write_small_ints(buffer, game_state.selected_dice)
+    write_text(buffer, game_state.active_task.encode("ascii", "replace").decode("ascii"))
+
+    # Random streams; positions are -1 before the first draw, stored + 1
+    for rng in (game_state.rng, game_state.physics_rng, game_state.bot_rng):
+        for value in rng.get_position():
+            write_varint(buffer, value + 1)
+
+    # Players
+    for player in game_state.players:
+        buffer.append((_STASHED_THIS_ROLL if player.stashed_dice_this_roll else 0)
+                      | (_IS_ACTIVE if player.is_active else 0))
+        for value in (player.stash_stash, player.full_stashes_moved, player.stashes_this_turn,
+                      player.stash_level, player.roll_count, player.banked_full_stashes,
+                      player.full_stashes_moved_this_turn):
+            write_varint(buffer, value)
+        _write_small_ints(buffer, player.stashed_dice)
+        _write_ints(buffer, player.stashed_dice_scores)
+        history = player.turn_scores
+        _write_ints(buffer, history.scores)
+        _write_ints(buffer, history.rolls)
+        _write_ints(buffer, history.stashes)
+
+    record = game_state.recorder.data if include_record and game_state.recorder is not None else b""
+    write_varint(buffer, len(record))
+    buffer.extend(record)
+    return bytes(buffer)
+
+
+# ============================================================================
+# DECODING
+# ============================================================================
+
+def decode_setup(data: bytes) -> Tuple[dict, int]:
+    """
+    Game setup of a snapshot.
+
+    Returns:
+        (setup, offset after it); setup holds human_players, ai_players,
+        endgoal, seed, ruleset and bot_difficulty
+
+    Raises:
+        SnapshotError: If data is not a snapshot of this version or is truncated
+    """
+    if data[:len(SNAPSHOT_MAGIC)] != SNAPSHOT_MAGIC:
+        raise SnapshotError("Not a game snapshot")
+    offset = len(SNAPSHOT_MAGIC)
+    if offset >= len(data) or data[offset] != SNAPSHOT_VERSION:
+        raise SnapshotError(f"Unsupported snapshot version: {data[offset] if offset < len(data) else None}")
+    offset += 1
+    setup = {}
+    try:
+        for key in ("human_players", "ai_players", "endgoal"):
+            setup[key], offset = read_varint(data, offset)
+        setup["seed"], offset = read_signed_varint(data, offset)
+        for key in ("ruleset", "bot_difficulty"):
+            setup[key], offset = read_text(data, offset)
+    except ValueError as error:
+        raise SnapshotError(f"Invalid snapshot setup: {error}") from None
+    if setup["human_players"] + setup["ai_players"] == 0:
+        raise SnapshotError("Snapshot has no players")
+    return setup, offset
+
+
+def restore_snapshot(manager_class, data: bytes, observer=None, opponent_model=None):
+    """
+    New game in the state of a snapshot.
+
+    Args:
+        manager_class: GameStateManager (or a subclass) to build
+        data: Snapshot bytes (encode_snapshot)
+        observer: Observer to attach, e.g. a UI
+        opponent_model: OpponentModel the game learns into (default: the
+            process-wide one, right for resuming a real game; searches pass
+            an in-memory model)
+
+    Returns:
+        The restored game; game.recorder is None when the snapshot holds
+        no record, since a record without its start cannot be replayed
+    """
+    setup, offset = decode_setup(data)
+    game = manager_class(observer, setup["human_players"], setup["ai_players"], setup["endgoal"],
+                         setup["ruleset"], setup["bot_difficulty"], setup["seed"], opponent_model)
+    players = game.players
+
+    try:
+        flags = data[offset]
+        offset += 1
+        values = []
+        for _ in range(9):
+            value, offset = read_varint(data, offset)
+            values.append(value)
+        (current_player_index, state_value, game.current_turn_number, game.total_turns, busted_player,
+         game.busted_lost_score, final_turns_player, game.final_turns_turn_number, game.final_turns_score) = values
+        game.turn_started = bool(flags & _TURN_STARTED)
+        game.turn_banked = bool(flags & _TURN_BANKED)
+        game.bust_state = bool(flags & _BUST_STATE)
+        game.can_roll_once = bool(flags & _CAN_ROLL_ONCE)
+        game.final_turns_triggered = bool(flags & _FINAL_TURNS)
+        game.current_player_index = current_player_index
+        game.current_game_state = GameStateEnum(state_value)
+        game.busted_player = players[busted_player - 1] if busted_player else None
+        game.final_turns_player = players[final_turns_player - 1] if final_turns_player else None
+        dice_values, offset = _read_small_ints(data, offset)
+        game.selected_dice, offset = _read_small_ints(data, offset)
+        game.active_task, offset = read_text(data, offset)
+
+        for rng in (game.rng, game.physics_rng, game.bot_rng):
+            position = []
+            for _ in range(4):
+                value, offset = read_varint(data, offset)
+                position.append(value - 1)
+            rng.set_position(tuple(position))
+
+        for player in players:
+            player_flags = data[offset]
+            offset += 1
+            player.stashed_dice_this_roll = bool(player_flags & _STASHED_THIS_ROLL)
+            player.is_active = bool(player_flags & _IS_ACTIVE)
+            values = []
+            for _ in range(7):
+                value, offset = read_varint(data, offset)
+                values.append(value)
+            (player.stash_stash, player.full_stashes_moved, player.stashes_this_turn, player.stash_level,
+             player.roll_count, player.banked_full_stashes, player.full_stashes_moved_this_turn) = values
+            player.stashed_dice, offset = _read_small_ints(data, offset)
+            player.stashed_dice_scores, offset = _read_ints(data, offset)
+            scores, offset = _read_ints(data, offset)
+            rolls, offset = _read_ints(data, offset)
+            stashes, offset = _read_ints(data, offset)
+            for turn in zip(scores, rolls, stashes):
+                player.turn_scores.append(*turn)
+            player.turn_count = len(scores)
+
+        record_length, offset = read_varint(data, offset)
+        record = data[offset:offset + record_length]
+        offset += record_length
+        if offset != len(data) or len(record) != record_length:
+            raise SnapshotError("Snapshot length mismatch")
+        if not 0 <= current_player_index < len(players):
+            raise SnapshotError(f"Invalid current player: {current_player_index}")
+        game.set_table_dice(dice_values)
+    except IndexError:
+        raise SnapshotError("Truncated snapshot") from None
+    except SnapshotError:
+        raise
+    except ValueError as error:
+        raise SnapshotError(f"Invalid snapshot: {error}") from None
+
+    if record:
+        game.recorder.data[:] = record
+    else:
+        game.remove_observer(game.recorder)
+        game.recorder = None
+    game.real_time_counters.update_counters(game)
+    return game
+
+
+# ============================================================================
+# FILES
+# ============================================================================
+
+def save_snapshot(data: bytes, path: str = AUTOSAVE_PATH) -> str:
+    """Write snapshot bytes to path, replacing it atomically"""
+    os.makedirs(os.path.dirname(os.path.abspath(path)), exist_ok=True)
+    temporary = f"{path}.tmp{os.getpid()}"
+    with open(temporary, "wb") as handle:
+        handle.write(data)
+    os.replace(temporary, path)
+    return path
+
+
+def load_snapshot(path: str = AUTOSAVE_PATH) -> Optional[bytes]:
+    """Snapshot bytes stored at path, or None if there is none"""
+    try:
+        with open(path, "rb") as handle:
+            return handle.read()
+    except OSError:
+        return None
+
+
+def discard_snapshot(path: str = AUTOSAVE_PATH):
+    """Remove the snapshot at path, if there is one"""
+    try:
+        os.remove(path)
+    except FileNotFoundError:
+        pass
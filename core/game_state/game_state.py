@@ -2,16 +2,23 @@ from typing import List, Optional
 import re
 from core.account.user import User
 from core.game_engine.game_referee import GameReferee
+from core.game_engine.dice_rng import DiceRNG
+from core.game_engine.opponent_model import OpponentModel, get_opponent_model
+from core.game_state.game_observer import GameObserver
+from core.game_state.game_record import GameRecorder
+from core.game_state.game_snapshot import encode_snapshot, restore_snapshot
 from core.messaging import MessageManager
 from core.game_state.real_time_score_counters import RealTimeScoreCounters
+from core.game_state.turn_history import TurnHistory
 from games.livedice_f.livedice_f_rules import LiveDiceFRules, GameStateEnum
+from games.livedice_f.livedice_f_dice_hand import DiceHand
 
 class Player:
     def __init__(self, user: User, player_number: int, game_state_manager):
         self.user = user
         self.player_number = player_number
         self.game_state_manager = game_state_manager
-        self.turn_scores = {}
+        self.turn_scores = TurnHistory()
         self.stashed_dice = []
         self.stashed_dice_scores = []
         self.stashed_dice_this_roll = False
@@ -26,13 +33,8 @@ class Player:
         self.full_stashes_moved_this_turn = 0
 
     def record_turn(self, turn_number: int, banked_score: int, rolls: int, full_stashes_moved: int):
-        # FIXED: Use player's own turn_count + 1 for recording
-        player_turn = self.turn_count + 1
-        self.turn_scores[player_turn] = {
-            "SCORE": banked_score,
-            "ROLLS": rolls,
-            "STASHES": full_stashes_moved
-        }
+        # FIXED: Use player's own turn_count + 1 for recording (the history numbers turns itself)
+        self.turn_scores.append(banked_score, rolls, full_stashes_moved)
         self.turn_count += 1
         self.banked_full_stashes += full_stashes_moved
         self.full_stashes_moved_this_turn = 0
@@ -46,7 +48,13 @@ class Player:
         self.full_stashes_moved_this_turn += 1
 
     def get_total_score(self) -> int:
-        return sum(turn["SCORE"] for turn in self.turn_scores.values())
+        return self.turn_scores.total_score
+
+    def get_total_rolls(self) -> int:
+        return self.turn_scores.total_rolls
+
+    def get_total_stashes(self) -> int:
+        return self.turn_scores.total_stashes
 
     def get_stash_score(self) -> int:
         return sum(self.stashed_dice_scores)
@@ -57,13 +65,17 @@ class Player:
         self.stashes_this_turn += 1
 
     def get_turn_score(self, turn_number: int):
-        return self.turn_scores.get(turn_number, {"SCORE": 0, "ROLLS": 0, "STASHES": 0})
+        return self.turn_scores.get_turn(turn_number)
 
     def is_bot(self) -> bool:
         # FIXED: Check for new bot naming format with difficulty prefix
         # Supports: EASY-GO-BOT-1, NORMAL-GO-BOT-2, HARD-GO-BOT-3, etc.
         return "GO-BOT" in self.user.username or self.user.username.startswith("@")
 
+    def is_human(self) -> bool:
+        # is_bot() also matches human "@VIDEO-GAMER-n" names; only bots carry GO-BOT
+        return "GO-BOT" not in self.user.username
+
     def reset_turn(self):
         self.stashed_dice = []
         self.stashed_dice_scores = []
@@ -76,11 +88,15 @@ class Player:
         self.stashed_dice_this_roll = False
         
 class GameStateManager:
-    def __init__(self, ui, human_players, ai_players, endgoal=4000, ruleset="STANDARD", bot_difficulty="NORMAL"):
-        self.ui = ui
+    def __init__(self, observer: Optional[GameObserver], human_players, ai_players, endgoal=4000, ruleset="STANDARD",
+                 bot_difficulty="NORMAL", seed=None, opponent_model: Optional[OpponentModel] = None):
+        # Front ends follow the game through observers; the engine never calls a UI (None = headless)
+        self.observers: List[GameObserver] = [observer] if observer is not None else []
         self.players: List[Player] = []
         self.current_player_index = 0
         self.dice_values: List[int] = []
+        # Count-vector view of dice_values, rebuilt whenever the dice on the table change
+        self.dice_hand = DiceHand()
         self.selected_dice: List[int] = []
         self.turn_started = False
         self.turn_banked = False
@@ -98,6 +114,16 @@ class GameStateManager:
         self.endgoal = int(endgoal) if endgoal else 4000
         self.ruleset = ruleset if ruleset else "STANDARD"
         self.bot_difficulty = bot_difficulty if bot_difficulty else "NORMAL"
+
+        # Seeded dice stream (pass the same seed to replay a game exactly) plus
+        # separate streams for physics jitter and bot choices so neither shifts the dice
+        self.rng = DiceRNG(seed)
+        self.physics_rng = self.rng.spawn("physics")
+        self.bot_rng = self.rng.spawn("bot")
+
+        # Bank and stash habits of human players, learned for the adaptive HARD bot;
+        # replays and forks pass their own in-memory model so nothing is learned twice
+        self.opponent_model = opponent_model if opponent_model is not None else get_opponent_model()
         
         self.referee = GameReferee(self)
         self.real_time_counters = RealTimeScoreCounters()
@@ -129,6 +155,10 @@ class GameStateManager:
         self.determine_starting_player()
         self.set_active_task("Click START TURN to begin your turn")
 
+        # Binary record of every action, replayable with game_record.replay_record
+        self.recorder = GameRecorder(self)
+        self.observers.append(self.recorder)
+
     def determine_starting_player(self):
         # Start with the first human player, if any
         human_players = [p for p in self.players if not p.is_bot()]
@@ -145,6 +175,49 @@ class GameStateManager:
         player = Player(user, len(self.players) + 1, self)
         self.players.append(player)
 
+    def add_observer(self, observer: GameObserver):
+        self.observers.append(observer)
+
+    def remove_observer(self, observer: GameObserver):
+        if observer in self.observers:
+            self.observers.remove(observer)
+
+    def notify(self, event: str, *args):
+        """Call GameObserver hook `event` on every observer with (self, *args)"""
+        for observer in self.observers:
+            getattr(observer, event)(self, *args)
+
+    # ========================================================================
+    # SNAPSHOTS (see game_snapshot)
+    # ========================================================================
+
+    def snapshot(self, include_record: bool = True) -> bytes:
+        """Compact snapshot of the game to continue it later with restore"""
+        return encode_snapshot(self, include_record)
+
+    @classmethod
+    def restore(cls, data: bytes, observer: Optional[GameObserver] = None,
+                opponent_model: Optional[OpponentModel] = None) -> "GameStateManager":
+        """New game in the state of a snapshot"""
+        return restore_snapshot(cls, data, observer, opponent_model)
+
+    def fork(self) -> "GameStateManager":
+        """
+        Independent copy of the game (no observers, no record), e.g. for bot search.
+
+        The fork learns into an in-memory copy of the opponent profiles, so
+        moves played in it never reach the saved profiles.
+        """
+        return restore_snapshot(type(self), encode_snapshot(self, include_record=False),
+                                opponent_model=self.opponent_model.copy())
+
+    def set_table_dice(self, dice_values: List[int]):
+        """Put dice_values on the table as they are (no roll, no events)"""
+        self.dice_values = list(dice_values)
+        self.dice_hand = DiceHand(self.dice_values)
+        self.current_stashable_combinations = self.referee.get_scoring_combinations(self.dice_hand)
+        self.current_stashable_dice = self.referee.get_stashable_dice(self.dice_hand)
+
     @property
     def current_player(self) -> Player:
         return self.players[self.current_player_index]
@@ -163,7 +236,7 @@ class GameStateManager:
         self.can_roll_once = False
         # CRITICAL: Do NOT reset final_turns variables - they persist until game ends!
         # FIXED: Update counters so new player's turn number shows immediately
-        self.real_time_counters.update_counters(self)
+        self.real_time_counters.on_turn_ended(self)
 
     def set_active_task(self, task: str):
         self.active_task = task
@@ -197,8 +270,7 @@ class GameStateManager:
             # Generic message - add as G-REF
             self.message_manager.add_gref_official_statement(formatted_entry)
         
-        if self.ui:
-            self.ui.events.scroll_log_to_bottom()
+        self.notify("on_log_updated")
 
     def reset_full_stashes_moved(self):
         self.current_player.full_stashes_moved = 0
@@ -208,11 +280,31 @@ class GameStateManager:
         # FIXED: Call referee.bust() which handles state + messages properly
         # Removes duplicate message issue (add_log_entry was creating extra G-REF message)
         self.referee.bust()
+        if self.current_player.is_human():
+            self.opponent_model.observe_bust(self.current_player.user.username)
+        self.save_profiles_if_game_over()
         self.reset_full_stashes_moved()
-        self.real_time_counters.update_counters(self)
+        self.real_time_counters.on_turn_ended(self)
+
+    def start_turn(self):
+        """Start the current player's turn without rolling yet (bots)"""
+        self.current_game_state = GameStateEnum.START_TURN
+        self.turn_started = True
+        self.notify("on_turn_started")
+
+    def roll_dice(self, dice_values: Optional[List[int]] = None):
+        """
+        Roll the dice that are not stashed.
 
-    def roll_dice(self):
+        Args:
+            dice_values: Faces to use instead of drawing them (replays)
+        """
         self.turn_started = True
+        player = self.current_player
+        if (player.stashed_dice_this_roll and player.is_human()
+                and self.current_game_state != GameStateEnum.STASHCHOICE_STASHED_FULL_READY_TO_ROLL):
+            # Rolled on although the turn could have been banked
+            self.opponent_model.observe_roll_on(player.user.username, self.referee.calculate_turn_score())
         self.current_player.roll_count += 1
         self.current_player.stashed_dice_this_roll = False  # Reset this flag on each new roll
         
@@ -221,13 +313,19 @@ class GameStateManager:
         else:
             remaining_dice = LiveDiceFRules.MAX_DICE - len(self.current_player.stashed_dice)
         
-        self.dice_values = [LiveDiceFRules.roll_die() for _ in range(remaining_dice)]
+        if dice_values is None:
+            self.dice_values = self.rng.roll(remaining_dice)
+        elif len(dice_values) == remaining_dice:
+            self.dice_values = list(dice_values)
+        else:
+            raise ValueError(f"Expected {remaining_dice} dice, got {len(dice_values)}")
+        self.dice_hand = DiceHand(self.dice_values)
         
         self.selected_dice = []
         
         # CRITICAL: Pass ruleset to get_scoring_combinations and get_stashable_dice
-        self.current_stashable_combinations = self.referee.get_scoring_combinations(self.dice_values)
-        self.current_stashable_dice = self.referee.get_stashable_dice(self.dice_values)
+        self.current_stashable_combinations = self.referee.get_scoring_combinations(self.dice_hand)
+        self.current_stashable_dice = self.referee.get_stashable_dice(self.dice_hand)
         
         # CRITICAL: G-REF announces roll for ALL players (human and bot)
         player_name = self.current_player.user.username
@@ -242,7 +340,8 @@ class GameStateManager:
         else:
             self.bust()
         
-        self.real_time_counters.update_counters(self)
+        self.real_time_counters.on_dice_rolled(self)
+        self.notify("on_dice_rolled", self.dice_values)
 
         return self.dice_values
 
@@ -252,11 +351,19 @@ class GameStateManager:
                 self.selected_dice.remove(dice_index)
             else:
                 self.selected_dice.append(dice_index)
-        self.real_time_counters.update_counters(self)
+        self.real_time_counters.on_selection_changed(self)
+        self.update_selection_state()
+        self.notify("on_selection_changed", self.selected_dice)
+
+    def set_selected_dice(self, dice_indices: List[int]):
+        """Replace the selection for stashing with dice_indices"""
+        self.selected_dice = list(dice_indices)
+        self.real_time_counters.on_selection_changed(self)
         self.update_selection_state()
+        self.notify("on_selection_changed", self.selected_dice)
 
     def update_selection_state(self):
-        stashable_dice = self.referee.get_stashable_dice(self.dice_values)
+        stashable_dice = self.referee.get_stashable_dice(self.dice_hand)
         if len(self.selected_dice) == len(stashable_dice):
             self.referee.set_game_state(GameStateEnum.ROLLRESULT_POSITIVE_STASHSELECTION_FULL)
         elif self.selected_dice:
@@ -273,31 +380,46 @@ class GameStateManager:
         if not dice_indices:
             return
 
-        stashed_values = [self.dice_values[i] for i in dice_indices]
+        stashed_hand = self.dice_hand.select(dice_indices)
         
         # CRITICAL: Store original stashed dice for message BEFORE deletion
-        original_stashed_dice = stashed_values.copy()
+        original_stashed_dice = stashed_hand.to_list()
         
+        # Best split of the selection into combinations, precomputed per count vector
+        stash_partition = self.referee.solve_stash(stashed_hand)
+        if not stash_partition.combinations:
+            return
+
+        # Selected dice that fit no combination (e.g. a lone 6) stay on the table
+        if stash_partition.dice_used < len(dice_indices):
+            needed = [0] * 7
+            for _, _, combination_dice in stash_partition.combinations:
+                for value in combination_dice:
+                    needed[value] += 1
+            used_indices = []
+            for index in dice_indices:
+                if needed[self.dice_values[index]] > 0:
+                    needed[self.dice_values[index]] -= 1
+                    used_indices.append(index)
+            dice_indices = used_indices
+            original_stashed_dice = [self.dice_values[i] for i in dice_indices]
+
         dice_indices.sort(reverse=True)
-        
-        total_stash_score = 0
-        stashed_combinations = []
-
-        while stashed_values:
-            best_combination = max(self.referee.get_scoring_combinations(stashed_values), key=lambda x: x[1])
-            combination_name, combination_score = best_combination
-            
-            combination_dice = self.referee.get_dice_for_combination(stashed_values, combination_name)
-            
-            self.current_player.add_to_stash(combination_dice, combination_score)
-            total_stash_score += combination_score
-            stashed_combinations.append((combination_name, combination_score))
-            
-            for die in combination_dice:
-                stashed_values.remove(die)
+
+        player = self.current_player
+        if not player.stashed_dice_this_roll and player.is_human():
+            self.opponent_model.observe_stash(
+                player.user.username, self.ruleset, self.dice_hand, dice_indices,
+                len(player.stashed_dice), player.get_stash_score() + player.stash_stash
+            )
+
+        total_stash_score = stash_partition.score
+        for combination_name, combination_score, combination_dice in stash_partition.combinations:
+            self.current_player.add_to_stash(list(combination_dice), combination_score)
 
         for index in sorted(dice_indices, reverse=True):
             del self.dice_values[index]
+        self.dice_hand = DiceHand(self.dice_values)
 
         self.selected_dice = []
         
@@ -311,15 +433,12 @@ class GameStateManager:
         )
         
         self.current_player.stashed_dice_this_roll = True
-        self.real_time_counters.update_counters(self)
+        self.real_time_counters.on_dice_stashed(self)
         self.update_stash_state()
-        self.ui.game_board.update_dice_positions(dice_indices)
-
-        if self.ui.use_start_turn_button:
-            self.ui.use_start_turn_button = False
+        self.notify("on_dice_stashed", dice_indices, original_stashed_dice, total_stash_score)
            
     def update_stash_state(self):
-        stashable_dice = self.referee.get_stashable_dice(self.dice_values)
+        stashable_dice = self.referee.get_stashable_dice(self.dice_hand)
         if not stashable_dice:
             if self.dice_values:
                 self.referee.set_game_state(GameStateEnum.STASHCHOICE_STASHED_ALL)
@@ -357,7 +476,8 @@ class GameStateManager:
         # REMOVED: add_log_entry() was creating duplicate messages via legacy system
         # Start new stash is handled by referee and doesn't need separate G-REF message
         self.referee.set_game_state(GameStateEnum.STASHCHOICE_STASHED_FULL_READY_TO_ROLL)
-        self.real_time_counters.update_counters(self)
+        self.real_time_counters.on_stash_moved(self)
+        self.notify("on_new_stash_started")
 
     def set_active_task(self, task: str):
         self.active_task = task
@@ -365,6 +485,11 @@ class GameStateManager:
     def check_game_over(self) -> bool:
         return self.referee.is_game_over()
 
+    def save_profiles_if_game_over(self):
+        """Write the opponent profiles once the last turn is recorded (never between turns)"""
+        if self.referee.is_game_over():
+            self.opponent_model.save()
+
     def check_ui_update(self):
         if self.ui_needs_update:
             self.ui_needs_update = False
@@ -380,24 +505,17 @@ class GameStateManager:
         return max(player.turn_count for player in self.players) if self.players else 0
 
     def format_dice_for_snaptray(self, dice_values):
-        formatted_dice = []
-        for i, value in enumerate(dice_values):
-            is_stashable = False
-            for comb, _ in self.current_stashable_combinations:
-                if comb.startswith("TRIPLE") and dice_values.count(value) >= 3:
-                    is_stashable = True
-                    break
-                elif comb == "DOUBLE 6" and value == 6:
-                    is_stashable = True
-                    break
-                elif comb.startswith("SINGLE 1") and value == 1:
-                    is_stashable = True
-                    break
-                elif comb.startswith("SINGLE 5") and value == 5:
-                    is_stashable = True
-                    break
-            
-            color = "green" if is_stashable else "white"
-            formatted_dice.append(f"{color}_{value}")
+        hand = DiceHand.of(dice_values)
+        # Resolve the stashable faces once from the count vector, then colour each die
+        stashable_faces = set()
+        for comb, _ in self.current_stashable_combinations:
+            if comb.startswith("TRIPLE"):
+                stashable_faces.update(face for face in range(1, 7) if hand.count(face) >= 3)
+            elif comb == "DOUBLE 6":
+                stashable_faces.add(6)
+            elif comb.startswith("SINGLE 1"):
+                stashable_faces.add(1)
+            elif comb.startswith("SINGLE 5"):
+                stashable_faces.add(5)
         
-        return formatted_dice
+        return [f"{'green' if value in stashable_faces else 'white'}_{value}" for value in hand]
@@ -1,50 +1,157 @@
 class RealTimeScoreCounters:
+    """
+    Live counters shown in the UI, computed lazily per group.
+
+    Counters are split into groups that change together (dice on the table,
+    the current selection, the current player's stash, turn bookkeeping).
+    GameStateManager reports each mutation through an on_* hook, which only
+    marks the affected groups dirty; a group is recomputed the first time one
+    of its counters is read afterwards. update_counters() still works and marks
+    everything dirty.
+    """
+
+    TABLE = "table"
+    SELECTION = "selection"
+    STASH = "stash"
+    TURN = "turn"
+    ALL_GROUPS = frozenset((TABLE, SELECTION, STASH, TURN))
+
     def __init__(self):
         self.game_state = None
-        self.table_vscore = 0
-        self.stash_vscore = 0
-        self.stashstash_vscore = 0
-        self.turn_vscore = 0
-        self.stashselection_vscore = 0
-        self.stashplusselection_vscore = 0
-        self.stasheddice_var = 0
-        self.rollcupdice_var = 6
-        self.turn_nr_var = 0
-        self.game_turns_var = 0
-        self.stashstashtimes_vscore = 0
-        self.turn_scorerecord = 0
-        self.turn_rolls_var = 0
-        self.turn_stashes_var = 0
+        self._dirty = set()
+        self.reset()
+
+    # ========================================================================
+    # MUTATION HOOKS
+    # ========================================================================
 
     def update_counters(self, game_state):
+        """Mark every counter dirty (full refresh on next read)"""
+        self._mark(game_state, self.ALL_GROUPS)
+
+    def on_dice_rolled(self, game_state):
+        self._mark(game_state, (self.TABLE, self.SELECTION, self.STASH))
+
+    def on_selection_changed(self, game_state):
+        self._mark(game_state, (self.SELECTION,))
+
+    def on_dice_stashed(self, game_state):
+        self._mark(game_state, (self.TABLE, self.SELECTION, self.STASH))
+
+    def on_stash_moved(self, game_state):
+        self._mark(game_state, (self.STASH,))
+
+    def on_turn_ended(self, game_state):
+        self._mark(game_state, self.ALL_GROUPS)
+
+    def _mark(self, game_state, groups):
         self.game_state = game_state
-        self.table_vscore = game_state.referee.calculate_score(game_state.dice_values)
-        self.stash_vscore = game_state.current_player.get_stash_score()
-        self.stashstash_vscore = game_state.current_player.stash_stash
-        self.turn_vscore = game_state.referee.calculate_turn_score()
-        self.stashselection_vscore = game_state.referee.calculate_score([game_state.dice_values[i] for i in game_state.selected_dice])
-        self.stashplusselection_vscore = self.stash_vscore + self.stashselection_vscore
-        self.stasheddice_var = len(game_state.current_player.stashed_dice)
-        self.rollcupdice_var = 6 - self.stasheddice_var
-        self.turn_nr_var = game_state.current_player.turn_count + 1
-        self.game_turns_var = game_state.get_game_turns()
-        self.stashstashtimes_vscore = game_state.current_player.full_stashes_moved
-        self.turn_scorerecord = self.turn_vscore
-        self.turn_rolls_var = game_state.current_player.roll_count
-        self.turn_stashes_var = game_state.current_player.stashes_this_turn
+        self._dirty.update(groups)
+
+    # ========================================================================
+    # GROUP REFRESH
+    # ========================================================================
+
+    def _refresh(self, group: str):
+        if group not in self._dirty:
+            return
+        self._dirty.discard(group)
+        game_state = self.game_state
+        player = game_state.current_player
+        if group == self.TABLE:
+            self._table_vscore = game_state.referee.calculate_score(game_state.dice_hand)
+        elif group == self.SELECTION:
+            self._stashselection_vscore = game_state.referee.calculate_score(game_state.dice_hand.select(game_state.selected_dice))
+        elif group == self.STASH:
+            self._stash_vscore = player.get_stash_score()
+            self._stashstash_vscore = player.stash_stash
+            self._stasheddice_var = len(player.stashed_dice)
+            self._stashstashtimes_vscore = player.full_stashes_moved
+            self._turn_rolls_var = player.roll_count
+            self._turn_stashes_var = player.stashes_this_turn
+        elif group == self.TURN:
+            self._turn_nr_var = player.turn_count + 1
+            self._game_turns_var = game_state.get_game_turns()
+
+    # ========================================================================
+    # COUNTERS
+    # ========================================================================
+
+    @property
+    def table_vscore(self) -> int:
+        self._refresh(self.TABLE)
+        return self._table_vscore
+
+    @property
+    def stashselection_vscore(self) -> int:
+        self._refresh(self.SELECTION)
+        return self._stashselection_vscore
+
+    @property
+    def stash_vscore(self) -> int:
+        self._refresh(self.STASH)
+        return self._stash_vscore
+
+    @property
+    def stashstash_vscore(self) -> int:
+        self._refresh(self.STASH)
+        return self._stashstash_vscore
+
+    @property
+    def stasheddice_var(self) -> int:
+        self._refresh(self.STASH)
+        return self._stasheddice_var
+
+    @property
+    def rollcupdice_var(self) -> int:
+        return 6 - self.stasheddice_var
+
+    @property
+    def stashstashtimes_vscore(self) -> int:
+        self._refresh(self.STASH)
+        return self._stashstashtimes_vscore
+
+    @property
+    def turn_rolls_var(self) -> int:
+        self._refresh(self.STASH)
+        return self._turn_rolls_var
+
+    @property
+    def turn_stashes_var(self) -> int:
+        self._refresh(self.STASH)
+        return self._turn_stashes_var
+
+    @property
+    def turn_nr_var(self) -> int:
+        self._refresh(self.TURN)
+        return self._turn_nr_var
+
+    @property
+    def game_turns_var(self) -> int:
+        self._refresh(self.TURN)
+        return self._game_turns_var
+
+    @property
+    def turn_vscore(self) -> int:
+        return self.table_vscore + self.stash_vscore + self.stashstash_vscore
+
+    @property
+    def turn_scorerecord(self) -> int:
+        return self.turn_vscore
+
+    @property
+    def stashplusselection_vscore(self) -> int:
+        return self.stash_vscore + self.stashselection_vscore
 
     def reset(self):
-        self.table_vscore = 0
-        self.stash_vscore = 0
-        self.stashstash_vscore = 0
-        self.turn_vscore = 0
-        self.stashselection_vscore = 0
-        self.stashplusselection_vscore = 0
-        self.stasheddice_var = 0
-        self.rollcupdice_var = 6
-        self.turn_nr_var = 0
-        self.game_turns_var = 0
-        self.stashstashtimes_vscore = 0
-        self.turn_scorerecord = 0
-        self.turn_rolls_var = 0
-        self.turn_stashes_var = 0
\ No newline at end of file
+        self._dirty.clear()
+        self._table_vscore = 0
+        self._stash_vscore = 0
+        self._stashstash_vscore = 0
+        self._stashselection_vscore = 0
+        self._stasheddice_var = 0
+        self._turn_nr_var = 0
+        self._game_turns_var = 0
+        self._stashstashtimes_vscore = 0
+        self._turn_rolls_var = 0
+        self._turn_stashes_var = 0
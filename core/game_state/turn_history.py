@@ -0,0 +1,66 @@
+"""
+TURN HISTORY MODULE
+Compact per-player record of banked and busted turns.
+
+Turns are stored in parallel array('i') columns (score, rolls, stashes) with
+running totals kept alongside, so totals and per-turn lookups are constant
+time however long the game runs. TurnHistory is also a read-only mapping of
+turn number (1-based) to {"SCORE", "ROLLS", "STASHES"}, the shape
+Player.turn_scores has always had.
+"""
+
+from array import array
+from collections.abc import Mapping
+from typing import Dict, Iterator
+
+_EMPTY_TURN = {"SCORE": 0, "ROLLS": 0, "STASHES": 0}
+
+
+class TurnHistory(Mapping):
+    """Array-backed turn records with running totals"""
+
+    __slots__ = ("scores", "rolls", "stashes", "total_score", "total_rolls", "total_stashes")
+
+    def __init__(self):
+        self.scores = array("i")
+        self.rolls = array("i")
+        self.stashes = array("i")
+        self.total_score = 0
+        self.total_rolls = 0
+        self.total_stashes = 0
+
+    def append(self, score: int, rolls: int, stashes: int) -> int:
+        """
+        Record the next turn.
+
+        Returns:
+            The turn number (1-based) of the recorded turn
+        """
+        self.scores.append(score)
+        self.rolls.append(rolls)
+        self.stashes.append(stashes)
+        self.total_score += score
+        self.total_rolls += rolls
+        self.total_stashes += stashes
+        return len(self.scores)
+
+    def get_turn(self, turn_number: int) -> Dict[str, int]:
+        """Turn record, or zeros for a turn that has not been played"""
+        if 1 <= turn_number <= len(self.scores):
+            index = turn_number - 1
+            return {"SCORE": self.scores[index], "ROLLS": self.rolls[index], "STASHES": self.stashes[index]}
+        return dict(_EMPTY_TURN)
+
+    def __getitem__(self, turn_number: int) -> Dict[str, int]:
+        if not isinstance(turn_number, int) or not 1 <= turn_number <= len(self.scores):
+            raise KeyError(turn_number)
+        return self.get_turn(turn_number)
+
+    def __iter__(self) -> Iterator[int]:
+        return iter(range(1, len(self.scores) + 1))
+
+    def __len__(self) -> int:
+        return len(self.scores)
+
+    def __repr__(self):
+        return f"TurnHistory(turns={len(self.scores)}, total_score={self.total_score})"
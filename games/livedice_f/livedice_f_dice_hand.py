@@ -0,0 +1,159 @@
+"""
+LIVEDICE F DICE HAND
+Compact immutable dice hand built on a 6-slot count vector.
+
+A DiceHand keeps the dice values in roll order (so UI indices keep working),
+the count of each face and, per face, the indices holding it. The packed count
+key is the same one the ruleset tables are keyed by, so a hand can be scored
+with a single dict lookup and used directly as a memoization key by solvers.
+Hands are hashable, compare by their values in roll order and are never
+copied: copy() and deepcopy() return the hand itself.
+"""
+
+from typing import Iterable, List, Optional, Tuple
+
+MAX_DICE = 6
+
+# Dice are keyed by their packed count vector: 3 bits per face, face 1 in the
+# lowest bits. Six dice never overflow a 3-bit slot, so every multiset of up to
+# MAX_DICE dice gets a unique key regardless of roll order.
+FACE_WEIGHTS = {face: 1 << (3 * (face - 1)) for face in range(1, 7)}
+
+
+def pack_counts(counts: List[int]) -> int:
+    """Pack a 6-slot count vector (index 0 = face 1) into a table key"""
+    key = 0
+    for face_index, count in enumerate(counts):
+        key |= count << (3 * face_index)
+    return key
+
+
+def unpack_counts(key: int) -> List[int]:
+    """Inverse of pack_counts"""
+    return [(key >> (3 * face_index)) & 0b111 for face_index in range(6)]
+
+
+def pack_dice(dice_values: List[int]) -> Optional[int]:
+    """Table key for a list of dice values, or None if it is not a valid hand"""
+    if isinstance(dice_values, DiceHand):
+        return dice_values.key
+    if len(dice_values) > MAX_DICE:
+        return None
+    key = 0
+    try:
+        for value in dice_values:
+            key += FACE_WEIGHTS[value]
+    except (KeyError, TypeError):
+        return None
+    return key
+
+
+class DiceHand:
+    """Immutable dice values with their count vector and per-face index mapping"""
+
+    __slots__ = ("values", "counts", "key", "face_indices")
+
+    def __init__(self, dice_values: Iterable[int] = ()):
+        """
+        Build a hand from dice values in roll order.
+
+        Args:
+            dice_values: Dice values 1-6
+
+        Raises:
+            ValueError: If a value is not a die face
+        """
+        values = tuple(dice_values)
+        counts = [0] * 6
+        face_indices = ([], [], [], [], [], [])
+        for index, value in enumerate(values):
+            if value not in FACE_WEIGHTS:
+                raise ValueError(f"Invalid die value: {value!r}")
+            counts[value - 1] += 1
+            face_indices[value - 1].append(index)
+        object.__setattr__(self, "values", values)
+        object.__setattr__(self, "counts", tuple(counts))
+        # Hands larger than MAX_DICE have no table key (the rules evaluate them on the fly)
+        object.__setattr__(self, "key", pack_counts(counts) if len(values) <= MAX_DICE else None)
+        object.__setattr__(self, "face_indices", tuple(tuple(indices) for indices in face_indices))
+
+    @classmethod
+    def of(cls, dice) -> "DiceHand":
+        """Return dice as a hand, reusing it when it already is one"""
+        return dice if isinstance(dice, cls) else cls(dice)
+
+    @classmethod
+    def from_counts(cls, counts: Iterable[int]) -> "DiceHand":
+        """Hand with the given count per face, values in ascending order"""
+        values = []
+        for face, count in enumerate(counts, start=1):
+            values.extend([face] * count)
+        return cls(values)
+
+    # ========================================================================
+    # QUERIES
+    # ========================================================================
+
+    def count(self, face: int) -> int:
+        """Number of dice showing face"""
+        return self.counts[face - 1] if face in FACE_WEIGHTS else 0
+
+    def indices_of(self, face: int) -> Tuple[int, ...]:
+        """Indices of the dice showing face, in roll order"""
+        return self.face_indices[face - 1] if face in FACE_WEIGHTS else ()
+
+    def select(self, indices: Iterable[int]) -> "DiceHand":
+        """Sub-hand made of the dice at the given indices"""
+        values = self.values
+        return DiceHand(values[index] for index in indices)
+
+    def without(self, indices: Iterable[int]) -> "DiceHand":
+        """Hand left after removing the dice at the given indices"""
+        removed = set(indices)
+        return DiceHand(value for index, value in enumerate(self.values) if index not in removed)
+
+    def to_list(self) -> List[int]:
+        """Dice values as a new list"""
+        return list(self.values)
+
+    # ========================================================================
+    # PROTOCOLS
+    # ========================================================================
+
+    def __setattr__(self, name, value):
+        raise AttributeError("DiceHand is immutable")
+
+    def __delattr__(self, name):
+        raise AttributeError("DiceHand is immutable")
+
+    def __copy__(self):
+        return self
+
+    def __deepcopy__(self, memo):
+        return self
+
+    def __reduce__(self):
+        return DiceHand, (self.values,)
+
+    def __len__(self):
+        return len(self.values)
+
+    def __iter__(self):
+        return iter(self.values)
+
+    def __getitem__(self, index):
+        return self.values[index]
+
+    def __contains__(self, value):
+        return value in FACE_WEIGHTS and self.counts[value - 1] > 0
+
+    def __eq__(self, other):
+        if isinstance(other, DiceHand):
+            return self.values == other.values
+        return NotImplemented
+
+    def __hash__(self):
+        return hash(self.values)
+
+    def __repr__(self):
+        return f"DiceHand({list(self.values)})"
@@ -0,0 +1,115 @@
+"""
+LIVEDICE F ROLL ODDS
+Exact roll statistics for every dice count and ruleset.
+
+Rolling n dice has 6^n equally likely ordered outcomes, but only a few hundred
+distinct multisets. Each multiset is scored once through the rules tables and
+weighted by its number of orderings, which gives exact bust probabilities,
+expected immediate scores and full score distributions. Everything is computed
+once at import (registered house rulesets on first use) and served from a dict,
+so callers pay a single lookup.
+"""
+
+from fractions import Fraction
+from itertools import combinations_with_replacement
+from math import factorial
+from typing import Dict, Tuple
+
+from games.livedice_f.livedice_f_rulesets import MAX_DICE, RULESETS, get_ruleset, pack_counts
+
+
+class RollOdds:
+    """Exact outcome statistics for rolling a fixed number of dice"""
+
+    __slots__ = (
+        "dice_count",
+        "ruleset",
+        "total_outcomes",
+        "bust_outcomes",
+        "bust_fraction",
+        "bust_probability",
+        "expected_score",
+        "score_distribution",
+    )
+
+    def __init__(self, dice_count: int, ruleset: str, total_outcomes: int, bust_outcomes: int,
+                 score_outcomes: Dict[int, int]):
+        self.dice_count = dice_count
+        self.ruleset = ruleset
+        self.total_outcomes = total_outcomes
+        self.bust_outcomes = bust_outcomes
+        self.bust_fraction = Fraction(bust_outcomes, total_outcomes)
+        self.bust_probability = bust_outcomes / total_outcomes
+        self.expected_score = sum(score * ways for score, ways in score_outcomes.items()) / total_outcomes
+        # Probability of each immediate roll score; a bust is reported as score 0
+        self.score_distribution = {
+            score: ways / total_outcomes for score, ways in sorted(score_outcomes.items())
+        }
+
+    def __repr__(self):
+        return (f"RollOdds(dice_count={self.dice_count}, ruleset={self.ruleset!r}, "
+                f"bust_probability={self.bust_probability:.4f}, expected_score={self.expected_score:.1f})")
+
+
+def multiset_outcomes(dice_count: int):
+    """
+    Yield every sorted roll of dice_count dice with its number of orderings.
+
+    Yields:
+        Tuples (counts, ways) where counts is the 6-slot count vector
+    """
+    numerator = factorial(dice_count)
+    for multiset in combinations_with_replacement(range(1, 7), dice_count):
+        counts = tuple(multiset.count(face) for face in range(1, 7))
+        ways = numerator
+        for count in counts:
+            ways //= factorial(count)
+        yield counts, ways
+
+
+def _compute_roll_odds(dice_count: int, ruleset: str) -> RollOdds:
+    table = get_ruleset(ruleset).table
+    bust_outcomes = 0
+    score_outcomes: Dict[int, int] = {}
+    for counts, ways in multiset_outcomes(dice_count):
+        entry = table[pack_counts(counts)]
+        if entry.is_bust:
+            bust_outcomes += ways
+            score = 0
+        else:
+            score = entry.score
+        score_outcomes[score] = score_outcomes.get(score, 0) + ways
+    return RollOdds(dice_count, ruleset, 6 ** dice_count, bust_outcomes, score_outcomes)
+
+
+ROLL_ODDS: Dict[Tuple[str, int], RollOdds] = {
+    (ruleset, dice_count): _compute_roll_odds(dice_count, ruleset)
+    for ruleset in RULESETS
+    for dice_count in range(1, MAX_DICE + 1)
+}
+
+
+def get_roll_odds(dice_count: int, ruleset: str = "STANDARD") -> RollOdds:
+    """
+    Get exact statistics for rolling dice_count dice.
+
+    Args:
+        dice_count: Number of dice in the cup (0 means a full reroll of 6 dice)
+        ruleset: Game ruleset - "SIMPLE", "STANDARD", or "ADVANCED"
+
+    Returns:
+        RollOdds for that dice count and ruleset
+    """
+    if dice_count == 0:
+        dice_count = MAX_DICE
+    ruleset = get_ruleset(ruleset).name
+    odds = ROLL_ODDS.get((ruleset, dice_count))
+    if odds is None:
+        # Rulesets registered after import are computed on first use
+        odds = ROLL_ODDS[(ruleset, dice_count)] = _compute_roll_odds(dice_count, ruleset)
+    return odds
+
+
+def get_bust_probability(dice_count: int, ruleset: str = "STANDARD") -> float:
+    """Probability that rolling dice_count dice produces no stashable dice"""
+    return get_roll_odds(dice_count, ruleset).bust_probability
@@ -1,6 +1,7 @@
 from typing import List, Tuple, Dict, Union
 from enum import Enum, auto
-import random
+from games.livedice_f.livedice_f_rulesets import get_ruleset
+from games.livedice_f.livedice_f_dice_hand import DiceHand
 
 class GameStateEnum(Enum):
     START_TURN = auto()
@@ -26,22 +27,9 @@ class LiveDiceFRules:
     MAX_DICE = 6
 
     @staticmethod
-    def roll_die() -> int:
-        return random.randint(1, 6)
-
-    @staticmethod
-    def get_scoring_rules() -> List[Dict[str, int]]:
-        return [
-            {"TRIPLE 1": 1000},
-            {"TRIPLE 2": 200},
-            {"TRIPLE 3": 300},
-            {"TRIPLE 4": 400},
-            {"TRIPLE 5": 500},
-            {"TRIPLE 6": 600},
-            {"SINGLE 1": 100},
-            {"SINGLE 5": 50},
-            {"DOUBLE 6": 100}
-        ]
+    def get_scoring_rules(ruleset: str = "STANDARD") -> Dict[str, Dict[str, int]]:
+        """Scoring combinations of a ruleset, e.g. {"TRIPLE 1": {"points": 1000}}"""
+        return get_ruleset(ruleset).get_scoring_rules()
 
     @staticmethod
     def calculate_score(dice_values: Union[List[int], int], stashed_together: bool = False, ruleset: str = "STANDARD") -> int:
@@ -58,37 +46,20 @@ class LiveDiceFRules:
         """
         if isinstance(dice_values, int):
             dice_values = [dice_values]
-        
-        score = 0
-        counts = [dice_values.count(i) for i in range(1, 7)]
-        
-        # SIMPLE MODE: Only 1s and 5s score points
-        if ruleset == "SIMPLE":
-            score += counts[0] * 100  # 1s
-            score += counts[4] * 50   # 5s
-            return score
-        
-        # STANDARD and ADVANCED modes: Full scoring rules
-        # Check for triples
-        for i, count in enumerate(counts):
-            if count >= 3:
-                score += 1000 if i == 0 else (i + 1) * 100
-                counts[i] -= 3
-                if stashed_together:
-                    return score  # Return immediately for triples when stashed together
-        
-        # Check for double 6
-        if counts[5] >= 2:
-            score += 100
-            counts[5] -= 2
-            if stashed_together:
-                return score  # Return immediately for double 6 when stashed together
-        
-        # Add remaining 1s and 5s
-        score += counts[0] * 100  # Remaining 1s
-        score += counts[4] * 50   # Remaining 5s
-        
-        return score
+        return get_ruleset(ruleset).calculate_score(dice_values, stashed_together)
+
+    @staticmethod
+    def calculate_scores_batch(rolls, ruleset: str = "STANDARD", stashed_together: bool = False):
+        """
+        Vectorized calculate_score/is_bust/get_stashable_dice for an (N, k) array of rolls.
+
+        Requires NumPy; see games.livedice_f.livedice_f_batch.score_rolls.
+
+        Returns:
+            Tuple of (scores, bust flags, stashable masks) as NumPy arrays
+        """
+        from games.livedice_f.livedice_f_batch import score_rolls
+        return score_rolls(rolls, ruleset, stashed_together)
 
     @staticmethod
     def get_scoring_combinations(dice_values: List[int], ruleset: str = "STANDARD") -> List[Tuple[str, int]]:
@@ -102,34 +73,7 @@ class LiveDiceFRules:
         Returns:
             List of tuples (combination_name, score)
         """
-        counts = [dice_values.count(i) for i in range(1, 7)]
-        combinations = []
-
-        # SIMPLE MODE: Only 1s and 5s
-        if ruleset == "SIMPLE":
-            if counts[0] > 0:
-                combinations.append((f"SINGLE 1{'s' if counts[0] > 1 else ''}", counts[0] * 100))
-            if counts[4] > 0:
-                combinations.append((f"SINGLE 5{'s' if counts[4] > 1 else ''}", counts[4] * 50))
-            return combinations
-
-        # STANDARD and ADVANCED modes: Full scoring
-        # Check for triples
-        for i, count in enumerate(counts):
-            if count >= 3:
-                combinations.append((f"TRIPLE {i+1}", 1000 if i == 0 else (i+1) * 100))
-
-        # Check for double 6
-        if counts[5] >= 2:
-            combinations.append(("DOUBLE 6", 100))
-
-        # Check for single 1s and 5s
-        if counts[0] > 0:
-            combinations.append((f"SINGLE 1{'s' if counts[0] > 1 else ''}", counts[0] * 100))
-        if counts[4] > 0:
-            combinations.append((f"SINGLE 5{'s' if counts[4] > 1 else ''}", counts[4] * 50))
-
-        return combinations
+        return get_ruleset(ruleset).get_scoring_combinations(dice_values)
 
     @staticmethod
     def get_stashable_dice(dice_values: List[int], ruleset: str = "STANDARD") -> List[int]:
@@ -143,26 +87,7 @@ class LiveDiceFRules:
         Returns:
             List of indices of stashable dice
         """
-        stashable = []
-        counts = [dice_values.count(i) for i in range(1, 7)]
-        
-        # SIMPLE MODE: Only 1s and 5s are stashable
-        if ruleset == "SIMPLE":
-            # Only add 1s and 5s
-            stashable.extend([j for j, v in enumerate(dice_values) if v == 1])  # 1's
-            stashable.extend([j for j, v in enumerate(dice_values) if v == 5])  # 5's
-            return sorted(list(set(stashable)))
-        
-        # STANDARD and ADVANCED modes: Full stashing rules
-        for i, count in enumerate(counts):
-            if count >= 3:
-                stashable.extend([j for j, v in enumerate(dice_values) if v == i + 1][:3])
-            elif i == 0 or i == 4:  # 1's and 5's
-                stashable.extend([j for j, v in enumerate(dice_values) if v == i + 1])
-            elif i == 5 and count >= 2:  # Double 6
-                stashable.extend([j for j, v in enumerate(dice_values) if v == 6][:2])
-        
-        return sorted(list(set(stashable)))  # Remove duplicates and sort
+        return get_ruleset(ruleset).get_stashable_dice(dice_values)
 
     @staticmethod
     def is_scoring_dice(dice: List[int]) -> bool:
@@ -176,7 +101,7 @@ class LiveDiceFRules:
 
     @staticmethod
     def describe_stash(stashed: List[int]) -> str:
-        counts = [stashed.count(i) for i in range(1, 7)]
+        counts = list(DiceHand.of(stashed).counts)
         descriptions = []
         
         for i in range(6):
@@ -212,7 +137,7 @@ class LiveDiceFRules:
     @staticmethod
     def is_bust(dice_values: List[int], ruleset: str = "STANDARD") -> bool:
         """Check if dice roll is a bust (no scoring dice)"""
-        return len(LiveDiceFRules.get_stashable_dice(dice_values, ruleset)) == 0
+        return get_ruleset(ruleset).is_bust(dice_values)
 
     @staticmethod
     def can_bank(has_stashed_this_turn: bool, virtual_score: int) -> bool:
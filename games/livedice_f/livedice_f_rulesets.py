@@ -0,0 +1,350 @@
+"""
+LIVEDICE F RULESETS
+Data-driven ruleset definitions compiled into lookup tables.
+
+A ruleset is declared as plain data: an ordered list of scoring combinations.
+Each combination is either a GROUP (a number of dice of one face, e.g. a triple
+or a double 6) or a SINGLE (individual dice of a face that score on their own).
+compile_ruleset() turns a definition into a CompiledRuleset, which evaluates
+every multiset of up to six dice once and answers all rules queries with a
+single dict lookup keyed by the packed count vector (see DiceHand). Adding a house rule means
+adding a definition and calling register_ruleset(); no scoring code changes.
+
+Semantics of a definition (matching the original hand-written rules):
+- Scoring consumes dice greedily: GROUP combinations in declaration order, each
+  face at most once per combination, then SINGLE dice left over.
+- When dice are stashed together, the first GROUP flagged "stash_together"
+  that matches is the whole score of the stash.
+- Combinations listed to the player are checked against the full roll, each
+  one independently.
+- The stashable dice of a face are limited to the size of the first GROUP that
+  matches it; otherwise every die of a SINGLE-scoring face is stashable.
+"""
+
+import copy
+from itertools import combinations_with_replacement
+from typing import Any, Callable, Dict, List, Tuple
+
+from games.livedice_f.livedice_f_dice_hand import (
+    MAX_DICE, FACE_WEIGHTS, DiceHand, pack_counts, unpack_counts, pack_dice,
+)
+
+
+# ============================================================================
+# RULESET DEFINITIONS
+# ============================================================================
+
+_TRIPLES = {
+    "name": "TRIPLE {face}",
+    "type": "GROUP",
+    "size": 3,
+    "points": {1: 1000, 2: 200, 3: 300, 4: 400, 5: 500, 6: 600},
+    "stash_together": True,
+}
+
+_DOUBLE_SIX = {
+    "name": "DOUBLE 6",
+    "type": "GROUP",
+    "size": 2,
+    "points": {6: 100},
+    "stash_together": True,
+}
+
+_SINGLES = {
+    "name": "SINGLE {face}",
+    "type": "SINGLE",
+    "points": {1: 100, 5: 50},
+}
+
+RULESET_DEFINITIONS: Dict[str, Dict[str, Any]] = {
+    "SIMPLE": {
+        "description": "Only ones and fives score",
+        "combinations": [_SINGLES],
+    },
+    "STANDARD": {
+        "description": "Triples, double 6, single ones and fives",
+        "combinations": [_TRIPLES, _DOUBLE_SIX, _SINGLES],
+    },
+    # ADVANCED currently scores like STANDARD; new combinations are added here
+    "ADVANCED": {
+        "description": "Standard combinations (room for streets and full houses)",
+        "combinations": [_TRIPLES, _DOUBLE_SIX, _SINGLES],
+    },
+}
+
+
+# ============================================================================
+# COMPILATION
+# ============================================================================
+
+class ScoreTableEntry:
+    """Precomputed rules results for one dice multiset under one ruleset"""
+
+    __slots__ = ("counts", "score", "score_together", "combinations", "stash_limits", "stashable_count", "is_bust")
+
+    def __init__(self, counts: Tuple[int, ...], score: int, score_together: int,
+                 combinations: Tuple[Tuple[str, int], ...], stash_limits: Tuple[int, ...]):
+        self.counts = counts
+        self.score = score
+        self.score_together = score_together
+        self.combinations = combinations
+        self.stash_limits = stash_limits
+        self.stashable_count = sum(stash_limits)
+        self.is_bust = self.stashable_count == 0
+
+
+class StashPartition:
+    """Highest-scoring decomposition of a dice selection into combinations"""
+
+    __slots__ = ("score", "combinations", "dice_used")
+
+    def __init__(self, score: int, combinations: Tuple[Tuple[str, int, Tuple[int, ...]], ...]):
+        self.score = score
+        # (combination_name, points, dice) ordered from highest to lowest points
+        self.combinations = combinations
+        self.dice_used = sum(len(dice) for _, _, dice in combinations)
+
+    def __repr__(self):
+        return f"StashPartition(score={self.score}, combinations={self.combinations})"
+
+
+def _flatten_definition(definition: Dict[str, Any]) -> Tuple[list, list]:
+    """Expand a definition into per-face GROUP and SINGLE combinations"""
+    groups = []   # (name, face_index, size, points, stash_together) in evaluation order
+    singles = []  # (name, face_index, points)
+    for combination in definition["combinations"]:
+        for face, points in sorted(combination["points"].items()):
+            name = combination["name"].format(face=face)
+            if combination["type"] == "GROUP":
+                groups.append((name, face - 1, combination["size"], points,
+                               combination.get("stash_together", False)))
+            elif combination["type"] == "SINGLE":
+                singles.append((name, face - 1, points))
+            else:
+                raise ValueError(f"Unknown combination type: {combination['type']}")
+    return groups, singles
+
+
+def _compile_evaluators(definition: Dict[str, Any]) -> Tuple[Callable, Callable, Callable]:
+    """Flatten a definition into evaluator closures working on count vectors"""
+    groups, singles = _flatten_definition(definition)
+    group_limits = {}
+    for _, face_index, size, _, _ in groups:
+        group_limits.setdefault(face_index, []).append(size)
+    single_faces = {face_index for _, face_index, _ in singles}
+
+    def score_counts(counts, stashed_together: bool = False) -> int:
+        remaining = list(counts)
+        score = 0
+        for _, face_index, size, points, together in groups:
+            if remaining[face_index] >= size:
+                score += points
+                remaining[face_index] -= size
+                if stashed_together and together:
+                    return score
+        for _, face_index, points in singles:
+            score += remaining[face_index] * points
+        return score
+
+    def combinations_for_counts(counts) -> List[Tuple[str, int]]:
+        combinations = []
+        for name, face_index, size, points, _ in groups:
+            if counts[face_index] >= size:
+                combinations.append((name, points))
+        for name, face_index, points in singles:
+            count = counts[face_index]
+            if count > 0:
+                combinations.append((f"{name}{'s' if count > 1 else ''}", count * points))
+        return combinations
+
+    def stash_limits_for_counts(counts) -> Tuple[int, ...]:
+        limits = [0] * 6
+        for face_index, count in enumerate(counts):
+            for size in group_limits.get(face_index, ()):
+                if count >= size:
+                    limits[face_index] = size
+                    break
+            else:
+                if face_index in single_faces:
+                    limits[face_index] = count
+        return tuple(limits)
+
+    return score_counts, combinations_for_counts, stash_limits_for_counts
+
+
+def _solve_partitions(definition: Dict[str, Any], keys) -> Dict[int, StashPartition]:
+    """
+    Best stash partition for every count vector in keys, memoized on the packed key.
+
+    A partition is any sequence of GROUP combinations followed by the leftover
+    dice scored as SINGLEs; the best one has the highest score and, on ties,
+    uses the most dice.
+    """
+    groups, singles = _flatten_definition(definition)
+    memo: Dict[int, Tuple[int, int, Tuple]] = {}
+
+    def solve(key: int) -> Tuple[int, int, Tuple]:
+        if key in memo:
+            return memo[key]
+        counts = unpack_counts(key)
+        # Baseline: no more groups, every scoring leftover die as a single
+        score, used, combinations = 0, 0, []
+        for name, face_index, points in singles:
+            count = counts[face_index]
+            if count > 0:
+                score += count * points
+                used += count
+                combinations.append((f"{name}{'s' if count > 1 else ''}", count * points, (face_index + 1,) * count))
+        best = (score, used, tuple(combinations))
+        for name, face_index, size, points, _ in groups:
+            if counts[face_index] >= size:
+                rest_score, rest_used, rest = solve(key - (size << (3 * face_index)))
+                candidate = (points + rest_score, size + rest_used, ((name, points, (face_index + 1,) * size),) + rest)
+                if candidate[:2] > best[:2]:
+                    best = candidate
+        memo[key] = best
+        return best
+
+    partitions = {}
+    for key in keys:
+        score, _, combinations = solve(key)
+        ordered = tuple(sorted(combinations, key=lambda combination: -combination[1]))
+        partitions[key] = StashPartition(score, ordered)
+    return partitions
+
+
+class CompiledRuleset:
+    """
+    A ruleset compiled into per-multiset lookup tables.
+
+    Holds no per-call branching: every query resolves the dice to a packed key
+    and reads the precomputed ScoreTableEntry. Hands outside the table (more
+    than six dice) fall back to the compiled count evaluators.
+    """
+
+    def __init__(self, name: str, definition: Dict[str, Any]):
+        self.name = name
+        self.definition = definition
+        self.score_counts, self.combinations_for_counts, self.stash_limits_for_counts = \
+            _compile_evaluators(definition)
+        self.table: Dict[int, ScoreTableEntry] = {}
+        for dice_count in range(MAX_DICE + 1):
+            for multiset in combinations_with_replacement(range(1, 7), dice_count):
+                counts = tuple(multiset.count(face) for face in range(1, 7))
+                self.table[pack_counts(counts)] = self._evaluate(counts)
+        self.partitions = _solve_partitions(definition, self.table)
+
+    def _evaluate(self, counts: Tuple[int, ...]) -> ScoreTableEntry:
+        return ScoreTableEntry(
+            counts,
+            self.score_counts(counts, False),
+            self.score_counts(counts, True),
+            tuple(self.combinations_for_counts(counts)),
+            self.stash_limits_for_counts(counts),
+        )
+
+    def entry(self, dice_values: List[int]) -> ScoreTableEntry:
+        """Table entry for a hand (list of values or DiceHand); hands outside the table are evaluated on the fly"""
+        key = pack_dice(dice_values)
+        if key is None:
+            if isinstance(dice_values, DiceHand):
+                return self._evaluate(dice_values.counts)
+            counts = tuple(dice_values.count(face) for face in range(1, 7))
+            return self._evaluate(counts)
+        return self.table[key]
+
+    def calculate_score(self, dice_values: List[int], stashed_together: bool = False) -> int:
+        entry = self.entry(dice_values)
+        return entry.score_together if stashed_together else entry.score
+
+    def get_scoring_combinations(self, dice_values: List[int]) -> List[Tuple[str, int]]:
+        return list(self.entry(dice_values).combinations)
+
+    def get_stashable_dice(self, dice_values: List[int]) -> List[int]:
+        entry = self.entry(dice_values)
+        if entry.is_bust:
+            return []
+        # The table only stores how many dice of each face are stashable;
+        # the first ones of each face (in roll order) are the stashable ones.
+        if isinstance(dice_values, DiceHand):
+            stashable = []
+            for indices, limit in zip(dice_values.face_indices, entry.stash_limits):
+                stashable.extend(indices[:limit])
+            stashable.sort()
+            return stashable
+        remaining = list(entry.stash_limits)
+        stashable = []
+        for index, value in enumerate(dice_values):
+            if 1 <= value <= 6 and remaining[value - 1] > 0:
+                remaining[value - 1] -= 1
+                stashable.append(index)
+        return stashable
+
+    def is_bust(self, dice_values: List[int]) -> bool:
+        return self.entry(dice_values).is_bust
+
+    def solve_stash(self, dice_values: List[int]) -> StashPartition:
+        """
+        Best way to stash the given dice, in one table lookup.
+
+        Args:
+            dice_values: Values of the selected dice
+
+        Returns:
+            StashPartition with the total score and its combinations
+        """
+        key = pack_dice(dice_values)
+        if key is None:
+            raise ValueError(f"Cannot stash more than {MAX_DICE} dice: {dice_values}")
+        return self.partitions[key]
+
+    def get_scoring_rules(self) -> Dict[str, Dict[str, int]]:
+        """Scoring combinations of this ruleset, e.g. {"TRIPLE 1": {"points": 1000}}"""
+        rules = {}
+        for combination in self.definition["combinations"]:
+            for face, points in sorted(combination["points"].items()):
+                rules[combination["name"].format(face=face)] = {"points": points}
+        return rules
+
+
+def compile_ruleset(name: str, definition: Dict[str, Any]) -> CompiledRuleset:
+    """Compile a ruleset definition (the definition is copied, later edits do not leak in)"""
+    return CompiledRuleset(name, copy.deepcopy(definition))
+
+
+COMPILED_RULESETS: Dict[str, CompiledRuleset] = {
+    name: compile_ruleset(name, definition) for name, definition in RULESET_DEFINITIONS.items()
+}
+
+RULESETS = tuple(RULESET_DEFINITIONS)
+
+
+def register_ruleset(name: str, definition: Dict[str, Any]) -> CompiledRuleset:
+    """
+    Compile and register a (house) ruleset so it can be selected by name.
+
+    Args:
+        name: Ruleset name as passed to GameStateManager
+        definition: Dict with an ordered "combinations" list (see module docstring)
+
+    Returns:
+        The compiled ruleset
+
+    Raises:
+        ValueError: If the name is already registered. Odds tables, batch
+            arrays, bot policies and win models are cached by ruleset name,
+            so a name always keeps the rules it was first registered with.
+    """
+    global RULESETS
+    if name in COMPILED_RULESETS:
+        raise ValueError(f"Ruleset {name!r} is already registered")
+    compiled = compile_ruleset(name, definition)
+    RULESET_DEFINITIONS[name] = compiled.definition
+    COMPILED_RULESETS[name] = compiled
+    RULESETS = tuple(RULESET_DEFINITIONS)
+    return compiled
+
+
+def get_ruleset(name: str) -> CompiledRuleset:
+    """Compiled ruleset by name; unknown names score like STANDARD, as they always have"""
+    return COMPILED_RULESETS.get(name) or COMPILED_RULESETS["STANDARD"]
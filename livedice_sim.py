@@ -0,0 +1,21 @@
+"""
+LIVEDICE SIM MODULE
+Command-line entry point for headless bot-vs-bot tournaments.
+
+Plays any lineup of EASY / NORMAL / HARD bots over all cores without pygame
+(see core.game_engine.tournament for the options and the statistics):
+
+    python livedice_sim.py --bots HARD EASY --games 100000 --ruleset ADVANCED
+"""
+
+import os
+import sys
+
+project_root = os.path.abspath(os.path.dirname(__file__))
+sys.path.append(project_root)
+
+from core.game_engine.tournament import main
+
+
+if __name__ == "__main__":
+    main()
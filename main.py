@@ -20,6 +20,25 @@ sys.path.append(project_root)
 from ui.in_game.in_game_ui import InGameUI
 from ui.in_game.game_runner import GameRunner
 from startup_menu import StartupMenu
+from core.game_engine.opponent_model import OpponentModel
+from core.game_state.game_snapshot import SnapshotError, decode_setup, discard_snapshot, load_snapshot
+from core.game_state.game_state import GameStateManager
+
+
+def load_resume_snapshot():
+    """Autosaved game for --resume, or None; an autosave that cannot be restored is discarded"""
+    snapshot = load_snapshot()
+    if snapshot is None:
+        print("No autosaved game to resume - starting a new one")
+        return None
+    try:
+        # A headless restore checks the whole snapshot before any UI is built
+        GameStateManager.restore(snapshot, opponent_model=OpponentModel(None))
+    except SnapshotError as error:
+        print(f"Autosaved game cannot be resumed ({error}) - starting a new one")
+        discard_snapshot()
+        return None
+    return snapshot
 
 
 def main():
@@ -32,77 +51,88 @@ def main():
     screen = pygame.display.set_mode((screen_width, screen_height))
     pygame.display.set_caption("•LIVEDICE [ F ]")
     
+    # python main.py --resume continues the match autosaved after its last completed turn
+    snapshot = load_resume_snapshot() if "--resume" in sys.argv[1:] else None
+
     # Main game loop - allows returning to startup menu
     while True:
-        # Run the startup menu
-        startup_menu = StartupMenu(screen)
-        result = startup_menu.run()
+        if snapshot is not None:
+            # Resume the autosaved match with its own configuration
+            setup, _ = decode_setup(snapshot)
+            human_players, ai_players = setup["human_players"], setup["ai_players"]
+            endgoal, ruleset, bot_difficulty = setup["endgoal"], setup["ruleset"], setup["bot_difficulty"]
+            print("Resuming autosaved game...")
+        else:
+            # Run the startup menu
+            startup_menu = StartupMenu(screen)
+            result = startup_menu.run()
         
-        # Debug: Show what we got
-        print(f"DEBUG: startup_menu.run() returned: {result}")
-        print(f"DEBUG: Type: {type(result)}")
-        if isinstance(result, tuple):
-            print(f"DEBUG: Length: {len(result)}")
-            for i, val in enumerate(result):
-                print(f"DEBUG:   [{i}] = {val} (type: {type(val).__name__})")
+            # Debug: Show what we got
+            print(f"DEBUG: startup_menu.run() returned: {result}")
+            print(f"DEBUG: Type: {type(result)}")
+            if isinstance(result, tuple):
+                print(f"DEBUG: Length: {len(result)}")
+                for i, val in enumerate(result):
+                    print(f"DEBUG:   [{i}] = {val} (type: {type(val).__name__})")
         
-        # Handle different return formats
-        if isinstance(result, tuple):
-            if len(result) == 5:
-                # New menu with full configuration
-                human_players, ai_players, endgoal, ruleset, bot_difficulty = result
+            # Handle different return formats
+            if isinstance(result, tuple):
+                if len(result) == 5:
+                    # New menu with full configuration
+                    human_players, ai_players, endgoal, ruleset, bot_difficulty = result
                 
-                # Type safety: ensure correct types
-                human_players = int(human_players)
-                ai_players = int(ai_players)
-                endgoal = int(endgoal) if str(endgoal).isdigit() else 4000
-                ruleset = str(ruleset)
-                bot_difficulty = str(bot_difficulty)
+                    # Type safety: ensure correct types
+                    human_players = int(human_players)
+                    ai_players = int(ai_players)
+                    endgoal = int(endgoal) if str(endgoal).isdigit() else 4000
+                    ruleset = str(ruleset)
+                    bot_difficulty = str(bot_difficulty)
                 
-                print()
-                print("=" * 60)
-                print("GAME CONFIGURATION:")
-                print(f"  Human Players: {human_players}")
-                print(f"  AI Players: {ai_players}")
-                print(f"  End Goal: {endgoal}")
-                print(f"  Ruleset: {ruleset}")
-                print(f"  Bot Difficulty: {bot_difficulty}")
-                print("=" * 60)
-                print()
+                    print()
+                    print("=" * 60)
+                    print("GAME CONFIGURATION:")
+                    print(f"  Human Players: {human_players}")
+                    print(f"  AI Players: {ai_players}")
+                    print(f"  End Goal: {endgoal}")
+                    print(f"  Ruleset: {ruleset}")
+                    print(f"  Bot Difficulty: {bot_difficulty}")
+                    print("=" * 60)
+                    print()
                 
-            elif len(result) == 2:
-                # Old menu - only player counts
-                human_players, ai_players = result
-                endgoal = 4000
-                ruleset = "STANDARD"
-                bot_difficulty = "NORMAL"
+                elif len(result) == 2:
+                    # Old menu - only player counts
+                    human_players, ai_players = result
+                    endgoal = 4000
+                    ruleset = "STANDARD"
+                    bot_difficulty = "NORMAL"
                 
-                print()
-                print("=" * 60)
-                print("⚠️  OLD STARTUP MENU DETECTED")
-                print("Using default configuration:")
-                print(f"  Human Players: {human_players}")
-                print(f"  AI Players: {ai_players}")
-                print(f"  End Goal: {endgoal} (default)")
-                print(f"  Ruleset: {ruleset} (default)")
-                print(f"  Bot Difficulty: {bot_difficulty} (default)")
-                print("=" * 60)
-                print()
+                    print()
+                    print("=" * 60)
+                    print("⚠️  OLD STARTUP MENU DETECTED")
+                    print("Using default configuration:")
+                    print(f"  Human Players: {human_players}")
+                    print(f"  AI Players: {ai_players}")
+                    print(f"  End Goal: {endgoal} (default)")
+                    print(f"  Ruleset: {ruleset} (default)")
+                    print(f"  Bot Difficulty: {bot_difficulty} (default)")
+                    print("=" * 60)
+                    print()
+                else:
+                    print(f"ERROR: Unexpected number of return values: {len(result)}")
+                    print(f"Expected 2 or 5, got {len(result)}")
+                    print(f"Values: {result}")
+                    print()
+                    print("Please check your startup_menu.py return statement!")
+                    sys.exit(1)
             else:
-                print(f"ERROR: Unexpected number of return values: {len(result)}")
-                print(f"Expected 2 or 5, got {len(result)}")
-                print(f"Values: {result}")
-                print()
-                print("Please check your startup_menu.py return statement!")
+                print(f"ERROR: Unexpected return type: {type(result)}")
+                print(f"Expected tuple, got {result}")
                 sys.exit(1)
-        else:
-            print(f"ERROR: Unexpected return type: {type(result)}")
-            print(f"Expected tuple, got {result}")
-            sys.exit(1)
 
         # Create the InGameUI instance with the selected game configuration
         print("Initializing game UI...")
-        in_game_ui = InGameUI(human_players, ai_players, endgoal, ruleset, bot_difficulty)
+        in_game_ui = InGameUI(human_players, ai_players, endgoal, ruleset, bot_difficulty, snapshot=snapshot)
+        snapshot = None
         in_game_ui.initialize_game_log()
 
         # Run the game
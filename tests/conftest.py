@@ -0,0 +1,80 @@
+"""
+Test configuration: makes the repository root importable (core, games, ui)
+whichever directory pytest is started from, and provides headless games.
+"""
+
+import os
+import random
+import sys
+
+import pytest
+
+ROOT = os.path.dirname(os.path.dirname(os.path.abspath(__file__)))
+if ROOT not in sys.path:
+    sys.path.insert(0, ROOT)
+
+# Project imports follow the path setup
+from core.game_engine.bot_turn import play_game
+from core.game_engine.go_bot_ai import BotAI
+from core.game_engine.opponent_model import OpponentModel
+from core.game_state.game_state import GameStateManager
+
+
+def _play_human_game(seed: int, max_actions: int = 3000, stop_after=None, attach=None) -> GameStateManager:
+    """One human against one bot, the human clicking random legal actions through the referee"""
+    game = GameStateManager(None, 1, 1, seed=seed, opponent_model=OpponentModel(None))
+    if attach is not None:
+        game.add_observer(attach(game))
+    referee = game.referee
+    choices = random.Random(seed)
+    for action_number in range(max_actions):
+        if referee.is_game_over() or (stop_after is not None and action_number >= stop_after):
+            break
+        if referee.is_turn_over():
+            referee.end_turn()
+            continue
+        if game.current_game_state.name in ("NEXTUP_READYUP", "START_TURN"):
+            game.roll_dice()
+            continue
+        stashable = referee.get_stashable_dice(game.dice_hand)
+        if stashable and not game.current_player.stashed_dice_this_roll:
+            game.set_selected_dice(stashable[:choices.randint(1, len(stashable))])
+            referee.perform_action("STASH")
+            continue
+        # The UI only offers END_TURN from the bank and bust summaries
+        options = sorted(action for action in referee.legal_actions() if action not in ("STASH", "END_TURN"))
+        if not options:
+            referee.end_turn()
+            continue
+        referee.perform_action(choices.choice(options))
+    return game
+
+
+def _play_bot_game(seed: int, ruleset: str = "STANDARD") -> GameStateManager:
+    game = GameStateManager(None, 0, 2, ruleset=ruleset, bot_difficulty="HARD", seed=seed,
+                            opponent_model=OpponentModel(None))
+    play_game(game, [BotAI(game), BotAI(game, difficulty="EASY")])
+    return game
+
+
+@pytest.fixture
+def human_game():
+    """Factory: human_game(seed, stop_after=None, attach=None) plays a human-vs-bot game without a UI
+
+    attach(game) returns an observer to add before the first action.
+    """
+    return _play_human_game
+
+
+@pytest.fixture
+def bot_game():
+    """Factory: bot_game(seed, ruleset) plays a HARD vs EASY bot game"""
+    return _play_bot_game
+
+
+@pytest.fixture(autouse=True)
+def in_memory_opponent_model(monkeypatch):
+    """Keep the process-wide opponent model away from the saved profiles"""
+    from core.game_engine import opponent_model
+
+    monkeypatch.setattr(opponent_model, "_model", OpponentModel(None))
@@ -0,0 +1,64 @@
+"""
+Vectorized bot decisions agree with the scalar policy the bots use.
+"""
+
+import random
+
+import pytest
+
+from core.game_engine.bot_policy import get_policy
+from games.livedice_f.livedice_f_dice_hand import MAX_DICE
+
+np = pytest.importorskip("numpy")
+bot_batch = pytest.importorskip("core.game_engine.bot_batch")
+
+
+def _random_states(seed: int, count: int):
+    choices = random.Random(seed)
+    states = []
+    for _ in range(count):
+        dice_count = choices.randint(1, MAX_DICE)
+        dice = [choices.randint(1, 6) for _ in range(dice_count)]
+        # Carries on the solved grid use the precomputed table, the others scan the options
+        carry = choices.choice((choices.randrange(0, 3000, 50), choices.randrange(0, 6000)))
+        states.append(dice + [0] * (MAX_DICE - dice_count) + [MAX_DICE - dice_count, carry, 0])
+    return states
+
+
+@pytest.mark.parametrize("ruleset", ("STANDARD", "ADVANCED", "SIMPLE"))
+@pytest.mark.parametrize("risk_bonus", (0.0, 40.0))
+def test_stashes_match_choose_stash(ruleset, risk_bonus):
+    policy = get_policy(ruleset)
+    states = _random_states(len(ruleset), 500)
+    actions, stash_masks = bot_batch.decide_batch(states, ruleset, risk_bonus)
+    for state, action, mask in zip(states, actions, stash_masks):
+        dice = [value for value in state[:MAX_DICE] if value]
+        indices, _, _ = policy.choose_stash(dice, state[bot_batch.STASHED_COLUMN], state[bot_batch.CARRY_COLUMN],
+                                            risk_bonus)
+        if indices:
+            assert action == bot_batch.ACTION_STASH, state
+        else:
+            assert action == bot_batch.ACTION_END_TURN, state
+        assert list(np.flatnonzero(mask)) == indices, state
+
+
+def test_roll_or_bank_after_stashing_follows_the_policy():
+    policy = get_policy("STANDARD")
+    choices = random.Random(1)
+    states = []
+    for _ in range(500):
+        stashed = choices.randint(1, MAX_DICE - 1)
+        states.append([2, 3] + [0] * (MAX_DICE - 2) + [stashed, choices.randrange(50, 4000, 50), 1])
+    actions, stash_masks = bot_batch.decide_batch(states)
+    assert not stash_masks.any()
+    for state, action in zip(states, actions):
+        roll = policy.roll_value(MAX_DICE - state[bot_batch.STASHED_COLUMN], state[bot_batch.CARRY_COLUMN])
+        expected = bot_batch.ACTION_ROLL if roll > state[bot_batch.CARRY_COLUMN] else bot_batch.ACTION_BANK
+        assert action == expected, state
+
+
+def test_bad_states_are_rejected():
+    with pytest.raises(ValueError):
+        bot_batch.decide_batch([[1, 2, 3]])
+    with pytest.raises(ValueError):
+        bot_batch.decide_batch([[7, 0, 0, 0, 0, 0, 0, 0, 0]])
@@ -0,0 +1,71 @@
+"""
+BotTurn: a bot turn played a step at a time decides before it acts, so a
+front end can pause between the two without the board changing under it.
+"""
+
+import pytest
+
+from core.game_engine.bot_turn import BotTurn
+from core.game_engine.go_bot_ai import BotAI
+from core.game_state.game_observer import GameObserver
+from core.game_state.game_state import GameStateManager
+
+
+class EventLog(GameObserver):
+    """Names of the hooks notified, in order"""
+
+    def __init__(self):
+        self.events = []
+
+    def on_dice_rolled(self, game_state, dice_values):
+        self.events.append("on_dice_rolled")
+
+    def on_dice_stashed(self, game_state, dice_indices, stashed_dice, points):
+        self.events.append("on_dice_stashed")
+
+    def on_points_banked(self, game_state, points):
+        self.events.append("on_points_banked")
+
+    def on_bot_turn_started(self, game_state, bot):
+        self.events.append("on_bot_turn_started")
+
+    def on_bot_decision(self, game_state, bot, decision, thinking_message):
+        self.events.append("on_bot_decision")
+
+    def on_bot_action(self, game_state, bot, decision):
+        self.events.append("on_bot_action")
+
+    def on_bot_action_rejected(self, game_state, bot, decision):
+        self.events.append("on_bot_action_rejected")
+
+    def on_bot_turn_ended(self, game_state, bot, decisions, hit_limit):
+        self.events.append("on_bot_turn_ended")
+
+
+@pytest.mark.parametrize("seed", range(6))
+def test_decisions_and_actions_are_separate_steps(seed):
+    game = GameStateManager(None, 0, 2, bot_difficulty="HARD", seed=seed)
+    log = EventLog()
+    game.add_observer(log)
+    for _ in range(6):
+        if game.referee.is_game_over():
+            break
+        turn = BotTurn(game, BotAI(game))
+        steps = []
+        while True:
+            log.events.clear()
+            more = turn.step()
+            steps.append(list(log.events))
+            if not more:
+                break
+        assert not turn.step()
+
+        assert steps[0][:2] == ["on_bot_turn_started", "on_bot_decision"]
+        assert steps[-1][-1] == "on_bot_turn_ended"
+        assert sum(events.count("on_bot_turn_ended") for events in steps) == 1
+        for events in steps:
+            if "on_bot_decision" in events:
+                # The board only changes in the step after the decision
+                assert events in (["on_bot_decision"], ["on_bot_turn_started", "on_bot_decision"])
+        assert sum(events.count("on_bot_decision") for events in steps) == turn.decisions
+        game.referee.end_turn()
@@ -0,0 +1,63 @@
+"""
+ExpectimaxSearch: stash choices, the LRU transposition cache and deadlines.
+"""
+
+from types import SimpleNamespace
+
+import pytest
+
+from core.game_engine import expectimax
+from core.game_engine.bot_policy import get_policy
+from core.game_engine.expectimax import ExpectimaxSearch, SearchTimeout
+
+
+@pytest.mark.parametrize("hand, stashed_count, carry", [
+    ([1, 1, 1, 2, 3, 4], 0, 0),
+    ([5, 2, 3, 4, 6, 6], 0, 0),
+    ([1, 5, 2, 2, 3, 4], 0, 0),
+    ([5, 5, 5, 1, 2, 3], 0, 0),
+    ([1, 2, 3], 3, 300),
+])
+def test_stash_choice_matches_the_policy_table(hand, stashed_count, carry):
+    indices, roll_after, value = ExpectimaxSearch().choose_stash(hand, stashed_count, carry)
+    expected_indices, expected_roll, _ = get_policy("STANDARD").choose_stash(hand, stashed_count, carry)
+    assert (indices, roll_after) == (expected_indices, expected_roll)
+    assert value > 0
+
+
+def test_nothing_to_stash():
+    assert ExpectimaxSearch().choose_stash([2, 3, 4, 6], 2, 100) == ([], False, 0.0)
+
+
+def test_lru_evicts_the_least_recently_used_node():
+    search = ExpectimaxSearch(cache_size=3)
+    for key in ("a", "b", "c"):
+        search._store(key, 1.0)
+    assert search._lookup("a") == 1.0
+    search._store("d", 1.0)
+    assert list(search.cache) == ["c", "a", "d"]
+
+
+def test_bounded_cache_gives_the_same_choices():
+    hand = [1, 5, 2, 2, 3, 4]
+    small = ExpectimaxSearch(cache_size=200)
+    assert small.choose_stash(hand, 0, 0) == ExpectimaxSearch().choose_stash(hand, 0, 0)
+    assert len(small.cache) == 200
+
+
+def test_timeout_keeps_finished_nodes(monkeypatch):
+    hand = [1, 5, 2, 2, 3, 4]
+    fresh = ExpectimaxSearch()
+    expected = fresh.choose_stash(hand, 0, 0)
+
+    # A clock that advances one tick per chance-node miss stops the search part way
+    ticks = iter(range(10 ** 9))
+    monkeypatch.setattr(expectimax, "time", SimpleNamespace(perf_counter=lambda: next(ticks)))
+    search = ExpectimaxSearch()
+    with pytest.raises(SearchTimeout):
+        search.choose_stash(hand, 0, 0, deadline=20)
+    assert len(search.cache) > 0
+
+    misses = search.misses
+    assert search.choose_stash(hand, 0, 0, deadline=10 ** 9) == expected
+    assert search.misses - misses < fresh.misses
@@ -0,0 +1,102 @@
+"""
+Binary game records: byte-identical replay, record files and corrupt input.
+"""
+
+import io
+
+import pytest
+
+from core.game_engine import opponent_model
+from core.game_state.game_record import (
+    RecordError, decode_header, iter_events, read_records, replay_record, write_records,
+)
+
+
+def assert_same_game(replayed, game):
+    assert replayed.recorder.to_bytes() == game.recorder.to_bytes()
+    assert [player.get_total_score() for player in replayed.players] == \
+        [player.get_total_score() for player in game.players]
+    assert replayed.current_game_state == game.current_game_state
+    assert replayed.dice_values == game.dice_values
+    assert replayed.current_player_index == game.current_player_index
+
+
+@pytest.mark.parametrize("seed", range(6))
+def test_human_game_replays_byte_identical(human_game, seed):
+    game = human_game(seed)
+    assert_same_game(replay_record(game.recorder.to_bytes()), game)
+
+
+@pytest.mark.parametrize("ruleset", ("SIMPLE", "STANDARD", "ADVANCED"))
+def test_bot_game_replays_byte_identical(bot_game, ruleset):
+    game = bot_game(7, ruleset)
+    assert_same_game(replay_record(game.recorder.to_bytes()), game)
+
+
+def test_record_covers_every_action(human_game):
+    actions = set()
+    for seed in range(6):
+        actions.update(action for action, _ in iter_events(human_game(seed).recorder.to_bytes()))
+    assert {"ROLL", "SELECT", "STASH", "BANK", "END_TURN"} <= actions
+
+
+def test_header_holds_the_setup(human_game):
+    setup, _ = decode_header(human_game(3, stop_after=5).recorder.to_bytes())
+    assert setup == {"human_players": 1, "ai_players": 1, "endgoal": 4000, "seed": 3,
+                     "ruleset": "STANDARD", "bot_difficulty": "NORMAL"}
+
+
+@pytest.mark.parametrize("seed", (-3, -(2 ** 63), 2 ** 63 - 1))
+def test_any_seed_is_recorded_and_replayed(human_game, seed):
+    game = human_game(seed, stop_after=300)
+    assert decode_header(game.recorder.to_bytes())[0]["seed"] == seed
+    assert_same_game(replay_record(game.recorder.to_bytes()), game)
+
+
+def test_replay_does_not_feed_the_shared_opponent_model(human_game):
+    game = human_game(1)
+    decisions = game.opponent_model.profile("@VIDEO-GAMER-1").decisions
+    assert decisions > 0
+    replayed = replay_record(game.recorder.to_bytes())
+    shared = opponent_model.get_opponent_model()
+    assert replayed.opponent_model is not shared
+    assert not shared.profiles and not shared.dirty
+    assert game.opponent_model.profile("@VIDEO-GAMER-1").decisions == decisions
+
+
+def test_record_files_round_trip(human_game, bot_game):
+    records = [human_game(2).recorder.to_bytes(), bot_game(2).recorder.to_bytes(), b""]
+    handle = io.BytesIO()
+    written = write_records(handle, records)
+    assert written == len(handle.getvalue())
+    handle.seek(0)
+    assert list(read_records(handle)) == records
+
+
+# ============================================================================
+# CORRUPT INPUT
+# ============================================================================
+
+def test_corrupt_records_raise_record_error(human_game):
+    record = human_game(4).recorder.to_bytes()
+    _, first_event = decode_header(record)
+    corrupt = [
+        b"",
+        b"XYZ" + record[3:],
+        record[:3] + bytes([record[3] + 1]) + record[4:],
+        record[:first_event - 2],
+        record[:first_event] + bytes([0xF0]),
+        record[:first_event] + bytes([0x26]),
+        record[:first_event] + bytes([0x30]),
+    ]
+    for data in corrupt:
+        with pytest.raises(RecordError):
+            list(iter_events(data))
+
+
+def test_truncated_record_file_raises_record_error(human_game):
+    handle = io.BytesIO()
+    write_records(handle, [human_game(5, stop_after=10).recorder.to_bytes()])
+    handle = io.BytesIO(handle.getvalue()[:-1])
+    with pytest.raises(RecordError):
+        list(read_records(handle))
@@ -0,0 +1,154 @@
+"""
+Game snapshots: restored games continue exactly like the original, forks
+are independent, and corrupt or foreign data raises SnapshotError.
+"""
+
+import random
+
+import pytest
+
+from core.game_engine import opponent_model
+from core.game_engine.bot_turn import play_bot_turn, play_game
+from core.game_engine.go_bot_ai import BotAI
+from core.game_engine.opponent_model import OpponentModel
+from core.game_state.game_observer import GameObserver
+from core.game_state.game_snapshot import (
+    SnapshotError, decode_setup, discard_snapshot, load_snapshot, save_snapshot,
+)
+from core.game_state.game_state import GameStateManager
+
+
+class SnapshotAt(GameObserver):
+    """Takes a snapshot at the n-th roll, stash, new stash or turn end"""
+
+    def __init__(self, event_number: int):
+        self.event_number = event_number
+        self.events = 0
+        self.data = None
+
+    def _tick(self, game_state):
+        self.events += 1
+        if self.events == self.event_number:
+            self.data = game_state.snapshot()
+
+    def on_dice_rolled(self, game_state, dice_values):
+        self._tick(game_state)
+
+    def on_dice_stashed(self, game_state, dice_indices, stashed_dice, points):
+        self._tick(game_state)
+
+    def on_new_stash_started(self, game_state):
+        self._tick(game_state)
+
+    def on_turn_ended(self, game_state):
+        self._tick(game_state)
+
+
+def finish(game, difficulties):
+    """Play the current turn out, then the rest of the game"""
+    if not game.referee.is_game_over():
+        play_bot_turn(game, BotAI(game, difficulty=difficulties[game.current_player_index]))
+        game.referee.end_turn()
+    play_game(game, [BotAI(game, difficulty=difficulty) for difficulty in difficulties])
+
+
+@pytest.mark.parametrize("seed", range(12))
+def test_restored_game_continues_like_the_original(seed):
+    difficulties = ("HARD", "EASY") if seed % 2 else ("NORMAL", "HARD")
+    game = GameStateManager(None, 0, 2, ruleset=("STANDARD", "ADVANCED", "SIMPLE")[seed % 3], seed=seed,
+                            opponent_model=OpponentModel(None))
+    cut = SnapshotAt(random.Random(seed).randint(1, 40))
+    game.add_observer(cut)
+    play_game(game, [BotAI(game, difficulty=difficulty) for difficulty in difficulties])
+    assert cut.data is not None
+
+    restored = GameStateManager.restore(cut.data, opponent_model=OpponentModel(None))
+    assert restored.snapshot() == cut.data
+    finish(restored, difficulties)
+    assert restored.recorder.to_bytes() == game.recorder.to_bytes()
+    assert [player.get_total_score() for player in restored.players] == \
+        [player.get_total_score() for player in game.players]
+
+
+def test_human_game_round_trips(human_game):
+    game = human_game(8, stop_after=120)
+    data = game.snapshot()
+    restored = GameStateManager.restore(data)
+    assert restored.snapshot() == data
+    assert restored.dice_values == game.dice_values
+    assert restored.selected_dice == game.selected_dice
+    assert restored.current_game_state == game.current_game_state
+    assert restored.current_player.stashed_dice == game.current_player.stashed_dice
+    setup, _ = decode_setup(data)
+    assert (setup["human_players"], setup["ai_players"], setup["seed"]) == (1, 1, 8)
+
+
+@pytest.mark.parametrize("seed", (-3, -(2 ** 63)))
+def test_negative_seed_round_trips(human_game, seed):
+    game = human_game(seed, stop_after=150)
+    data = game.snapshot()
+    assert decode_setup(data)[0]["seed"] == seed
+    restored = GameStateManager.restore(data)
+    assert restored.rng.seed == seed
+    assert restored.snapshot() == data
+
+
+def test_snapshot_without_record(human_game):
+    game = human_game(9, stop_after=60)
+    restored = GameStateManager.restore(game.snapshot(include_record=False))
+    assert restored.recorder is None
+    assert restored.snapshot() == game.snapshot(include_record=False)
+
+
+def test_fork_is_independent_and_learns_in_memory(human_game):
+    game = human_game(10, stop_after=200)
+    decisions = game.opponent_model.profile("@VIDEO-GAMER-1").decisions
+    fork = game.fork()
+    assert fork.observers == [] and fork.recorder is None
+    assert fork.opponent_model is not game.opponent_model and fork.opponent_model.path is None
+    assert fork.opponent_model.estimated_threshold("@VIDEO-GAMER-1") == \
+        game.opponent_model.estimated_threshold("@VIDEO-GAMER-1")
+
+    fork.players[0].turn_scores.append(500, 1, 1)
+    fork.opponent_model.observe_bank("@VIDEO-GAMER-1", 300)
+    assert fork.players[0].get_total_score() != game.players[0].get_total_score()
+    assert game.opponent_model.profile("@VIDEO-GAMER-1").decisions == decisions
+    assert not opponent_model.get_opponent_model().profiles
+
+
+def test_files_round_trip(tmp_path, human_game):
+    path = str(tmp_path / "saves" / "autosave.lds")
+    assert load_snapshot(path) is None
+    data = human_game(11, stop_after=50).snapshot()
+    save_snapshot(data, path)
+    assert load_snapshot(path) == data
+    discard_snapshot(path)
+    discard_snapshot(path)
+    assert load_snapshot(path) is None
+
+
+# ============================================================================
+# CORRUPT INPUT
+# ============================================================================
+
+def test_foreign_and_truncated_data_raise_snapshot_error(human_game):
+    data = human_game(12, stop_after=80).snapshot()
+    _, body = decode_setup(data)
+    corrupt = [b"", b"LDS", b"LDR\x01" + data[4:], data[:3] + bytes([data[3] + 1]) + data[4:],
+               data[:body - 1], data[:body + 5], data[:-1], data + b"\x00"]
+    for bad in corrupt:
+        with pytest.raises(SnapshotError):
+            GameStateManager.restore(bad)
+
+
+def test_random_corruption_never_escapes_as_another_error(human_game):
+    choices = random.Random(0)
+    for seed in range(3):
+        data = human_game(seed, stop_after=choices.randint(20, 200)).snapshot()
+        for _ in range(150):
+            bad = bytearray(data)
+            bad[choices.randrange(len(bad))] = choices.randrange(256)
+            try:
+                GameStateManager.restore(bytes(bad), opponent_model=OpponentModel(None))
+            except SnapshotError:
+                pass
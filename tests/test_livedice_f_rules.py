@@ -0,0 +1,171 @@
+"""
+Rules lookup tables against the original hand-written counting rules.
+
+The reference functions below are the scoring code the tables replaced,
+kept verbatim in behaviour. Every ordered roll of up to five dice and every
+six-dice multiset in three dice orders is checked, which covers all 924
+multisets.
+"""
+
+from itertools import combinations_with_replacement, product
+from typing import List
+
+import pytest
+
+from games.livedice_f.livedice_f_rules import LiveDiceFRules
+from games.livedice_f.livedice_f_rulesets import RULESETS
+
+ALL_ROLLS = [list(roll) for dice_count in range(6) for roll in product(range(1, 7), repeat=dice_count)]
+for _multiset in combinations_with_replacement(range(1, 7), 6):
+    ALL_ROLLS.extend((list(_multiset), list(reversed(_multiset)), list(_multiset[3:] + _multiset[:3])))
+
+
+# ============================================================================
+# REFERENCE RULES
+# ============================================================================
+
+def reference_score(dice_values: List[int], stashed_together: bool, ruleset: str) -> int:
+    counts = [dice_values.count(i) for i in range(1, 7)]
+    if ruleset == "SIMPLE":
+        return counts[0] * 100 + counts[4] * 50
+    score = 0
+    for i, count in enumerate(counts):
+        if count >= 3:
+            score += 1000 if i == 0 else (i + 1) * 100
+            counts[i] -= 3
+            if stashed_together:
+                return score
+    if counts[5] >= 2:
+        score += 100
+        counts[5] -= 2
+        if stashed_together:
+            return score
+    return score + counts[0] * 100 + counts[4] * 50
+
+
+def reference_combinations(dice_values: List[int], ruleset: str):
+    counts = [dice_values.count(i) for i in range(1, 7)]
+    combinations = []
+    if ruleset != "SIMPLE":
+        for i, count in enumerate(counts):
+            if count >= 3:
+                combinations.append((f"TRIPLE {i+1}", 1000 if i == 0 else (i + 1) * 100))
+        if counts[5] >= 2:
+            combinations.append(("DOUBLE 6", 100))
+    if counts[0] > 0:
+        combinations.append((f"SINGLE 1{'s' if counts[0] > 1 else ''}", counts[0] * 100))
+    if counts[4] > 0:
+        combinations.append((f"SINGLE 5{'s' if counts[4] > 1 else ''}", counts[4] * 50))
+    return combinations
+
+
+def reference_stashable(dice_values: List[int], ruleset: str) -> List[int]:
+    stashable = []
+    if ruleset == "SIMPLE":
+        stashable.extend(j for j, v in enumerate(dice_values) if v in (1, 5))
+        return sorted(set(stashable))
+    counts = [dice_values.count(i) for i in range(1, 7)]
+    for i, count in enumerate(counts):
+        if count >= 3:
+            stashable.extend([j for j, v in enumerate(dice_values) if v == i + 1][:3])
+        elif i == 0 or i == 4:
+            stashable.extend(j for j, v in enumerate(dice_values) if v == i + 1)
+        elif i == 5 and count >= 2:
+            stashable.extend([j for j, v in enumerate(dice_values) if v == 6][:2])
+    return sorted(set(stashable))
+
+
+# ============================================================================
+# SCALAR RULES (user-001)
+# ============================================================================
+
+@pytest.mark.parametrize("ruleset", RULESETS)
+def test_scores_match_reference(ruleset):
+    for roll in ALL_ROLLS:
+        assert LiveDiceFRules.calculate_score(roll, False, ruleset) == reference_score(roll, False, ruleset), roll
+        assert LiveDiceFRules.calculate_score(roll, True, ruleset) == reference_score(roll, True, ruleset), roll
+
+
+@pytest.mark.parametrize("ruleset", RULESETS)
+def test_combinations_match_reference(ruleset):
+    for roll in ALL_ROLLS:
+        assert LiveDiceFRules.get_scoring_combinations(roll, ruleset) == reference_combinations(roll, ruleset), roll
+
+
+@pytest.mark.parametrize("ruleset", RULESETS)
+def test_stashable_dice_and_bust_match_reference(ruleset):
+    for roll in ALL_ROLLS:
+        expected = reference_stashable(roll, ruleset)
+        assert LiveDiceFRules.get_stashable_dice(roll, ruleset) == expected, roll
+        assert LiveDiceFRules.is_bust(roll, ruleset) == (not expected), roll
+
+
+def test_hands_outside_the_table_use_the_counting_path():
+    roll = [1, 1, 1, 1, 5, 6, 6, 6]
+    assert LiveDiceFRules.calculate_score(roll) == reference_score(roll, False, "STANDARD")
+    assert LiveDiceFRules.get_stashable_dice(roll) == reference_stashable(roll, "STANDARD")
+
+
+def test_single_die_is_scored():
+    assert LiveDiceFRules.calculate_score(1) == 100
+    assert LiveDiceFRules.calculate_score(3) == 0
+
+
+# ============================================================================
+# BATCH SCORING (user-002)
+# ============================================================================
+
+@pytest.mark.parametrize("ruleset", RULESETS)
+@pytest.mark.parametrize("stashed_together", (False, True))
+def test_batch_scoring_matches_scalar_rules(ruleset, stashed_together):
+    np = pytest.importorskip("numpy")
+    for dice_count in range(1, 7):
+        rolls = [roll for roll in ALL_ROLLS if len(roll) == dice_count]
+        scores, busts, stashable = LiveDiceFRules.calculate_scores_batch(np.array(rolls), ruleset, stashed_together)
+        for row, roll in enumerate(rolls):
+            assert scores[row] == reference_score(roll, stashed_together, ruleset), roll
+            assert busts[row] == (not reference_stashable(roll, ruleset)), roll
+            assert list(np.flatnonzero(stashable[row])) == reference_stashable(roll, ruleset), roll
+
+
+def test_batch_scoring_rejects_bad_input():
+    np = pytest.importorskip("numpy")
+    with pytest.raises(ValueError):
+        LiveDiceFRules.calculate_scores_batch(np.array([1, 2, 3]))
+    with pytest.raises(ValueError):
+        LiveDiceFRules.calculate_scores_batch(np.array([[1, 2, 7]]))
+    with pytest.raises(ValueError):
+        LiveDiceFRules.calculate_scores_batch(np.ones((2, 7), dtype=int))
+
+
+# ============================================================================
+# RULESET REGISTRATION (user-004)
+# ============================================================================
+
+def test_registered_ruleset_is_selectable_by_name():
+    from games.livedice_f import livedice_f_rulesets
+
+    definition = {"combinations": [{"name": "SINGLE {face}", "type": "SINGLE", "points": {2: 20}}]}
+    try:
+        livedice_f_rulesets.register_ruleset("TEST TWOS", definition)
+        assert LiveDiceFRules.calculate_score([2, 2, 3], ruleset="TEST TWOS") == 40
+        assert LiveDiceFRules.is_bust([1, 5], ruleset="TEST TWOS")
+        assert "TEST TWOS" in livedice_f_rulesets.RULESETS
+    finally:
+        livedice_f_rulesets.COMPILED_RULESETS.pop("TEST TWOS", None)
+        livedice_f_rulesets.RULESET_DEFINITIONS.pop("TEST TWOS", None)
+        livedice_f_rulesets.RULESETS = tuple(livedice_f_rulesets.RULESET_DEFINITIONS)
+
+
+def test_registering_an_existing_name_is_rejected():
+    from games.livedice_f.livedice_f_rulesets import register_ruleset
+
+    with pytest.raises(ValueError):
+        register_ruleset("STANDARD", {"combinations": []})
+    assert LiveDiceFRules.calculate_score([1, 1, 1]) == 1000
+
+
+def test_scoring_rules_come_from_the_ruleset():
+    standard = LiveDiceFRules.get_scoring_rules()
+    assert standard["TRIPLE 1"] == {"points": 1000} and standard["DOUBLE 6"] == {"points": 100}
+    assert LiveDiceFRules.get_scoring_rules("SIMPLE") == {"SINGLE 1": {"points": 100}, "SINGLE 5": {"points": 50}}
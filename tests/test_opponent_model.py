@@ -0,0 +1,38 @@
+"""
+Opponent model: profiles are written when a game ends, never between turns.
+"""
+
+import os
+
+from core.game_engine import opponent_model
+from core.game_engine.bot_turn import play_bot_turn
+from core.game_engine.go_bot_ai import BotAI
+from core.game_engine.opponent_model import OpponentModel
+from core.game_state.game_state import GameStateManager
+
+
+def play_turns(game, turns):
+    """Play up to turns turns, a bot sitting in for the human so the model observes it"""
+    bots = [BotAI(game) for _ in game.players]
+    for _ in range(turns):
+        if game.referee.is_game_over():
+            break
+        play_bot_turn(game, bots[game.current_player_index])
+        game.referee.end_turn()
+
+
+def test_profiles_are_saved_at_game_end_only(monkeypatch, tmp_path):
+    model = OpponentModel(str(tmp_path / "profiles.json"))
+    monkeypatch.setattr(opponent_model, "_model", model)
+    game = GameStateManager(None, 1, 1, seed=3)
+    assert game.players[0].is_human()
+
+    play_turns(game, 4)
+    assert model.dirty and not os.path.exists(model.path)
+
+    play_turns(game, 2000)
+    assert game.referee.is_game_over()
+    assert not model.dirty and os.path.exists(model.path)
+    saved = OpponentModel(model.path)
+    assert saved.profiles.keys() == model.profiles.keys()
+    assert all(saved.profiles[name].to_dict() == model.profiles[name].to_dict() for name in model.profiles)
@@ -0,0 +1,140 @@
+"""
+Binary table store: round trips, and corrupt files falling back to solving.
+"""
+
+import json
+import struct
+from array import array
+
+import pytest
+
+from core.game_engine.bot_policy import load_policy, policy_path, save_policy
+from core.game_engine.policy_store import (
+    FORMAT_VERSION, MAGIC, StoreError, open_store, read_store_metadata, write_store,
+)
+from core.game_engine.win_model import load_win_model, save_win_model, win_model_path
+
+
+def write_raw(path, metadata, payload=b"", magic=MAGIC, version=FORMAT_VERSION):
+    encoded = json.dumps(metadata).encode("utf-8") if not isinstance(metadata, bytes) else metadata
+    with open(path, "wb") as handle:
+        handle.write(struct.pack("<4sHI", magic, version, len(encoded)) + encoded + payload)
+    return str(path)
+
+
+# ============================================================================
+# STORE FILES
+# ============================================================================
+
+def test_sections_round_trip(tmp_path):
+    path = write_store(str(tmp_path / "table.bin"), {"kind": "test", "answer": 42},
+                       {"doubles": array("d", [0.5, 1.5, 2.5]), "raw": b"\x01\x02\x03", "ints": array("i", [-7])})
+    metadata, sections = open_store(path, ("kind", "answer"), ("doubles", "raw", "ints"))
+    assert metadata == {"kind": "test", "answer": 42}
+    assert list(sections["doubles"]) == [0.5, 1.5, 2.5]
+    assert bytes(sections["raw"]) == b"\x01\x02\x03"
+    assert list(sections["ints"]) == [-7]
+    assert read_store_metadata(path)["answer"] == 42
+
+
+def test_missing_key_or_section_is_a_store_error(tmp_path):
+    path = write_store(str(tmp_path / "table.bin"), {"kind": "test"}, {"raw": b"\x00"})
+    with pytest.raises(StoreError):
+        open_store(path, keys=("max_units",))
+    with pytest.raises(StoreError):
+        open_store(path, section_names=("roll_values",))
+
+
+@pytest.mark.parametrize("metadata", [
+    {"kind": "x"},
+    {"kind": "x", "sections": []},
+    {"kind": "x", "sections": {"a": [0, 1]}},
+    {"kind": "x", "sections": {"a": [0, 1, "Q?"]}},
+    {"kind": "x", "sections": {"a": [0, 1, 7]}},
+    {"kind": "x", "sections": {"a": ["0", 1, "d"]}},
+    {"kind": "x", "sections": {"a": [-8, 1, "d"]}},
+    {"kind": "x", "sections": {"a": [0, 1000, "d"]}},
+    [1, 2, 3],
+    b"{not json",
+])
+def test_corrupt_metadata_is_a_store_error(tmp_path, metadata):
+    path = write_raw(tmp_path / "table.bin", metadata, b"\0" * 8)
+    with pytest.raises(StoreError):
+        open_store(path)
+
+
+def test_bad_header_is_a_store_error(tmp_path):
+    with pytest.raises(StoreError):
+        open_store(str(tmp_path / "missing.bin"))
+    with pytest.raises(StoreError):
+        open_store(write_raw(tmp_path / "magic.bin", {"sections": {}}, magic=b"NOPE"))
+    with pytest.raises(StoreError):
+        open_store(write_raw(tmp_path / "version.bin", {"sections": {}}, version=FORMAT_VERSION + 1))
+    truncated = tmp_path / "truncated.bin"
+    truncated.write_bytes(MAGIC + b"\x01")
+    with pytest.raises(StoreError):
+        open_store(str(truncated))
+    empty = tmp_path / "empty.bin"
+    empty.write_bytes(b"")
+    with pytest.raises(StoreError):
+        open_store(str(empty))
+
+
+# ============================================================================
+# POLICY TABLES AND WIN MODELS
+# ============================================================================
+
+def test_policy_round_trip(tmp_path):
+    policy = load_policy("SIMPLE")
+    assert policy is not None, "regenerate with: python -m core.game_engine.bot_policy"
+    save_policy(policy, str(tmp_path))
+    loaded = load_policy("SIMPLE", str(tmp_path))
+    assert loaded.unit == policy.unit and loaded.max_units == policy.max_units
+    for dice_count in range(1, 7):
+        assert list(loaded.roll_values[dice_count]) == list(policy.roll_values[dice_count])
+
+
+def test_win_model_round_trip(tmp_path):
+    model = load_win_model("SIMPLE", 2000)
+    save_win_model(model, str(tmp_path))
+    loaded = load_win_model("SIMPLE", 2000, str(tmp_path))
+    assert list(loaded.win) == list(model.win)
+    assert bytes(loaded.choice) == bytes(model.choice)
+    assert loaded.strategies == model.strategies
+    assert list(loaded.chase[6]) == list(model.chase[6])
+
+
+@pytest.mark.parametrize("metadata", [
+    {"kind": "x"},
+    {"kind": "policy", "version": 1, "sections": {}},
+    {"kind": "policy", "sections": {"roll_values": [0, 1, "d"]}},
+    {"kind": "policy", "version": 1, "fingerprint": "?", "sections": {"roll_values": [0, 1, "Q?"]}},
+])
+def test_corrupt_policy_file_is_not_loaded(tmp_path, metadata):
+    write_raw(policy_path("SIMPLE", str(tmp_path)), metadata, b"\0" * 8)
+    assert load_policy("SIMPLE", str(tmp_path)) is None
+
+
+def test_policy_with_inconsistent_sizes_is_not_loaded(tmp_path):
+    policy = load_policy("SIMPLE")
+    metadata = read_store_metadata(policy_path("SIMPLE"))
+    del metadata["sections"]
+    write_store(policy_path("SIMPLE", str(tmp_path)), dict(metadata, max_units=policy.max_units + 1),
+                {"roll_values": array("d", [0.0]) * 7})
+    assert load_policy("SIMPLE", str(tmp_path)) is None
+    write_store(policy_path("SIMPLE", str(tmp_path)), dict(metadata, unit=None),
+                {"roll_values": array("d", [0.0]) * 7})
+    assert load_policy("SIMPLE", str(tmp_path)) is None
+
+
+def test_corrupt_win_model_file_is_not_loaded(tmp_path):
+    metadata = read_store_metadata(win_model_path("SIMPLE", 2000))
+    del metadata["sections"]
+    path = win_model_path("SIMPLE", 2000, str(tmp_path))
+    sections = {"win": array("d", [0.0]) * 8, "choice": b"\0" * 8, "chase": array("d", [0.0]) * 7}
+    write_store(path, metadata, sections)
+    assert load_win_model("SIMPLE", 2000, str(tmp_path)) is None
+    write_store(path, dict(metadata, buckets=2, strategies=[["EV"]]), sections)
+    assert load_win_model("SIMPLE", 2000, str(tmp_path)) is None
+    write_store(path, {key: value for key, value in metadata.items() if key != "unit"}, sections)
+    assert load_win_model("SIMPLE", 2000, str(tmp_path)) is None
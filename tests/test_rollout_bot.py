@@ -0,0 +1,46 @@
+"""
+Rollout bot: sampled choices agree with the policy table, and a fixed seed
+gives the same rollouts.
+"""
+
+import pytest
+
+from core.game_engine.bot_policy import get_policy
+from core.game_engine.rollout_bot import RolloutBotAI, RolloutSearch, benchmark_hand
+from core.game_state.game_state import GameStateManager
+
+
+@pytest.mark.parametrize("hand", [
+    [1, 1, 1, 2, 3, 4],
+    [1, 5, 2, 2, 3, 4],
+    [5, 5, 5, 1, 2, 3],
+])
+def test_stash_choice_matches_the_policy_table(hand):
+    game = GameStateManager(None, 0, 2, seed=1)
+    game.roll_dice(hand)
+    bot = RolloutBotAI(game, search=RolloutSearch(workers=0, seed=1, time_budget=0.3))
+    assert bot.smart_stash_selection() == "STASH"
+    indices, roll_after, _ = get_policy("STANDARD").choose_stash(hand, 0, 0)
+    assert game.selected_dice == indices
+    assert bot._follow_up == ("ROLL" if roll_after else "BANK")
+
+
+def test_nothing_to_stash_ends_the_turn():
+    game = GameStateManager(None, 0, 2, seed=1)
+    game.roll_dice([2, 2, 3, 3, 4, 6])
+    bot = RolloutBotAI(game, search=RolloutSearch(workers=0, seed=1))
+    assert bot.smart_stash_selection() == "END_TURN"
+
+
+def test_fixed_seed_repeats_the_rollouts():
+    starts = [(6, 0, 0), (3, 300, 0), (0, 450, 450)]
+    first = RolloutSearch(workers=0, seed=7, batch_size=100).evaluate(starts, time_budget=0)
+    second = RolloutSearch(workers=0, seed=7, batch_size=100).evaluate(starts, time_budget=0)
+    assert [(estimate.samples, estimate.total) for estimate in first] == \
+        [(estimate.samples, estimate.total) for estimate in second]
+    assert first[2].mean == 450 and first[2].stderr == 0
+
+
+def test_rollouts_agree_with_the_table_value():
+    result = benchmark_hand([1, 5, 2, 2, 3, 4], time_budget=0.3, workers=0)
+    assert abs(result["rollout"] - result["table"]) < 5 * result["stderr"] + 5
@@ -0,0 +1,120 @@
+"""
+TurnState: apply() follows the engine, and states never change.
+
+A shadow observer applies every engine event to a TurnState and compares
+the result with TurnState.from_game of the live engine after each action.
+"""
+
+import copy
+
+import pytest
+
+from core.game_engine.bot_turn import play_game
+from core.game_engine.go_bot_ai import BotAI
+from core.game_engine.opponent_model import OpponentModel
+from core.game_engine.turn_state import BANKED, BUST, READY, ROLLED, TurnState
+from core.game_state.game_observer import GameObserver
+from core.game_state.game_state import GameStateManager
+
+FIELDS = ("hand", "stashed_count", "stash_points", "stash_stash", "stashed_this_roll", "phase", "scores", "player")
+
+
+class Shadow(GameObserver):
+    """Mirrors every engine action with TurnState.apply and checks it against the engine"""
+
+    def __init__(self, game_state):
+        self.state = TurnState.from_game(game_state)
+        self.checked = 0
+        self.phases = set()
+
+    def _apply(self, game_state, action, argument=None):
+        parent = self.state
+        self.state = parent.apply(action, argument)
+        assert self.state.parent is parent and self.state.history()[-1][0] == action
+        engine = TurnState.from_game(game_state)
+        for field in FIELDS:
+            assert getattr(self.state, field) == getattr(engine, field), (field, self.state, engine, action)
+        self.checked += 1
+        self.phases.add(self.state.phase)
+
+    def on_dice_rolled(self, game_state, dice_values):
+        self._apply(game_state, "ROLL", dice_values)
+
+    def on_dice_stashed(self, game_state, dice_indices, stashed_dice, points):
+        self._apply(game_state, "STASH", dice_indices)
+
+    def on_points_banked(self, game_state, points):
+        self._apply(game_state, "BANK")
+
+    def on_new_stash_started(self, game_state):
+        self._apply(game_state, "START_NEW_STASH")
+
+    def on_turn_ended(self, game_state):
+        self._apply(game_state, "END_TURN")
+
+
+@pytest.mark.parametrize("seed", range(16))
+def test_apply_matches_the_engine_in_bot_games(seed):
+    players = 3 if seed % 4 == 0 else 2
+    game = GameStateManager(None, 0, players, ruleset=("STANDARD", "ADVANCED", "SIMPLE")[seed % 3], seed=seed,
+                            opponent_model=OpponentModel(None))
+    shadow = Shadow(game)
+    game.add_observer(shadow)
+    play_game(game, [BotAI(game, difficulty=difficulty) for difficulty in ("HARD", "EASY", "NORMAL")[:players]])
+    assert shadow.checked > 10
+    assert {READY, ROLLED, BANKED} <= shadow.phases
+
+
+def test_apply_matches_the_engine_in_human_games(human_game):
+    # Humans start new stashes through the referee and can bank with dice left
+    shadows = []
+    for seed in range(8):
+        human_game(seed, attach=lambda game: shadows.append(Shadow(game)) or shadows[-1])
+    assert sum(shadow.checked for shadow in shadows) > 200
+    assert set.union(*(shadow.phases for shadow in shadows)) == {READY, ROLLED, BANKED, BUST}
+
+
+def test_states_are_immutable():
+    state = TurnState(scores=(0, 0))
+    assert copy.copy(state) is state and copy.deepcopy(state) is state
+    with pytest.raises(AttributeError):
+        state.hand = None
+    rolled = state.apply("ROLL", [1, 1, 2, 3, 4, 6])
+    stashed = rolled.apply("STASH", [0, 1])
+    assert state.phase == READY and rolled.stashed_count == 0 and stashed.stash_points == 200
+    assert stashed.history() == [("ROLL", (1, 1, 2, 3, 4, 6)), ("STASH", (0, 1))]
+
+
+@pytest.mark.parametrize("action, argument", [
+    ("BANK", None),
+    ("STASH", None),
+    ("END_TURN", None),
+    ("ROLL", None),
+    ("ROLL", [1, 2, 3]),
+])
+def test_illegal_actions_raise(action, argument):
+    with pytest.raises(ValueError):
+        TurnState(scores=(0, 0)).apply(action, argument)
+
+
+def test_nothing_to_stash_raises():
+    rolled = TurnState(scores=(0, 0)).apply("ROLL", [1, 2, 3, 4, 6, 6])
+    with pytest.raises(ValueError):
+        rolled.apply("STASH", [1, 2])
+
+
+def test_a_new_stash_can_be_banked_without_rolling():
+    state = TurnState(scores=(0, 0), hand=[5], stashed_count=5, stash_points=600, stashed_this_roll=False,
+                      phase="ROLLED").apply("STASH", [0])
+    assert "START_NEW_STASH" in state.legal_actions()
+    ready = state.apply("START_NEW_STASH")
+    assert ready.phase == READY and ready.legal_actions() == {"ROLL", "BANK"}
+    assert ready.apply("BANK").scores == (650, 0)
+
+
+def test_roll_outcomes_cover_every_roll():
+    outcomes = TurnState(scores=(0, 0)).roll_outcomes()
+    assert sum(probability for probability, _ in outcomes) == pytest.approx(1.0)
+    assert len(outcomes) == 462
+    bust = sum(probability for probability, state in outcomes if state.phase == BUST)
+    assert 0 < bust < 0.05
@@ -0,0 +1,72 @@
+"""
+Win-probability model: stored tables and the engine's end-of-game rule.
+"""
+
+import pytest
+
+from core.game_engine.win_model import ENDGOALS, FIRST, SECOND, load_win_model
+from games.livedice_f.livedice_f_rulesets import RULESETS
+
+
+@pytest.mark.parametrize("ruleset", RULESETS)
+@pytest.mark.parametrize("endgoal", ENDGOALS)
+def test_stored_models_match_the_current_rules(ruleset, endgoal):
+    model = load_win_model(ruleset, endgoal)
+    assert model is not None, "regenerate with: python -m core.game_engine.win_model"
+    assert len(model.win) == len(model.choice) == 2 * model.buckets * model.buckets
+
+
+def test_second_seat_reaching_the_endgoal_wins():
+    model = load_win_model("STANDARD", 4000)
+    # One good turn from the endgoal: the second mover wins on reaching it,
+    # the first mover still has to survive the opponent's final turn
+    assert model.win_probability(3900, 3900, SECOND) > model.win_probability(3900, 3900, FIRST)
+    # From the start the second mover has the last word
+    assert model.win_probability(0, 0, FIRST) < 0.5
+
+
+class SolverFailed(Exception):
+    pass
+
+
+@pytest.fixture
+def failing_solver(monkeypatch):
+    """Empty best-response caches and a solver that always fails; returns the list of solved keys"""
+    from core.game_engine import win_model
+
+    solved = []
+
+    def solve(*key):
+        solved.append(key)
+        raise SolverFailed("no model")
+
+    monkeypatch.setattr(win_model, "_best_responses", {})
+    monkeypatch.setattr(win_model, "_pending_best_responses", {})
+    monkeypatch.setattr(win_model, "_best_response_failures", {})
+    monkeypatch.setattr(win_model, "solve_best_response", solve)
+    return solved
+
+
+def test_failed_best_response_is_not_solved_again(failing_solver):
+    from core.game_engine import win_model
+
+    with pytest.raises(SolverFailed):
+        win_model.get_best_response("STANDARD", 4000, 400, wait=True)
+    # Cached as a failure: the generic model is used, nothing is solved again
+    assert win_model.get_best_response("STANDARD", 4000, 400) is None
+    assert win_model.get_best_response("STANDARD", 4000, 400, wait=True) is None
+    assert failing_solver == [("STANDARD", 4000, 400)]
+    assert not win_model._pending_best_responses
+
+
+def test_background_failure_is_cached_and_reported_once(failing_solver):
+    from core.game_engine import win_model
+
+    assert win_model.get_best_response("STANDARD", 4000, 600) is None
+    solver = win_model._pending_best_responses.get(("STANDARD", 4000, 600))
+    if solver is not None:
+        solver.join(timeout=10)
+    assert win_model.get_best_response("STANDARD", 4000, 600) is None
+    assert failing_solver == [("STANDARD", 4000, 600)]
+    assert win_model.pop_best_response_failure("STANDARD", 4000, 600) == "SolverFailed: no model"
+    assert win_model.pop_best_response_failure("STANDARD", 4000, 600) is None
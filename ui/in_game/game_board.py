@@ -1,15 +1,17 @@
 import os
 import pygame
 import math
-import random
 import pymunk
 from pymunk import Vec2d
-from typing import List, Tuple
+from typing import List, Tuple, Optional
+from core.game_engine.dice_rng import DiceRNG
 
 class GameBoard:
-    def __init__(self, screen: pygame.Surface, rect: pygame.Rect):
+    def __init__(self, screen: pygame.Surface, rect: pygame.Rect, rng: Optional[DiceRNG] = None):
         self.screen = screen
         self.rect = rect
+        # Physics jitter comes from a replayable stream (the game's physics_rng)
+        self.rng = rng if rng is not None else DiceRNG(stream="physics")
         self.dice_positions: List[Tuple[int, int, float]] = []
         self.dice_size = 120
         self.stash_dice_size = 60
@@ -63,7 +65,7 @@ class GameBoard:
             moment = pymunk.moment_for_box(mass, (self.dice_size, self.dice_size))
             body = pymunk.Body(mass, moment)
             body.position = x + self.dice_size/2, y + self.dice_size/2
-            body.angle = random.uniform(0, 2*math.pi)
+            body.angle = self.rng.uniform(0, 2*math.pi)
 
             shape = pymunk.Poly.create_box(body, (self.dice_size, self.dice_size))
             shape.elasticity = 0.8
@@ -73,16 +75,16 @@ class GameBoard:
             self.dice_bodies.append(body)
             self.dice_shapes.append(shape)
 
-            impulse = Vec2d(random.uniform(-600, 600), random.uniform(-600, 600))
+            impulse = Vec2d(self.rng.uniform(-600, 600), self.rng.uniform(-600, 600))
             body.apply_impulse_at_local_point(impulse)
 
         self.animation_time = 0
-        self.dice_stop_times = [random.uniform(0.2, 0.8) for _ in range(num_dice)]
+        self.dice_stop_times = [self.rng.uniform(0.2, 0.8) for _ in range(num_dice)]
 
     def get_random_position_in_hexagon(self, center, size):
         while True:
-            angle = random.uniform(0, 2 * math.pi)
-            r = random.uniform(0, size)
+            angle = self.rng.uniform(0, 2 * math.pi)
+            r = self.rng.uniform(0, size)
             x = center[0] + r * math.cos(angle)
             y = center[1] + r * math.sin(angle)
             if self.is_point_in_hexagon(center, size, (x, y)):
@@ -18,6 +18,7 @@ sys.path.append(project_root)
 
 # Core imports
 from core.game_state.game_state import GameStateManager
+from core.game_state.game_snapshot import SnapshotError, discard_snapshot
 from games.livedice_f.livedice_f_rules import GameStateEnum
 from core.account.user import User
 from ui.in_game.button import Button
@@ -32,6 +33,7 @@ from ui.in_game.ui_helpers import UIHelpers
 from ui.in_game.ui_drawing import UIDrawing
 from ui.in_game.ui_events import UIEvents
 from ui.in_game.ui_bot import UIBot
+from ui.in_game.ui_observer import UIObserver
 
 
 class StashState(Enum):
@@ -47,7 +49,8 @@ class InGameUI(UIInterface):
     Coordinates all UI modules and manages game display.
     """
     
-    def __init__(self, human_players, ai_players, endgoal=4000, ruleset="STANDARD", bot_difficulty="NORMAL"):
+    def __init__(self, human_players, ai_players, endgoal=4000, ruleset="STANDARD", bot_difficulty="NORMAL", seed=None,
+                 snapshot=None):
         """
         Initialize the in-game UI.
         
@@ -57,6 +60,8 @@ class InGameUI(UIInterface):
             endgoal: Target score to win (2000, 4000, or 8000)
             ruleset: Scoring rules to use (SIMPLE, STANDARD, or ADVANCED)
             bot_difficulty: AI difficulty level (EASY, NORMAL, or HARD)
+            seed: Optional dice seed to replay a game exactly (random when None)
+            snapshot: Optional game snapshot (GameStateManager.snapshot) to resume instead of a new game
         """
         pygame.init()
         self.WINDOW_WIDTH = 1920
@@ -70,6 +75,8 @@ class InGameUI(UIInterface):
         self.endgoal = int(endgoal) if endgoal else 4000
         self.ruleset = ruleset if ruleset else "STANDARD"
         self.bot_difficulty = bot_difficulty if bot_difficulty else "NORMAL"
+        self.seed = seed
+        self.snapshot = snapshot
         
         # Initialize modular components
         self._setup_ui_modules()
@@ -86,6 +93,9 @@ class InGameUI(UIInterface):
         # Button states
         self.bank_button_enabled = False
         self.bank_button_hover = False
+
+        # EV advisor in RT STATS and on the BANK button (click the RT STATS title to toggle)
+        self.advisor_enabled = False
         
         # Stash state management
         self.stash_state = StashState.BASE
@@ -233,6 +243,7 @@ class InGameUI(UIInterface):
         self.drawing = UIDrawing(self)
         self.events = UIEvents(self)
         self.bot_ui = UIBot(self)
+        self.observer = UIObserver(self)
     
     # ========================================================================
     # PROPERTIES
@@ -278,7 +289,7 @@ class InGameUI(UIInterface):
     
     def setup_ui_components(self):
         """Setup UI components"""
-        self.game_board = GameBoard(self.screen, self.sections["SNAPTRAY"])
+        self.game_board = GameBoard(self.screen, self.sections["SNAPTRAY"], self.game_state.physics_rng)
         self.dice_renderer = DiceRenderer(self.screen)
     
     def setup_fonts(self):
@@ -331,8 +342,16 @@ class InGameUI(UIInterface):
         self.max_visible_lines = 24
 
     def setup_game(self):
-        """Initialize game state manager with configuration"""
-        self.game_state = GameStateManager(self, self.human_players, self.ai_players, self.endgoal, self.ruleset, self.bot_difficulty)
+        """Initialize game state manager with configuration (or resume the snapshot)"""
+        if self.snapshot is not None:
+            try:
+                self.game_state = GameStateManager.restore(self.snapshot, self.observer)
+                return
+            except SnapshotError as error:
+                print(f"Cannot resume the saved game ({error}) - starting a new one")
+                discard_snapshot()
+                self.snapshot = None
+        self.game_state = GameStateManager(self.observer, self.human_players, self.ai_players, self.endgoal, self.ruleset, self.bot_difficulty, self.seed)
         self.game_state.set_active_task("Click START TURN to begin your turn")
 
     # REMOVED: Old question mark button setup
@@ -372,13 +391,13 @@ class InGameUI(UIInterface):
         # Update stash state
         self.update_stash_state()
 
-        # Bot turn handling
+        # Bot turn handling (bot_ui.update plays it on a frame at a time)
         if self.game_state.current_player.is_bot():
             if not self.bot_ui.bot_turn_in_progress:
-                self.bot_ui.bot_turn_in_progress = True
                 self.bot_ui.bot_turn()
         else:
             self.bot_ui.bot_turn_in_progress = False
+        self.bot_ui.update()
 
         # Check game over
         if self.game_state.check_game_over():
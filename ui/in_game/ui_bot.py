@@ -2,20 +2,32 @@
 UI BOT MODULE
 Bot AI interaction for LIVEDICE game UI.
 Handles bot turn execution, decision display, and game flow for AI players.
+Bot turns are played a step at a time by core.game_engine.bot_turn.BotTurn;
+UIBot observes the turn and queues the pacing, animation and personality
+messages, and update() works through the queue from the main loop so the
+window keeps drawing and handling events while a bot plays.
 
 UPDATED: Full integration with message_manager personality system
 """
 
+from collections import deque
+from functools import partial
+
 import pygame
 import sys
-import time
+from core.game_engine.bot_turn import BotTurn
 from core.game_engine.go_bot_ai import BotAI
-from games.livedice_f.livedice_f_rules import GameStateEnum
+from core.game_state.game_observer import GameObserver
 
 
-class UIBot:
+class UIBot(GameObserver):
     """Handles bot AI interactions and display"""
     
+    # Search time per bot decision; pacing pauses absorb it so frames stay smooth
+    THINK_BUDGET = 0.05
+    # Length of the bot roll animation (the board animates it in the main loop)
+    ROLL_ANIMATION_MS = 2000
+    
     def __init__(self, ui_instance):
         """
         Initialize bot module with reference to main UI instance.
@@ -25,9 +37,19 @@ class UIBot:
         """
         self.ui = ui_instance
         self.bot_turn_in_progress = False
+        # Bot whose turn is being played (set when the turn starts)
+        self.bot_name = ""
+        self.turn_number = 0
+        self.decision_count = 0
+        # Turn being played, its queued messages and pauses (ms), and when the current pause ends
+        self.turn = None
+        self.steps = deque()
+        self.resume_at = 0
+        # Search time of the last decision not yet taken off a pause
+        self.thinking_credit_ms = 0
     
     def bot_turn(self):
-        """Handle AI bot turn - uses message_manager for personality-driven messages"""
+        """Start the AI bot turn - update() plays it and the GameObserver hooks narrate it"""
         # CRITICAL: Only proceed if current player is actually a bot
         if not self.ui.game_state.current_player.is_bot():
             return
@@ -36,309 +58,245 @@ class UIBot:
         if self.ui.game_state.current_player.user.username.startswith("@VIDEO-GAMER"):
             return
         
-        pygame.event.pump()
+        # Already playing (or finishing) this turn
+        if self.turn is not None or self.steps:
+            return
 
-        def bot_delay(duration_ms=1000):
-            """Delay with screen updates and event handling"""
-            self.ui.draw()
-            pygame.display.flip()
-            pygame.time.wait(duration_ms)
-            for event in pygame.event.get():
-                if event.type == pygame.QUIT:
-                    pygame.quit()
-                    sys.exit()
+        game_state = self.ui.game_state
+        game_state.add_observer(self)
+        self.bot_turn_in_progress = True
+        self.turn = BotTurn(game_state, BotAI(game_state, think_budget=self.THINK_BUDGET, verbose=True))
+        self.resume_at = 0
+        self.thinking_credit_ms = 0
 
-        go_bot_ai = BotAI(self.ui.game_state)
-        
-        bot_name = self.ui.game_state.current_player.user.username
-        turn_number = self.ui.game_state.current_player.turn_count + 1
+    def update(self):
+        """Advance the bot turn without blocking: run due messages and pauses, then the next turn step"""
+        now = pygame.time.get_ticks()
+        while now >= self.resume_at:
+            if self.steps:
+                step = self.steps.popleft()
+                if callable(step):
+                    step()
+                else:
+                    self.resume_at = now + step
+            elif self.turn is not None:
+                if not self.turn.step():
+                    self.turn = None
+                    # Bot turn complete - auto-advance (FIX #6)
+                    self.pause(500)  # Brief pause before next player
+                    self.later(self._end_turn)
+            else:
+                return
+
+    def _end_turn(self):
+        """Hand over to the next player once the last pause is over"""
+        game_state = self.ui.game_state
+        game_state.remove_observer(self)
+
+        # REMOVED: Duplicate G-REF turn_end message
+        # G-REF message is now generated inside game_referee.end_turn() for ALL players
+
+        # Set flag to False BEFORE ending the turn
+        self.bot_turn_in_progress = False
+
+        # Call referee.end_turn() which handles next_player() and game state properly
+        game_state.referee.end_turn()
+
+    def pause(self, duration_ms=1000):
+        """Queue a pause; search time of the last decision is taken off it first"""
+        charged = min(self.thinking_credit_ms, duration_ms)
+        self.thinking_credit_ms -= charged
+        self.steps.append(duration_ms - charged)
+
+    def later(self, callback, *args, **kwargs):
+        """Queue a call to run once the pauses queued before it are over"""
+        self.steps.append(partial(callback, *args, **kwargs))
+
+    def _decision_context(self) -> dict:
+        """Context for personality messages about the current decision"""
+        return {
+            "turn": self.turn_number,
+            "score": self.ui.game_state.referee.calculate_turn_score(),
+            "remaining_dice": len(self.ui.game_state.dice_values),
+            "decision_count": self.decision_count
+        }
+
+    # ========================================================================
+    # BOT TURN HOOKS (GameObserver, registered during bot_turn only)
+    # Messages are queued with later() so they appear after the pauses before
+    # them; the context they show is taken when the hook runs.
+    # ========================================================================
+
+    def on_bot_turn_started(self, game_state, bot):
+        self.bot_name = game_state.current_player.user.username
+        self.turn_number = game_state.current_player.turn_count + 1
+        self.decision_count = 0
         
-        print(f"{bot_name} TURN STARTED")
+        print(f"{self.bot_name} TURN STARTED")
         
         # REMOVED: add_gref_turn_start now called centrally in game_state.py for ALL players
         # This prevents duplicate messages and ensures humans also get turn start announcements
         
         # Bot announces they're starting (personality-driven)
-        context = {"turn": turn_number}
-        self.ui.game_state.message_manager.add_bot_turn_start_message(bot_name, context)
+        context = {"turn": self.turn_number}
+        self.later(game_state.message_manager.add_bot_turn_start_message, self.bot_name, context)
+
+    def on_bot_decision(self, game_state, bot, decision, thinking_message):
+        self.decision_count += 1
+        print(f"Current game state: {game_state.current_game_state}")
+        print(f"Decision #{self.decision_count}")
+        
+        # Time spent thinking counts towards the pauses before the bot acts
+        self.thinking_credit_ms = int(bot.search_stats["elapsed_ms"])
+        context = self._decision_context()
+        messages = game_state.message_manager
+        
+        # Display bot's thinking process (uses personality system)
+        if thinking_message:
+            self.later(self.ui.display_bot_thinking, thinking_message)
+            self.pause()
+        
+        print(f"{self.bot_name} decision: {decision}")
+        
+        # Bot explains their decision (personality-driven)
+        self.later(messages.add_bot_strategy_explanation,
+                   self.bot_name, decision, f"DECIDING TO {decision.upper()}", context)
+        self.pause()
 
-        # Safety counter to prevent infinite loops
-        max_decisions = 50
-        decision_count = 0
+        legal_actions = game_state.referee.legal_actions()
+        if decision == "ROLL" and "ROLL" in legal_actions:
+            # Bot announces roll (personality-driven)
+            self.later(messages.add_bot_reaction, self.bot_name, "rolling", context)
+            self.pause()
+        elif decision == "BANK" and "BANK" in legal_actions:
+            # Bot explains bank decision (personality-driven)
+            bank_context = {
+                "turn": self.turn_number,
+                "points": context["score"],
+                "action": "BANK"
+            }
+            self.later(messages.add_bot_reaction, self.bot_name, "banking", bank_context)
+            self.pause()
+        elif decision == "START_NEW_STASH":
+            # Bot announces stashstash (personality-driven)
+            self.later(messages.add_bot_thinking, self.bot_name, "MY STASH IS FULL - TIME TO START A NEW ONE!", context)
+            self.pause()
 
-        while not self.ui.game_state.referee.is_turn_over() and decision_count < max_decisions:
-            decision_count += 1
-            print(f"Current game state: {self.ui.game_state.current_game_state}")
-            print(f"Is turn over? {self.ui.game_state.referee.is_turn_over()}")
-            print(f"Decision #{decision_count}")
-            
-            decision, thinking_msg = go_bot_ai.make_decision()
+    def on_dice_rolled(self, game_state, dice_values):
+        # Generate new random positions
+        self.ui.game_board.generate_dice_positions(len(dice_values))
+        
+        # Reset physics for animation; the main loop animates the roll during this pause
+        self.ui.game_board.update_dice_positions([])
+        self.pause(self.ROLL_ANIMATION_MS)
+        self.pause()
+        
+        messages = game_state.message_manager
+        # Check for bust (roll_dice already busted the turn and told the G-REF)
+        if game_state.referee.is_bust():
+            lost_points = game_state.referee.calculate_turn_score()
             
-            # Create context for this decision
-            context = {
-                "turn": turn_number,
-                "score": self.ui.game_state.referee.calculate_turn_score(),
-                "remaining_dice": len(self.ui.game_state.dice_values),
-                "decision_count": decision_count
+            # Bot reacts to bust (personality-driven)
+            bust_context = {
+                "turn": self.turn_number,
+                "lost_points": lost_points,
+                "dice": dice_values
             }
+            self.later(messages.add_bot_reaction, self.bot_name, "bust", bust_context)
+            self.pause()
             
-            # Display bot's thinking process (uses personality system)
-            if thinking_msg:
-                self.ui.display_bot_thinking(thinking_msg)
-                bot_delay()
+            # BOT AUTO-CLICKS BUST POPUP (FIX #6)
+            self.pause(800)  # Brief pause to show popup
+        else:
+            # Bot reacts to successful roll (personality-driven)
+            # Simple points estimation (1s and 5s are worth points)
+            points_estimate = dice_values.count(1) * 100 + dice_values.count(5) * 50
             
-            print(f"{bot_name} decision: {decision}")
+            roll_context = {
+                "turn": self.turn_number,
+                "points": points_estimate,
+                "dice": dice_values
+            }
             
-            # Bot explains their decision (personality-driven)
-            self.ui.game_state.message_manager.add_bot_strategy_explanation(
-                bot_name, 
-                decision, 
-                f"DECIDING TO {decision.upper()}", 
-                context
-            )
-            bot_delay()
+            # Determine if it's a good or bad roll
+            reaction = "good_roll" if points_estimate >= 200 else "bad_roll"
+            self.later(messages.add_bot_reaction, self.bot_name, reaction, roll_context)
 
-            if decision == "START_TURN":
-                self.ui.game_state.current_game_state = GameStateEnum.START_TURN
-                self.ui.game_state.turn_started = True
-                continue
+    def on_dice_stashed(self, game_state, dice_indices, stashed_dice, points):
+        # Bot explains stash decision (personality-driven)
+        # Points are the ones stash_dice scored, so they match the G-REF message
+        stash_context = {
+            "turn": self.turn_number,
+            "points": points,
+            "dice_count": len(stashed_dice),
+            "dice": stashed_dice
+        }
+        self.later(game_state.message_manager.add_bot_strategy_explanation,
+                   self.bot_name, "STASH", f"STASHING {len(stashed_dice)} DICE", stash_context)
+        self.pause()
 
-            if decision == "ROLL":
-                if self.ui.game_state.referee.can_roll():
-                    # Bot announces roll (personality-driven)
-                    self.ui.game_state.message_manager.add_bot_reaction(bot_name, "rolling", context)
-                    bot_delay()
-                    
-                    # Roll the dice (G-REF message now generated inside roll_dice)
-                    dice_values = self.ui.game_state.roll_dice()
-                    
-                    # Get stashable dice indices for proper color coding
-                    stashable_indices = self.ui.game_state.current_stashable_dice
-                    
-                    # Generate new random positions
-                    self.ui.game_board.generate_dice_positions(len(dice_values))
-                    
-                    # Reset physics for animation
-                    self.ui.game_board.update_dice_positions([])
-                    
-                    # Animate dice rolling for 2 seconds
-                    animation_start = time.time()
-                    animation_duration = 2.0
-                    
-                    while time.time() - animation_start < animation_duration:
-                        dt = 1/60.0
-                        self.ui.game_board.update(dt)
-                        self.ui.draw()
-                        pygame.display.flip()
-                        pygame.time.wait(16)
-                        
-                        # Handle events during animation
-                        for event in pygame.event.get():
-                            if event.type == pygame.QUIT:
-                                pygame.quit()
-                                sys.exit()
-                    
-                    bot_delay()
-                    
-                    # Check for bust
-                    if self.ui.game_state.referee.is_bust():
-                        lost_points = self.ui.game_state.referee.calculate_turn_score()
-                        
-                        # Bot reacts to bust (personality-driven)
-                        bust_context = {
-                            "turn": turn_number,
-                            "lost_points": lost_points,
-                            "dice": dice_values
-                        }
-                        self.ui.game_state.message_manager.add_bot_reaction(bot_name, "bust", bust_context)
-                        bot_delay()
-                        
-                        # REMOVED: Duplicate G-REF bust message
-                        # G-REF message is now generated inside game_referee.bust() for ALL players
-                        
-                        self.ui.game_state.referee.bust()
-                        
-                        # BOT AUTO-CLICKS BUST POPUP (FIX #6)
-                        bot_delay(800)  # Brief pause to show popup
-                        # Auto-advance past bust summary (no need to wait for click)
-                        break
-                    else:
-                        # Bot reacts to successful roll (personality-driven)
-                        # Simple points estimation (1s and 5s are worth points)
-                        points_estimate = dice_values.count(1) * 100 + dice_values.count(5) * 50
-                        
-                        roll_context = {
-                            "turn": turn_number,
-                            "points": points_estimate,
-                            "dice": dice_values
-                        }
-                        
-                        # Determine if it's a good or bad roll
-                        if points_estimate >= 200:
-                            self.ui.game_state.message_manager.add_bot_reaction(bot_name, "good_roll", roll_context)
-                        else:
-                            self.ui.game_state.message_manager.add_bot_reaction(bot_name, "bad_roll", roll_context)
-                else:
-                    print(f"{bot_name} CAN'T ROLL WITHOUT STASHING FIRST")
-                    
-                    # G-REF announces the issue
-                    self.ui.game_state.message_manager.add_gref_official_statement(
-                        f"{bot_name} MUST STASH DICE BEFORE ROLLING AGAIN"
-                    )
-                    
-                    # Bot reacts (personality-driven)
-                    self.ui.game_state.message_manager.add_bot_thinking(
-                        bot_name, 
-                        "CAN'T ROLL WITHOUT STASHING FIRST", 
-                        context
-                    )
-                    bot_delay()
-                    continue
-          
-            elif decision == "STASH":
-                # Get smart stash selection
-                stash_indices = go_bot_ai.get_stash_indices()
-                if stash_indices:
-                    stashed_values = [self.ui.game_state.dice_values[i] for i in stash_indices]
-                    
-                    # Perform the stash (G-REF message now generated inside stash_dice with correct points)
-                    self.ui.game_state.stash_dice(stash_indices)
-                    
-                    # Bot explains stash decision (personality-driven)
-                    # Calculate correct points for bot's reaction
-                    stash_points = sum([
-                        score for name, score in 
-                        self.ui.game_state.referee.get_scoring_combinations(stashed_values)
-                    ])
-                    
-                    stash_context = {
-                        "turn": turn_number,
-                        "points": stash_points,
-                        "dice_count": len(stashed_values),
-                        "dice": stashed_values
-                    }
-                    self.ui.game_state.message_manager.add_bot_strategy_explanation(
-                        bot_name,
-                        "STASH",
-                        f"STASHING {len(stashed_values)} DICE",
-                        stash_context
-                    )
-                    bot_delay()
-                else:
-                    print(f"{bot_name} TRIED TO STASH, BUT NO STASHABLE DICE AVAILABLE")
-                    
-                    # G-REF announces the issue
-                    self.ui.game_state.message_manager.add_gref_official_statement(
-                        f"{bot_name} HAS NO STASHABLE DICE AVAILABLE"
-                    )
-                    
-                    # Bot reacts (personality-driven)
-                    self.ui.game_state.message_manager.add_bot_frustration(bot_name, context)
-                    bot_delay()
-                    break
+    def on_bot_action(self, game_state, bot, decision):
+        messages = game_state.message_manager
+        if decision == "START_NEW_STASH":
+            # G-REF announces stashstash
+            self.later(messages.add_gref_official_statement, f"{self.bot_name} STARTED A NEW STASH (STASHSTASH)")
+            self.pause()
+        elif decision == "BANK":
+            # BOT AUTO-CLICKS BANK POPUP (FIX #6)
+            self.pause(800)  # Brief pause to show popup
+        elif decision == "END_TURN":
+            # Bot announces end (personality-driven)
+            self.later(messages.add_bot_thinking,
+                       self.bot_name, "NO MORE MOVES AVAILABLE - ENDING MY TURN", self._decision_context())
+            self.pause()
+
+    def on_bot_action_rejected(self, game_state, bot, decision):
+        context = self._decision_context()
+        messages = game_state.message_manager
+        if decision == "ROLL":
+            print(f"{self.bot_name} CAN'T ROLL WITHOUT STASHING FIRST")
             
-            elif decision == "BANK":
-                if self.ui.game_state.referee.can_bank():
-                    points = self.ui.game_state.referee.calculate_turn_score()
-                    
-                    # Bot explains bank decision (personality-driven)
-                    bank_context = {
-                        "turn": turn_number,
-                        "points": points,
-                        "action": "BANK"
-                    }
-                    self.ui.game_state.message_manager.add_bot_reaction(bot_name, "banking", bank_context)
-                    bot_delay()
-                    
-                    # Perform the bank (G-REF message now generated inside bank_points)
-                    self.ui.game_state.referee.bank_points()
-                    
-                    # BOT AUTO-CLICKS BANK POPUP (FIX #6)
-                    bot_delay(800)  # Brief pause to show popup
-                    # Auto-advance past bank summary (no need to wait for click)
-                    break
-                else:
-                    # G-REF announces can't bank
-                    self.ui.game_state.message_manager.add_gref_official_statement(
-                        f"{bot_name} CANNOT BANK YET"
-                    )
-                    
-                    # Bot reacts (personality-driven)
-                    self.ui.game_state.message_manager.add_bot_thinking(
-                        bot_name,
-                        "CAN'T BANK YET, CONTINUING TURN",
-                        context
-                    )
-                    continue
+            # G-REF announces the issue
+            self.later(messages.add_gref_official_statement, f"{self.bot_name} MUST STASH DICE BEFORE ROLLING AGAIN")
             
-            elif decision == "START_NEW_STASH":
-                # Bot announces stashstash (personality-driven)
-                self.ui.game_state.message_manager.add_bot_thinking(
-                    bot_name,
-                    "MY STASH IS FULL - TIME TO START A NEW ONE!",
-                    context
-                )
-                bot_delay()
-                
-                self.ui.game_state.start_new_stash()
-                
-                # G-REF announces stashstash
-                self.ui.game_state.message_manager.add_gref_official_statement(
-                    f"{bot_name} STARTED A NEW STASH (STASHSTASH)"
-                )
-                bot_delay()
+            # Bot reacts (personality-driven)
+            self.later(messages.add_bot_thinking, self.bot_name, "CAN'T ROLL WITHOUT STASHING FIRST", context)
+            self.pause()
+        elif decision == "STASH":
+            print(f"{self.bot_name} TRIED TO STASH, BUT NO STASHABLE DICE AVAILABLE")
             
-            elif decision == "END_TURN":
-                # Bot announces end (personality-driven)
-                self.ui.game_state.message_manager.add_bot_thinking(
-                    bot_name,
-                    "NO MORE MOVES AVAILABLE - ENDING MY TURN",
-                    context
-                )
-                bot_delay()
-                break
+            # G-REF announces the issue
+            self.later(messages.add_gref_official_statement, f"{self.bot_name} HAS NO STASHABLE DICE AVAILABLE")
             
-            else:
-                print(f"UNKNOWN DECISION: {decision}")
-                
-                # G-REF announces unknown decision
-                self.ui.game_state.message_manager.add_gref_official_statement(
-                    f"{bot_name} MADE AN UNKNOWN DECISION: {decision.upper()}"
-                )
-                
-                # Bot reacts (personality-driven)
-                self.ui.game_state.message_manager.add_bot_thinking(
-                    bot_name,
-                    f"UNKNOWN DECISION: {decision.upper()}",
-                    context
-                )
-                bot_delay()
-                break
-
-            self.ui.draw()
-            pygame.display.flip()
+            # Bot reacts (personality-driven)
+            self.later(messages.add_bot_frustration, self.bot_name, context)
+            self.pause()
+        elif decision == "BANK":
+            # G-REF announces can't bank
+            self.later(messages.add_gref_official_statement, f"{self.bot_name} CANNOT BANK YET")
+            
+            # Bot reacts (personality-driven)
+            self.later(messages.add_bot_thinking, self.bot_name, "CAN'T BANK YET, CONTINUING TURN", context)
+        elif decision not in ("START_TURN", "START_NEW_STASH", "END_TURN"):
+            print(f"UNKNOWN DECISION: {decision}")
+            
+            # G-REF announces unknown decision
+            self.later(messages.add_gref_official_statement,
+                       f"{self.bot_name} MADE AN UNKNOWN DECISION: {decision.upper()}")
+            
+            # Bot reacts (personality-driven)
+            self.later(messages.add_bot_thinking, self.bot_name, f"UNKNOWN DECISION: {decision.upper()}", context)
+            self.pause()
 
-        if decision_count >= max_decisions:
+    def on_bot_turn_ended(self, game_state, bot, decisions, hit_limit):
+        if hit_limit:
             print(f"WARNING: Bot turn ended due to max decision limit!")
             
             # G-REF announces max decisions reached
-            self.ui.game_state.message_manager.add_gref_official_statement(
-                f"{bot_name} TURN ENDED (MAX DECISIONS REACHED)"
-            )
-
-        print(f"{bot_name} TURN ENDED")
-        
-        # REMOVED: Duplicate G-REF turn_end message
-        # G-REF message is now generated inside game_referee.end_turn() for ALL players
+            self.later(game_state.message_manager.add_gref_official_statement,
+                       f"{self.bot_name} TURN ENDED (MAX DECISIONS REACHED)")
 
-        # Set flag to False BEFORE blocking operations
-        self.bot_turn_in_progress = False
-
-        # Bot turn complete - auto-advance (FIX #6)
-        bot_delay(500)  # Brief pause before next player
-
-        # Call referee.end_turn() which handles next_player() and game state properly
-        self.ui.game_state.referee.end_turn()
+        print(f"{self.bot_name} TURN ENDED")
 
     def end_game(self):
         """Handle end of game"""
@@ -402,7 +360,7 @@ class UIBot:
         )
         
         rules = self.ui.game_state.referee.rules
-        scoring_info = rules.get_scoring_combinations()
+        scoring_info = rules.get_scoring_rules()
         
         for combo_name, combo_info in scoring_info.items():
             # G-REF announces each scoring rule
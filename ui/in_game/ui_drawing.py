@@ -373,11 +373,11 @@ class UIDrawing:
         text = "RT "
         self.draw_text_with_font(text, x_pos, y_pos, self.ui.BLUE, self.ui.font_minititle_semibold)
         x_pos += self.ui.font_minititle_semibold.size(text)[0]
-        text = "STATS"
+        text = "ADVISOR" if self.ui.advisor_enabled else "STATS"
         self.draw_text_with_font(text, x_pos, y_pos, self.ui.BLUE, self.ui.font_minititle_black)
         
         # rt_stats_base (8 rows, alternating colors)
-        rows = [
+        rows = self.get_advisor_rows() if self.ui.advisor_enabled else [
             ("TURN\nNUMBER", str(self.ui.game_state.current_player.turn_count + 1), self.ui.DARK_GREEN),
             ("ROLLS\nROLLED", str(self.ui.game_state.current_player.roll_count), self.ui.MEDIUM_GREEN),
             ("STASH\nNUMBER", self.ui.game_state.referee.get_stash_number(), self.ui.DARK_GREEN),
@@ -409,6 +409,29 @@ class UIDrawing:
             
             y_offset += 40
 
+    def get_advisor_rows(self):
+        """RT_STATS rows in advisor mode: bust chance, expected values and the best move"""
+        game_state = self.ui.game_state
+        advice = game_state.referee.get_advice()
+        if advice is None:
+            bust, roll, bank, best, stash = "-", "-", "-", "-", "-"
+        else:
+            bust = f"{advice.bust_chance * 100:.1f}%"
+            roll = self.ui.format_number(round(advice.roll_value))
+            bank = self.ui.format_number(advice.bank_value)
+            best = advice.best_action
+            stash = " ".join(str(value) for value in sorted(advice.best_stash)) or "-"
+        return [
+            ("TURN\nNUMBER", str(game_state.current_player.turn_count + 1), self.ui.DARK_GREEN),
+            ("V SCORE\nTURN", self.ui.format_number(game_state.referee.calculate_turn_score()), self.ui.MEDIUM_GREEN),
+            ("BUST\nCHANCE", bust, self.ui.DARK_GREEN),
+            ("EV IF\nROLLING", roll, self.ui.MEDIUM_GREEN),
+            ("EV IF\nBANKING", bank, self.ui.DARK_GREEN),
+            ("BEST\nMOVE", best, self.ui.MEDIUM_GREEN),
+            ("BEST\nSTASH", stash, self.ui.DARK_GREEN),
+            ("VIRTUAL\nGAME RANK", str(self.get_virtual_rank()), self.ui.MEDIUM_GREEN),
+        ]
+
     def draw_leaderboard_score(self):
         """Draw LEADERBOARD_SCORE section (turn-by-turn breakdown)"""
         rect = self.ui.sections["LEADERBOARD_SCORE"]
@@ -512,8 +535,8 @@ class UIDrawing:
         
         # Calculate totals
         total_score = current_player.get_total_score()
-        total_rolls = sum(turn_data["ROLLS"] for turn_data in current_player.turn_scores.values())
-        total_stashes = sum(turn_data["STASHES"] for turn_data in current_player.turn_scores.values())
+        total_rolls = current_player.get_total_rolls()
+        total_stashes = current_player.get_total_stashes()
         
         # TOTAL label column
         total_label = pygame.Rect(rect.x, total_row_y, 60, total_row_height)
@@ -596,6 +619,15 @@ class UIDrawing:
             text2 = f"{self.ui.format_number(virtual_turn_score)} POINTS"
             self.draw_text_with_font(text2, x, 565, text_color, self.ui.font_bigtextbar_black)
 
+        # Advisor line under the bank text
+        if self.ui.advisor_enabled:
+            advice = self.ui.game_state.referee.get_advice()
+            if advice is not None:
+                format_number = self.ui.format_number
+                advice_text = (f"ROLL EV {format_number(round(advice.roll_value))} / BANK {format_number(advice.bank_value)} / "
+                               f"BUST {format_number(round(advice.bust_chance * 100))}% / BEST: {advice.best_action}")
+                self.draw_text_with_font(advice_text, 30, 615, text_color, self.ui.font_minititle_black)
+
     def draw_stash_section(self):
         """Draw STASH section with 3 state variations"""
         # Import StashState here to avoid circular import
@@ -709,7 +741,7 @@ class UIDrawing:
         x = 30
         y = 805
         
-        selected_points = self.ui.game_state.referee.calculate_score([self.ui.game_state.dice_values[i] for i in self.ui.game_state.selected_dice])
+        selected_points = self.ui.game_state.referee.calculate_score(self.ui.game_state.dice_hand.select(self.ui.game_state.selected_dice))
         text1 = "STASHING ADDS "
         self.draw_text_with_font(text1, x, y, self.ui.GREEN, self.ui.font_textbox_semibold)
         x += self.ui.font_textbox_semibold.size(text1)[0]
@@ -1854,17 +1886,7 @@ class UIDrawing:
 
     def get_virtual_rank(self):
         """Calculate virtual rank if player banks now"""
-        current_player = self.ui.game_state.current_player
-        virtual_score = self.ui.game_state.referee.calculate_total_score()
-        
-        all_scores = [player.get_total_score() for player in self.ui.game_state.players]
-        all_scores[self.ui.game_state.players.index(current_player)] = virtual_score
-        
-        sorted_scores = sorted(all_scores, reverse=True)
-        
-        rank = sorted_scores.index(virtual_score) + 1
-        
-        return rank
+        return UIHelpers.get_virtual_rank(self.ui.game_state, self.ui.game_state.current_player)
 
 
 
@@ -2357,10 +2379,10 @@ class UIDrawing:
     def draw_dice(self):
         """Draw dice in the snaptray"""
         if self.ui.game_state.dice_values:
-            stashable_dice = self.ui.game_state.referee.get_stashable_dice(self.ui.game_state.dice_values)
+            stashable_dice = self.ui.game_state.referee.get_stashable_dice(self.ui.game_state.dice_hand)
             formatted_dice = [f"{'green' if i in stashable_dice else 'white'}_{value}" for i, value in enumerate(self.ui.game_state.dice_values)]
             # Get hovered dice but don't pass to renderer to avoid green outline effect
-            hovered_dice, hovered_combination = UIHelpers.get_hovered_combination(pygame.mouse.get_pos(), self.ui.dice_rects, self.ui.game_state.dice_values)
+            hovered_dice, hovered_combination = UIHelpers.get_hovered_combination(pygame.mouse.get_pos(), self.ui.dice_rects, self.ui.game_state.dice_hand)
             
             if len(self.ui.game_board.dice_positions) != len(self.ui.game_state.dice_values):
                 self.ui.game_board.generate_dice_positions(len(self.ui.game_state.dice_values))
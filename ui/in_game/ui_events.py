@@ -140,12 +140,23 @@ class UIEvents:
             if end_game_rect.collidepoint(pos):
                 return
         
+        # The board is the bot's while it plays its turn
+        if self.ui.bot_ui.bot_turn_in_progress:
+            return
+        
         # REMOVED: Color buttons
         # for color, button in self.ui.color_buttons.items():
         #     if button.is_clicked(pos):
         #         self.ui.change_snaptray_color(color)
         #         return
 
+        # RT STATS title bar toggles the EV advisor
+        rt_stats_rect = self.ui.sections["RT_STATS"]
+        if pygame.Rect(rt_stats_rect.x, rt_stats_rect.y, 160, 20).collidepoint(pos):
+            self.ui.advisor_enabled = not self.ui.advisor_enabled
+            print(f"ADVISOR {'ON' if self.ui.advisor_enabled else 'OFF'}")
+            return
+
         # BANK button (overlapping button from X:20 to X:540)
         bank_button_rect = pygame.Rect(20, 560, 520, 80)
         if bank_button_rect.collidepoint(pos):
@@ -184,7 +195,7 @@ class UIEvents:
         if self.ui.stash_state == StashState.BASE:
             plank_rect = pygame.Rect(20, 680, 440, 110)
             if plank_rect.collidepoint(pos):
-                stashable_dice = self.ui.game_state.referee.get_stashable_dice(self.ui.game_state.dice_values)
+                stashable_dice = self.ui.game_state.referee.get_stashable_dice(self.ui.game_state.dice_hand)
                 if stashable_dice:
                     print("Stash plank clicked - stashing ALL green dice")
                     self.ui.game_state.selected_dice = stashable_dice.copy()
@@ -243,9 +254,8 @@ class UIEvents:
         turn_number = self.ui.game_state.current_player.turn_count + 1
         self.ui.game_state.message_manager.add_gref_turn_start(player_name, turn_number)
         
-        # Roll dice
+        # Roll dice (UIObserver animates the roll)
         self.ui.game_state.roll_dice()
-        self.ui.animate_dice_roll()
         self.ui.draw()
         pygame.display.flip()
         if self.ui.game_state.current_player.is_bot():
@@ -279,14 +289,13 @@ class UIEvents:
                 print(f"Double-click detected on dice {clicked_dice} - instant stashing!")
                 
                 # FIXED: Use self.get_dice_collection instead of self.ui.get_dice_collection
-                dice_collection = UIHelpers.get_dice_collection(self.ui.game_state.dice_values, clicked_dice)
+                dice_collection = UIHelpers.get_dice_collection(self.ui.game_state.dice_hand, clicked_dice)
                 
                 # Check if these dice can be stashed
-                stashable_dice = self.ui.game_state.referee.get_stashable_dice(self.ui.game_state.dice_values)
+                stashable_dice = self.ui.game_state.referee.get_stashable_dice(self.ui.game_state.dice_hand)
                 if all(die_idx in stashable_dice for die_idx in dice_collection):
                     # Select the dice
-                    self.ui.game_state.selected_dice = dice_collection.copy()
-                    self.ui.game_state.update_selection_state()
+                    self.ui.game_state.set_selected_dice(dice_collection)
                     
                     # Immediately stash them
                     self.ui.game_state.referee.perform_action("STASH")
@@ -301,21 +310,22 @@ class UIEvents:
             else:
                 # SINGLE CLICK: Normal selection/deselection behavior
                 # FIXED: Use self.get_dice_collection instead of self.ui.get_dice_collection
-                dice_collection = UIHelpers.get_dice_collection(self.ui.game_state.dice_values, clicked_dice)
+                dice_collection = UIHelpers.get_dice_collection(self.ui.game_state.dice_hand, clicked_dice)
                 
                 if self.ui.game_state.referee.can_select_dice(clicked_dice):
-                    if set(dice_collection).issubset(set(self.ui.game_state.selected_dice)):
+                    selected_dice = list(self.ui.game_state.selected_dice)
+                    if set(dice_collection).issubset(set(selected_dice)):
                         # Deselect
                         for die in dice_collection:
-                            if die in self.ui.game_state.selected_dice:
-                                self.ui.game_state.selected_dice.remove(die)
+                            if die in selected_dice:
+                                selected_dice.remove(die)
                     else:
                         # Select
                         for die in dice_collection:
-                            if die not in self.ui.game_state.selected_dice:
-                                self.ui.game_state.selected_dice.append(die)
+                            if die not in selected_dice:
+                                selected_dice.append(die)
                     
-                    self.ui.game_state.update_selection_state()
+                    self.ui.game_state.set_selected_dice(selected_dice)
                     print(f"Selected dice: {self.ui.game_state.selected_dice}")
                 
                 # Update double-click tracking
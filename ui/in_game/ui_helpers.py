@@ -6,6 +6,7 @@ Provides formatting, calculation, and helper methods used throughout the UI.
 
 import pygame
 from typing import List, Tuple, Optional
+from games.livedice_f.livedice_f_dice_hand import DiceHand
 
 
 class UIHelpers:
@@ -125,13 +126,10 @@ class UIHelpers:
         """
         virtual_score = game_state.referee.calculate_total_score()
         
-        all_scores = [player.get_total_score() for player in game_state.players]
-        all_scores[game_state.players.index(current_player)] = virtual_score
-        
-        sorted_scores = sorted(all_scores, reverse=True)
-        rank = sorted_scores.index(virtual_score) + 1
-        
-        return rank
+        # Totals are kept running on each Player, so one pass over the
+        # players counting those ahead gives the rank without sorting
+        return 1 + sum(1 for player in game_state.players
+                       if player is not current_player and player.get_total_score() > virtual_score)
     
     @staticmethod
     def get_dice_collection(dice_values: List[int], dice_index: int) -> List[int]:
@@ -141,7 +139,7 @@ class UIHelpers:
         Groups triples and double-sixes.
         
         Args:
-            dice_values: List of current dice values
+            dice_values: List of current dice values (or a DiceHand)
             dice_index: Index of clicked die
             
         Returns:
@@ -151,7 +149,7 @@ class UIHelpers:
             return []
         
         dice_value = dice_values[dice_index]
-        collection = [i for i, v in enumerate(dice_values) if v == dice_value]
+        collection = list(DiceHand.of(dice_values).indices_of(dice_value))
         
         # Triple takes priority
         if len(collection) >= 3:
@@ -0,0 +1,46 @@
+"""
+UI OBSERVER MODULE
+Connects the UI-free game engine to the LIVEDICE game UI.
+Animates rolls, moves stashed dice and follows the log when the engine reports them,
+and autosaves the game after every turn (resume with: python main.py --resume).
+"""
+
+from typing import List
+
+from core.game_state.game_observer import GameObserver
+from core.game_state.game_snapshot import discard_snapshot, save_snapshot
+
+
+class UIObserver(GameObserver):
+    """Presents engine events on the game board"""
+
+    def __init__(self, ui_instance):
+        """
+        Initialize observer with reference to main UI instance.
+
+        Args:
+            ui_instance: Reference to InGameUI instance
+        """
+        self.ui = ui_instance
+
+    def on_dice_rolled(self, game_state, dice_values: List[int]):
+        # Bot turns play their own, slower roll animation (see UIBot)
+        if not self.ui.bot_ui.bot_turn_in_progress:
+            self.ui.animate_dice_roll()
+
+    def on_dice_stashed(self, game_state, dice_indices: List[int], stashed_dice: List[int], points: int):
+        self.ui.game_board.update_dice_positions(dice_indices)
+        if self.ui.use_start_turn_button:
+            self.ui.use_start_turn_button = False
+
+    def on_log_updated(self, game_state):
+        self.ui.scroll_log_to_bottom()
+
+    def on_turn_ended(self, game_state):
+        try:
+            if game_state.referee.is_game_over():
+                discard_snapshot()
+            else:
+                save_snapshot(game_state.snapshot())
+        except OSError as error:
+            print(f"AUTOSAVE FAILED: {error}")